@@ -11,6 +11,56 @@ load_dotenv()
 # === DART API 설정 ===
 DART_API_KEY = os.getenv("DART_API_KEY")
 
+# === 기업 리스트 스냅샷 설정 ===
+# dart.get_corp_list()는 CORPCODE 아카이브 전체를 다운로드하므로 로컬 스냅샷을 공유
+CORP_SNAPSHOT_CONFIG = {
+    "enabled": True,            # False면 매번 dart.get_corp_list() 호출
+    "path": os.getenv(
+        "CORP_SNAPSHOT_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache", "corp_list.snap")
+    ),
+    "ttl_hours": 24,            # 스냅샷 유효 시간 (만료 시 자동 갱신)
+    "lock_timeout_sec": 300     # 다른 워커의 갱신 대기 최대 시간 (초)
+}
+
+# === 페이지 캐시 설정 ===
+# 보고서 페이지 원본 HTML을 로컬에 압축 보관 (파서/청킹 설정 변경 후 재처리 시 재다운로드 방지)
+PAGE_CACHE_CONFIG = {
+    "enabled": True,            # False면 매번 DART에서 페이지 다운로드
+    "path": os.getenv(
+        "PAGE_CACHE_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache", "pages")
+    ),
+    "max_size_mb": 4096,        # 최대 용량 (초과 시 오래 사용하지 않은 보고서부터 제거)
+    "compress_level": 6         # zlib 압축 레벨 (1: 빠름 ~ 9: 작음)
+}
+
+# === 페이지 다운로드 설정 ===
+PAGE_FETCH_CONFIG = {
+    "prefetch_workers": 8,      # 보고서당 페이지 HTML 동시 다운로드 스레드 수 (호출량은 RATE_LIMIT_CONFIG로 제한)
+    "stream_window": 32         # 한 번에 받아 파싱하는 페이지 수 (스트리밍 시 메모리에 유지되는 최대 페이지 분량)
+}
+
+# === HTML 파서 설정 ===
+# BeautifulSoup 트리 빌더: "lxml"(C 구현, 빠름), "html.parser"(순수 Python), "html5lib"
+# 설치되지 않은 파서를 지정하면 html.parser로 대체
+PARSER_CONFIG = {
+    "html_parser": os.getenv("HTML_PARSER", "lxml"),
+    # 페이지 파싱 프로세스 수 (CPU 바운드 파싱을 다운로드와 분리, 1 이하면 현재 프로세스에서 파싱)
+    "parse_workers": int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+}
+
+# === DART 클라이언트 설정 ===
+# backend: "dart_fss"(기본, 동기) 또는 "async"(httpx asyncio 클라이언트, 수십 개 요청 동시 처리)
+DART_CLIENT_CONFIG = {
+    "backend": os.getenv("DART_BACKEND", "dart_fss"),
+    "opendart_url": "https://opendart.fss.or.kr/api",   # 공시 검색 / 기업 고유번호
+    "dart_url": "https://dart.fss.or.kr",               # 보고서 목차 / 페이지
+    "max_connections": 32,      # keep-alive 연결 풀 크기 (동시 요청 수 상한)
+    "timeout_sec": 60,          # 요청 타임아웃 (초)
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
+
 # === Database 설정 ===
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "localhost"),
@@ -20,16 +70,42 @@ DB_CONFIG = {
     "port": os.getenv("DB_PORT", "5432")
 }
 
+# === DB 커넥션 풀 설정 ===
+# DBManager는 with 구문마다 프로세스 공용 풀에서 연결을 대여/반납 (연결 수립 비용 제거, 동시 연결 수 제한)
+DB_POOL_CONFIG = {
+    "max_connections": int(os.getenv("DB_POOL_SIZE", 8)),  # 프로세스당 최대 연결 수 (초과 대여는 반납 시까지 대기)
+    "checkout_timeout_sec": 30,     # 연결 대여 대기 최대 시간 (초)
+    "health_check_idle_sec": 30     # 이 시간 이상 유휴였던 연결은 대여 전 SELECT 1로 확인 (초)
+}
+
+# === DB 적재 설정 ===
+DB_WRITE_CONFIG = {
+    "insert_page_size": 1000    # 다중 행 INSERT 한 문장당 행 수 (보고서 블록은 한 트랜잭션으로 적재)
+}
+
 # === 배치 처리 설정 ===
-# DART API: 분당 1,000회 제한 -> 안전하게 분당 900회로 설정
+# 호출 간격은 RATE_LIMIT_CONFIG의 토큰 버킷이 제어 (고정 대기 없음)
 BATCH_CONFIG = {
     "batch_size": 50,           # 배치당 처리할 기업 수
-    "batch_delay_sec": 3,       # 배치 간 대기 시간 (초)
-    "request_delay_sec": 0.1,   # 개별 요청 간 대기 시간 (초)
     "max_retries": 3,           # 실패 시 재시도 횟수
     "retry_delay_sec": 5        # 재시도 전 대기 시간 (초)
 }
 
+# === Rate Limit 설정 ===
+# DART: 분당 1,000회 초과 시 IP 차단 -> 모든 DART 요청(검색/기업 리스트/보고서 페이지)이 공유하는 토큰 버킷
+RATE_LIMIT_CONFIG = {
+    "requests_per_minute": 1000,        # 임의의 1분 구간 최대 호출 수 (버스트 포함)
+    "burst": 10,                        # 순간 최대 호출 수 (버킷 크기)
+    "retry_status_codes": (429, 503),   # 한도 초과로 간주할 HTTP 상태 코드 (JSON status "020"도 포함)
+    "max_retries": 5,                   # 한도 초과 응답 시 요청별 재시도 횟수
+    "backoff_sec": 10,                  # 한도 초과 시 호출 중단 시간 (Retry-After 헤더 우선)
+    "recovery_sec": 60,                 # 한도 초과 후 낮춘 호출 속도가 원래대로 회복되는 시간
+    "shared_state_path": os.getenv(     # 같은 호스트의 프로세스 간 공유 상태 파일 (None이면 프로세스 단위)
+        "DART_RATE_LIMIT_STATE",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache", "dart_rate_limit.state")
+    )
+}
+
 # === 사업보고서 섹션 설정 ===
 # 핵심 섹션 (DART API에서 반환되는 실제 섹션명으로 업데이트 필요)
 TARGET_SECTIONS = [
@@ -40,9 +116,12 @@ TARGET_SECTIONS = [
 
 # === 청킹 설정 ===
 CHUNK_CONFIG = {
+    "mode": os.getenv("CHUNK_MODE", "chars"),  # "chars": 문자 수 기준, "tokens": 임베딩 토크나이저 토큰 수 기준
     "max_chunk_size": 2000,     # 청크 최대 문자 수
     "overlap": 200,             # 청크 간 오버랩 문자 수
-    "min_chunk_size": 100       # 최소 청크 크기 (이보다 작으면 이전 청크에 병합)
+    "min_chunk_size": 100,      # 최소 청크 크기 (이보다 작으면 이전 청크에 병합)
+    "max_tokens": None,         # 청크 최대 토큰 수 (None: 임베딩 max_length - 특수 토큰 - 섹션 경로 접두어)
+    "token_overlap": 32         # 청크 간 오버랩 토큰 수
 }
 
 # === 임베딩 설정 ===
@@ -53,12 +132,34 @@ EMBEDDING_CONFIG = {
     "max_length": 512                    # 최대 토큰 길이
 }
 
+# === 벡터 인덱스 설정 (pgvector) ===
+# Source_Materials.embedding 유사도 검색 인덱스 (CREATE INDEX CONCURRENTLY로 생성, 대량 임베딩 후에 생성)
+VECTOR_INDEX_CONFIG = {
+    "name": "idx_source_materials_embedding",
+    "method": os.getenv("VECTOR_INDEX_METHOD", "hnsw"),  # "hnsw" 또는 "ivfflat"
+    "metric": "cosine",                 # "cosine", "l2", "ip" (임베딩은 L2 정규화됨)
+    "hnsw_m": 16,                       # HNSW 노드당 연결 수 (클수록 재현율/크기 증가)
+    "hnsw_ef_construction": 64,         # HNSW 빌드 후보 수 (클수록 재현율/빌드 시간 증가)
+    "ivfflat_lists": None,              # IVFFlat 리스트 수 (None: 행 수/1000, 100만 행 초과 시 sqrt(행 수))
+    "maintenance_work_mem": "1GB",      # 인덱스 빌드 세션 메모리 (그래프가 메모리에 들어가야 빌드가 빠름)
+    "auto_build": True,                 # 임베딩 워커 종료 후 인덱스가 없으면 생성
+    "defer_threshold": 50000,           # 처리 대상이 이 수 이상이면 임베딩 전에 인덱스를 제거하고 종료 후 재생성
+    "swap_lock_timeout_ms": 2000,       # 재생성 인덱스 교체(DROP/RENAME) 잠금 대기 상한 (긴 검색 뒤에서 다른 쿼리를 막지 않도록)
+    "swap_retries": 5,                  # 잠금 대기 초과 시 교체 재시도 횟수
+    # 검색 (DBManager.search_similar)
+    "ef_search": 100,                   # HNSW 검색 후보 수 (k보다 작으면 k 사용)
+    "ivfflat_probes": 10,               # IVFFlat 검색 리스트 수
+    "iterative_scan": "relaxed_order"   # 필터로 결과가 부족하면 인덱스를 이어서 탐색 (pgvector 0.8+, "off"로 끄기)
+}
+
 # === 보고서 검색 설정 ===
 REPORT_SEARCH_CONFIG = {
     "bgn_de": "20240101",       # 검색 시작일 (YYYYMMDD)
     "pblntf_detail_ty": "a001", # 사업보고서 유형 코드
     "page_count": 100,          # 한 페이지당 최대 건수 (기본값 10, 최대 100)
-    "page_delay_sec": 0.5,      # 페이지 간 API 호출 대기 (Rate Limiting)
+    "search_workers": 4,        # 페이지 동시 조회 스레드 수 (호출량은 RATE_LIMIT_CONFIG로 제한)
+    "page_max_retries": 3,      # 페이지별 재시도 횟수
+    "page_retry_delay_sec": 1,  # 페이지 재시도 대기 (초, 재시도마다 배수 증가)
     "max_search_days": 90       # corp_code 없을 때 최대 검색 기간 (일) - 3개월
 }
 
@@ -7,6 +7,7 @@ DART 사업보고서 데이터 수집 및 DB 적재 파이프라인 실행
     python main.py --all           # 전체 상장 기업
     python main.py --explore       # 보고서 구조 탐색
     python main.py --stats         # DB 통계 조회
+    python main.py --offline       # 페이지 캐시로 오프라인 재처리
 """
 import argparse
 import sys
@@ -17,15 +18,15 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 
-def run_test_mode():
+def run_test_mode(refresh_corps: bool = False):
     """테스트 모드: 삼성전자, SK하이닉스, NAVER 3개 기업"""
     from src.core.pipeline import DataPipeline
 
-    pipeline = DataPipeline()
+    pipeline = DataPipeline(refresh_corps=refresh_corps)
     pipeline.run_test()
 
 
-def run_all_mode(reset_db: bool = False):
+def run_all_mode(reset_db: bool = False, refresh_corps: bool = False):
     """전체 모드: 모든 상장 기업 처리"""
     from src.core.pipeline import DataPipeline
 
@@ -35,20 +36,30 @@ def run_all_mode(reset_db: bool = False):
             print("취소되었습니다.")
             return
 
-    pipeline = DataPipeline()
+    pipeline = DataPipeline(refresh_corps=refresh_corps)
     pipeline.run_all(reset_db=reset_db)
 
 
-def run_efficient_mode(reset_db: bool = False, limit: int = None, bgn_de: str = None, end_de: str = None):
+def run_efficient_mode(reset_db: bool = False, limit: int = None, bgn_de: str = None, end_de: str = None,
+                       refresh_corps: bool = False, force: bool = False):
     """
     효율 모드: 사업보고서가 있는 기업만 처리 (dart.filings.search 사용)
 
     기존 방식보다 훨씬 빠름 - 전체 상장사 순회 대신 사업보고서 일괄 검색
+    이미 적재된 보고서는 수집 전에 제외 (force=True면 다시 처리)
     """
     from src.core.pipeline import DataPipeline
 
-    pipeline = DataPipeline()
-    pipeline.run_efficient(bgn_de=bgn_de, end_de=end_de, reset_db=reset_db, limit=limit)
+    pipeline = DataPipeline(refresh_corps=refresh_corps)
+    pipeline.run_efficient(bgn_de=bgn_de, end_de=end_de, reset_db=reset_db, limit=limit, force=force)
+
+
+def run_offline_mode(reset_db: bool = False, limit: int = None):
+    """오프라인 모드: 페이지 캐시에 저장된 보고서를 DART 접속 없이 재처리"""
+    from src.core.pipeline import DataPipeline
+
+    pipeline = DataPipeline(offline=True)
+    pipeline.run_offline(reset_db=reset_db, limit=limit)
 
 
 def run_explore_mode():
@@ -95,11 +106,11 @@ def run_embed_mode(report_id: int = None, batch_size: int = 32, limit: int = Non
         pipeline.run(batch_size=batch_size, limit=limit)
 
 
-def run_custom_mode(stock_codes: list, reset_db: bool = False):
+def run_custom_mode(stock_codes: list, reset_db: bool = False, refresh_corps: bool = False):
     """커스텀 모드: 특정 종목코드 리스트 처리"""
     from src.core.pipeline import DataPipeline
 
-    pipeline = DataPipeline()
+    pipeline = DataPipeline(refresh_corps=refresh_corps)
     pipeline.run(stock_codes=stock_codes, reset_db=reset_db)
 
 
@@ -115,6 +126,9 @@ def main():
     python main.py --efficient               # 효율 모드 (사업보고서 있는 기업만)
     python main.py --efficient --bgn 20250101 --end 20250331  # 기간 지정
     python main.py --codes 005930 000660     # 특정 종목코드만 처리
+    python main.py --efficient --refresh-corps  # 기업 리스트 스냅샷 강제 갱신
+    python main.py --efficient --force       # 이미 적재된 보고서도 다시 처리
+    python main.py --offline --reset         # 페이지 캐시만으로 DB 재적재 (네트워크 미사용)
     python main.py --embed                   # 전체 임베딩 생성
     python main.py --embed --report-id 1     # 특정 리포트 임베딩
     python main.py --explore                 # 보고서 구조 탐색
@@ -132,6 +146,8 @@ def main():
                             help='효율 모드 (사업보고서가 있는 기업만 일괄 검색)')
     mode_group.add_argument('--codes', nargs='+', metavar='CODE',
                             help='특정 종목코드 처리 (공백으로 구분)')
+    mode_group.add_argument('--offline', action='store_true',
+                            help='오프라인 모드 (페이지 캐시에 저장된 보고서 재처리)')
     mode_group.add_argument('--embed', action='store_true',
                             help='임베딩 생성')
     mode_group.add_argument('--explore', action='store_true',
@@ -152,28 +168,36 @@ def main():
                         help='검색 시작일 (--efficient와 함께 사용)')
     parser.add_argument('--end', type=str, metavar='YYYYMMDD',
                         help='검색 종료일 (--efficient와 함께 사용)')
+    parser.add_argument('--refresh-corps', action='store_true',
+                        help='기업 리스트 스냅샷 강제 갱신 (TTL 무시)')
+    parser.add_argument('--force', action='store_true',
+                        help='이미 적재된 보고서도 다시 처리 (--efficient와 함께 사용)')
 
     args = parser.parse_args()
 
     try:
         if args.test:
-            run_test_mode()
+            run_test_mode(refresh_corps=args.refresh_corps)
         elif args.all:
             if args.limit:
                 from src.core.pipeline import DataPipeline
-                pipeline = DataPipeline()
+                pipeline = DataPipeline(refresh_corps=args.refresh_corps)
                 pipeline.run(stock_codes=None, limit=args.limit, reset_db=args.reset)
             else:
-                run_all_mode(reset_db=args.reset)
+                run_all_mode(reset_db=args.reset, refresh_corps=args.refresh_corps)
         elif args.efficient:
             run_efficient_mode(
                 reset_db=args.reset,
                 limit=args.limit,
                 bgn_de=args.bgn,
-                end_de=args.end
+                end_de=args.end,
+                refresh_corps=args.refresh_corps,
+                force=args.force
             )
         elif args.codes:
-            run_custom_mode(args.codes, reset_db=args.reset)
+            run_custom_mode(args.codes, reset_db=args.reset, refresh_corps=args.refresh_corps)
+        elif args.offline:
+            run_offline_mode(reset_db=args.reset, limit=args.limit)
         elif args.embed:
             run_embed_mode(
                 report_id=args.report_id,
@@ -0,0 +1,97 @@
+"""
+텍스트 청킹 벤치마크 스크립트
+- block_parser.chunk_text와 기존 방식(윈도우 슬라이스 + rfind)의 처리 시간 비교
+- 페이지 캐시(data/cache/pages)의 보고서 페이지 텍스트를 이어 붙여 대용량 주석 섹션을 구성하고, 없으면 테스트 샘플 페이지 사용
+
+사용법:
+    python scripts/benchmark_chunking.py
+    python scripts/benchmark_chunking.py --size 5000000 --rounds 5
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import List, Callable
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import CHUNK_CONFIG
+from src.core.block_parser import chunk_text, clean_text, CHUNK_SEPARATORS
+from src.core.html_parser import make_soup
+from scripts.benchmark_html_parsers import load_pages
+
+
+def chunk_text_sliced(text: str, chunk_size: int = None, overlap: int = None) -> List[str]:
+    """기존 청킹 방식 (청크마다 윈도우를 잘라 구분자별 rfind, 비교 기준)"""
+    chunk_size = chunk_size or CHUNK_CONFIG['max_chunk_size']
+    overlap = overlap or CHUNK_CONFIG['overlap']
+    min_size = CHUNK_CONFIG['min_chunk_size']
+
+    if len(text) <= chunk_size:
+        return [text] if len(text) >= min_size else []
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        if end < len(text):
+            for sep in CHUNK_SEPARATORS:
+                last_sep = text[start:end].rfind(sep)
+                if last_sep > chunk_size // 2:
+                    end = start + last_sep + len(sep)
+                    break
+
+        chunk = text[start:end].strip()
+        if len(chunk) >= min_size:
+            chunks.append(chunk)
+        elif chunks:
+            chunks[-1] += " " + chunk
+
+        start = end - overlap
+        if start >= len(text) - min_size:
+            break
+    return chunks
+
+
+def build_section_text(size: int) -> str:
+    """벤치마크용 대용량 섹션 텍스트 (페이지 텍스트를 size자까지 반복)"""
+    text = "\n\n".join(clean_text(make_soup(html).get_text('\n')) for html in load_pages(50))
+    return (text * (size // len(text) + 1))[:size]
+
+
+def benchmark(func: Callable, text: str, rounds: int) -> float:
+    """청킹 소요 시간 (ms, 최고 기록)"""
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 청킹 벤치마크")
+    parser.add_argument('--size', type=int, default=2_000_000, help="섹션 텍스트 길이 (기본: 2,000,000자)")
+    parser.add_argument('--rounds', type=int, default=5, help="반복 횟수 (최고 기록 사용, 기본: 5)")
+    args = parser.parse_args()
+
+    text = build_section_text(args.size)
+    # 구분자가 거의 없는 텍스트 (한 줄로 이어진 표 덤프 등)
+    flat_text = text.replace('\n', ' ').replace('. ', ', ')
+
+    print("=" * 60)
+    print(f"📊 텍스트 청킹 벤치마크 ({len(text):,}자)")
+    print("=" * 60)
+
+    for label, sample in (("주석 섹션", text), ("구분자 없음", flat_text)):
+        assert chunk_text(sample) == chunk_text_sliced(sample), "청킹 결과가 기존 방식과 다름"
+        before = benchmark(chunk_text_sliced, sample, args.rounds)
+        after = benchmark(chunk_text, sample, args.rounds)
+        print(f"   {label:<8} 기존 {before:8.2f}ms → {after:8.2f}ms ({before / after:.1f}배, "
+              f"{len(chunk_text(sample))}청크)")
+
+
+if __name__ == "__main__":
+    main()
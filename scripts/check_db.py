@@ -15,11 +15,12 @@ import json
 with DBManager() as db:
     # 저장된 데이터 샘플 조회
     db.cursor.execute('''
-        SELECT id, report_id, chunk_type, section_path, sequence_order, 
-               LENGTH(raw_content) as content_len
-        FROM "Source_Materials" 
-        WHERE report_id = 1
-        ORDER BY report_id, sequence_order
+        SELECT sm.id, sm.report_id, sm.chunk_type, sp.section_path, sm.sequence_order, 
+               LENGTH(sm.raw_content) as content_len
+        FROM "Source_Materials" sm
+        LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+        WHERE sm.report_id = 1
+        ORDER BY sm.report_id, sm.sequence_order
         LIMIT 15
     ''')
     rows = db.cursor.fetchall()
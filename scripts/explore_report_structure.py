@@ -11,6 +11,10 @@ sys.path.insert(0, str(project_root))
 
 import dart_fss as dart
 from config import DART_API_KEY, REPORT_SEARCH_CONFIG
+from src.core.corp_directory import CorpDirectory
+from src.core.corp_snapshot import CorpSnapshot
+from src.core.html_parser import make_soup
+from src.core.rate_limiter import install_dart_rate_limiter
 import json
 
 
@@ -21,7 +25,8 @@ def explore_report_structure(stock_code: str = "005930"):
     Args:
         stock_code: 종목코드 (기본값: 삼성전자 005930)
     """
-    # DART API 설정
+    # DART API 설정 (파이프라인과 같은 호출 한도 공유)
+    install_dart_rate_limiter()
     dart.set_api_key(api_key=DART_API_KEY)
 
     print("=" * 60)
@@ -30,13 +35,8 @@ def explore_report_structure(stock_code: str = "005930"):
 
     # 1. 기업 리스트에서 대상 기업 찾기
     print("\n🔄 기업 리스트 로딩 중...")
-    corp_list = dart.get_corp_list()
-
-    target_corp = None
-    for corp in corp_list:
-        if corp.stock_code == stock_code:
-            target_corp = corp
-            break
+    corp_directory = CorpDirectory(CorpSnapshot().load(dart.get_corp_list))
+    target_corp = corp_directory.get_by_stock_code(stock_code)
 
     if not target_corp:
         print(f"❌ 종목코드 {stock_code}에 해당하는 기업을 찾을 수 없습니다.")
@@ -132,8 +132,7 @@ def explore_report_structure(stock_code: str = "005930"):
 
                 # 첫 페이지 일부 내용 미리보기
                 if pages:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(pages[0].html, 'html.parser')
+                    soup = make_soup(pages[0].html)
                     text = soup.get_text()[:300].strip()
                     print(f"   📄 미리보기: {text[:100]}...")
             else:
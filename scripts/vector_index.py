@@ -0,0 +1,64 @@
+"""
+벡터 인덱스 관리 스크립트
+- Source_Materials.embedding 유사도 검색 인덱스(HNSW / IVFFlat) 생성, 재생성, 제거, 상태 조회
+- 생성/제거는 CREATE/DROP INDEX CONCURRENTLY로 수행되어 적재와 검색을 막지 않음
+
+사용법:
+    python scripts/vector_index.py status
+    python scripts/vector_index.py create                       # VECTOR_INDEX_CONFIG 기준
+    python scripts/vector_index.py create --method ivfflat --lists 1000
+    python scripts/vector_index.py rebuild --m 32 --ef-construction 128
+    python scripts/vector_index.py drop
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.db_manager import DBManager
+
+
+def print_status(db: DBManager):
+    """벡터 인덱스 상태 출력"""
+    index = db.get_vector_index()
+    stats = db.get_stats()
+
+    print("=" * 60)
+    print("🧭 벡터 인덱스 상태")
+    print("=" * 60)
+    print(f"   임베딩 완료 행: {stats['embedded_materials']:,} / {stats['materials']:,}")
+    if not index:
+        print("   인덱스: 없음 (유사도 검색은 전체 스캔)")
+        return
+    print(f"   인덱스: {index['name']} ({index['method']}, {index['size']})")
+    print(f"   상태: {'유효' if index['valid'] else 'INVALID (빌드 중이거나 실패 - create로 다시 생성)'}")
+    print(f"   정의: {index['definition']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벡터 인덱스 관리 (HNSW / IVFFlat)")
+    parser.add_argument('action', choices=['status', 'create', 'rebuild', 'drop'], help="수행할 작업")
+    parser.add_argument('--method', choices=['hnsw', 'ivfflat'], help="인덱스 방식 (기본: VECTOR_INDEX_CONFIG['method'])")
+    parser.add_argument('--m', type=int, help="HNSW 노드당 연결 수")
+    parser.add_argument('--ef-construction', type=int, help="HNSW 빌드 후보 수")
+    parser.add_argument('--lists', type=int, help="IVFFlat 리스트 수 (기본: 임베딩 행 수 기준 자동)")
+    args = parser.parse_args()
+
+    options = dict(method=args.method, m=args.m, ef_construction=args.ef_construction, lists=args.lists)
+
+    with DBManager() as db:
+        if args.action == 'create':
+            db.create_vector_index(**options)
+        elif args.action == 'rebuild':
+            db.rebuild_vector_index(**options)
+        elif args.action == 'drop':
+            if not db.drop_vector_index():
+                print("ℹ️ 제거할 벡터 인덱스가 없습니다")
+        print_status(db)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,9 @@
 Core package - 핵심 비즈니스 로직 모듈
 """
 from .db_manager import DBManager
+from .corp_directory import CorpDirectory
 from .dart_agent import DartReportAgent
 from .pipeline import DataPipeline
 
-__all__ = ['DBManager', 'DartReportAgent', 'DataPipeline']
+__all__ = ['DBManager', 'CorpDirectory', 'DartReportAgent', 'DataPipeline']
 
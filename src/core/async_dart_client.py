@@ -0,0 +1,306 @@
+"""
+비동기 DART 클라이언트 모듈 - httpx 기반 asyncio 클라이언트
+파이프라인이 사용하는 엔드포인트(공시 검색, 기업 고유번호, 보고서 목차/페이지)만 구현하며
+keep-alive 연결 풀과 공용 토큰 버킷을 사용해 한 스레드에서 수십 개 요청을 동시에 처리
+"""
+import io
+import re
+import asyncio
+import threading
+import zipfile
+import concurrent.futures
+import xml.etree.ElementTree as ET
+from typing import Optional, List, Dict, Coroutine
+import httpx
+from config import DART_API_KEY, DART_CLIENT_CONFIG, RATE_LIMIT_CONFIG
+from .rate_limiter import TokenBucket, get_dart_rate_limiter, rate_limit_signal
+
+
+class DartApiError(RuntimeError):
+    """OpenDART API 오류 응답 (status가 000/013이 아닌 경우)"""
+
+    def __init__(self, status: str, message: str):
+        super().__init__(f"[{status}] {message}")
+        self.status = status
+        self.message = message
+
+
+# 보고서 목차(main.do)의 페이지 노드 (dart_fss Report.extract_pages와 동일한 규칙)
+_PAGE_NODE_PATTERNS = {
+    name: re.compile(r"node.*\'" + key + r"\'.*\"(.+)\"")
+    for name, key in [
+        ('title', 'text'), ('rcp_no', 'rcpNo'), ('dcm_no', 'dcmNo'), ('ele_id', 'eleId'),
+        ('offset', 'offset'), ('length', 'length'), ('dtd', 'dtd')
+    ]
+}
+
+
+def parse_report_pages(html: str) -> List[Dict]:
+    """
+    보고서 목차 HTML에서 페이지 정보 추출
+
+    Returns:
+        List[Dict]: Page.to_dict(summary=False)와 같은 형식의 페이지 정보 리스트
+    """
+    columns = {name: pattern.findall(html) for name, pattern in _PAGE_NODE_PATTERNS.items()}
+    pages = []
+    for values in zip(*columns.values()):
+        spec = dict(zip(columns.keys(), values))
+        spec['ele_id'] = int(spec['ele_id'])
+        pages.append(spec)
+    return pages
+
+
+def _decode_html(content: bytes) -> str:
+    """DART 페이지 인코딩 처리 (UTF-8 우선, 실패 시 CP949)"""
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return content.decode('cp949')
+
+
+class AsyncDartClient:
+    """
+    asyncio 기반 DART 클라이언트
+
+    모든 요청은 공용 토큰 버킷(기본: get_dart_rate_limiter())을 거치며,
+    한도 초과 응답(HTTP 429/503, status 020)은 버킷을 멈추고 재시도합니다.
+    httpx.AsyncClient는 첫 요청 시 현재 이벤트 루프에서 생성되므로
+    하나의 클라이언트는 하나의 이벤트 루프에서만 사용해야 합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        opendart_url: str = None,
+        dart_url: str = None,
+        max_connections: int = None,
+        limiter: Optional[TokenBucket] = None
+    ):
+        """
+        Args:
+            api_key: OpenDART API 키 (기본: config의 DART_API_KEY)
+            opendart_url: OpenDART API 주소 (테스트 시 로컬 서버 주소)
+            dart_url: DART 전자공시 주소 (보고서 목차/페이지)
+            max_connections: 최대 동시 연결 수
+            limiter: 토큰 버킷 (기본: 공용 DART 토큰 버킷)
+        """
+        self.api_key = api_key or DART_API_KEY
+        self.opendart_url = (opendart_url or DART_CLIENT_CONFIG['opendart_url']).rstrip('/')
+        self.dart_url = (dart_url or DART_CLIENT_CONFIG['dart_url']).rstrip('/')
+        self.max_connections = max_connections or DART_CLIENT_CONFIG.get('max_connections', 32)
+        self.limiter = limiter or get_dart_rate_limiter()
+        self.max_retries = RATE_LIMIT_CONFIG.get('max_retries', 5)
+        self._session: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> 'AsyncDartClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """keep-alive 연결 풀 (최초 요청 시 생성)"""
+        if self._session is None:
+            self._session = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=DART_CLIENT_CONFIG.get('timeout_sec', 60),
+                headers={'User-Agent': DART_CLIENT_CONFIG.get('user_agent', 'Mozilla/5.0')}
+            )
+        return self._session
+
+    async def aclose(self):
+        """연결 풀 종료"""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    # ==================== 공통 요청 ====================
+
+    async def _acquire(self):
+        """토큰 획득 (이벤트 루프를 막지 않고 대기)"""
+        while True:
+            wait = self.limiter.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _get(self, url: str, params: Dict = None, referer: str = None) -> httpx.Response:
+        """
+        GET 요청 (토큰 버킷 + 한도 초과/네트워크 오류 재시도)
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 네트워크 오류
+        """
+        headers = {'Referer': referer} if referer else None
+        session = self._get_session()
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire()
+            try:
+                resp = await session.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                print(f"⚠️ DART 요청 오류 - 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                await asyncio.sleep(attempt + 1)
+                continue
+
+            limited, retry_after = rate_limit_signal(resp)
+            if not limited or attempt == self.max_retries:
+                return resp
+            pause = self.limiter.penalize(retry_after)
+            print(f"⚠️ DART 호출 한도 초과 응답 - {pause:.1f}초 대기 후 재시도 ({attempt + 1}/{self.max_retries})")
+
+        return resp
+
+    # ==================== 공시 검색 ====================
+
+    async def search_filings(
+        self,
+        bgn_de: str,
+        end_de: str,
+        corp_code: str = None,
+        pblntf_detail_ty: str = None,
+        page_no: int = 1,
+        page_count: int = 100
+    ) -> Dict:
+        """
+        공시 검색 (OpenDART list.json) 단일 페이지
+
+        Returns:
+            Dict: list.json 응답 (결과 없음(013)은 빈 list)
+
+        Raises:
+            DartApiError: 오류 응답
+        """
+        params = {
+            'crtfc_key': self.api_key,
+            'bgn_de': bgn_de,
+            'end_de': end_de,
+            'page_no': page_no,
+            'page_count': page_count
+        }
+        if corp_code:
+            params['corp_code'] = corp_code
+        if pblntf_detail_ty:
+            params['pblntf_detail_ty'] = pblntf_detail_ty.upper()
+
+        resp = await self._get(f"{self.opendart_url}/list.json", params=params)
+        resp.raise_for_status()
+        data = resp.json()
+
+        status = data.get('status')
+        if status == '013':
+            # 검색 결과 없음
+            return {'status': status, 'page_no': page_no, 'total_page': 1, 'total_count': 0, 'list': []}
+        if status != '000':
+            raise DartApiError(status, data.get('message', ''))
+        return data
+
+    async def search_all_filings(self, bgn_de: str, end_de: str, **kwargs) -> List[Dict]:
+        """
+        공시 검색 전체 페이지 (첫 페이지로 전체 페이지 수 확인 후 나머지 동시 조회)
+
+        Returns:
+            List[Dict]: 검색 결과 행 리스트 (페이지 순)
+        """
+        first = await self.search_filings(bgn_de, end_de, page_no=1, **kwargs)
+        rest = await asyncio.gather(*(
+            self.search_filings(bgn_de, end_de, page_no=page_no, **kwargs)
+            for page_no in range(2, (first.get('total_page') or 1) + 1)
+        ))
+        return [row for page in (first, *rest) for row in page.get('list', [])]
+
+    # ==================== 기업 고유번호 ====================
+
+    async def get_corp_codes(self) -> List[Dict]:
+        """
+        전체 기업 고유번호 목록 (OpenDART corpCode.xml)
+
+        Returns:
+            List[Dict]: corp_code, corp_name, stock_code, modify_date 딕셔너리 리스트
+        """
+        resp = await self._get(f"{self.opendart_url}/corpCode.xml", params={'crtfc_key': self.api_key})
+        resp.raise_for_status()
+
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as archive:
+            root = ET.fromstring(archive.read(archive.namelist()[0]))
+
+        corps = []
+        for node in root.iter('list'):
+            corps.append({
+                'corp_code': (node.findtext('corp_code') or '').strip() or None,
+                'corp_name': (node.findtext('corp_name') or '').strip() or None,
+                'stock_code': (node.findtext('stock_code') or '').strip() or None,
+                'modify_date': (node.findtext('modify_date') or '').strip() or None
+            })
+        return corps
+
+    # ==================== 보고서 목차 / 페이지 ====================
+
+    async def get_report_pages(self, rcept_no: str) -> List[Dict]:
+        """
+        보고서 목차 조회 (DART main.do)
+
+        Returns:
+            List[Dict]: 페이지 정보 리스트 (title, rcp_no, dcm_no, ele_id, offset, length, dtd)
+        """
+        resp = await self._get(
+            f"{self.dart_url}/dsaf001/main.do",
+            params={'rcpNo': rcept_no},
+            referer=self.dart_url
+        )
+        resp.raise_for_status()
+        return parse_report_pages(resp.text)
+
+    async def get_page_html(self, spec: Dict) -> str:
+        """
+        보고서 페이지 HTML 조회 (DART viewer.do)
+
+        Args:
+            spec: get_report_pages()가 반환한 페이지 정보
+        """
+        url = f"{self.dart_url}/report/viewer.do"
+        resp = await self._get(url, params={
+            'rcpNo': spec['rcp_no'],
+            'dcmNo': spec['dcm_no'],
+            'eleId': spec['ele_id'],
+            'offset': spec['offset'],
+            'length': spec['length'],
+            'dtd': spec['dtd']
+        }, referer=url)
+        resp.raise_for_status()
+        return _decode_html(resp.content)
+
+
+class BackgroundLoop:
+    """
+    전용 스레드에서 도는 asyncio 이벤트 루프
+
+    동기 코드(DartReportAgent)에서 코루틴을 제출하고 concurrent.futures.Future로 결과를 받습니다.
+    루프가 계속 유지되므로 AsyncDartClient의 연결 풀도 보고서 간에 재사용됩니다.
+    """
+
+    def __init__(self, name: str = "dart-async"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """코루틴 제출 (즉시 반환)"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine):
+        """코루틴 실행 후 결과 반환 (완료까지 대기)"""
+        return self.submit(coro).result()
+
+    def close(self):
+        """이벤트 루프 종료"""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
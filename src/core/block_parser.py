@@ -0,0 +1,389 @@
+"""
+블록 파서 모듈 - 보고서 페이지 HTML을 순차적 블록(text/table)으로 변환
+DartReportAgent 상태에 의존하지 않는 모듈 함수로 구성되어 ProcessPoolExecutor 워커에서 그대로 실행 가능
+"""
+import re
+import sys
+from typing import Optional, List, Dict, Tuple, Union, Iterator
+from bs4 import NavigableString, Tag
+from config import CHUNK_CONFIG
+from .html_parser import make_soup
+from .html_table import has_text, expand_table, table_to_markdown, table_cells, find_unit, TableCell
+from .token_chunker import CHUNK_SEPARATORS, token_mode, count_tokens, chunk_budget, chunk_text_by_tokens
+
+# 워커가 반환하는 블록 레코드 필드 순서 (sequence_order는 레코드 순서로 복원)
+BLOCK_FIELDS = ("chunk_type", "section_path", "content", "table_metadata", "token_count", "table_cells")
+
+HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+TEXT_TAGS = ('p', 'li', 'span', 'td', 'th')
+CONTAINER_TAGS = ('div', 'section', 'article', 'body', 'tr', 'tbody', 'thead')
+
+# 섹션 경로 구분자 ("II. 사업의 내용 > 1. 사업의 개요")
+PATH_SEPARATOR = ' > '
+
+
+# ==================== 텍스트 ====================
+
+def clean_text(text: str) -> str:
+    """텍스트 정제"""
+    # 연속 공백/줄바꿈 정리
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r' {2,}', ' ', text)
+    text = re.sub(r'\t+', ' ', text)
+
+    # 불필요한 문자 제거
+    text = text.replace('\xa0', ' ')
+    text = text.replace('\r', '')
+
+    return text.strip()
+
+
+def chunk_text(text: str, chunk_size: int = None, overlap: int = None) -> List[str]:
+    """
+    텍스트를 청크로 분할
+
+    청크 끝은 윈도우 후반부의 마지막 경계에서 자릅니다 (문단 > 줄바꿈 > 문장 끝 순으로 우선).
+    윈도우를 잘라 복사하지 않고 원문에서 후반부 범위만 탐색하므로 텍스트 길이에 선형입니다.
+
+    Args:
+        text: 분할할 텍스트
+        chunk_size: 청크 최대 크기
+        overlap: 청크 간 오버랩
+
+    Returns:
+        List[str]: 청크 리스트
+    """
+    chunk_size = chunk_size or CHUNK_CONFIG['max_chunk_size']
+    overlap = overlap or CHUNK_CONFIG['overlap']
+    min_size = CHUNK_CONFIG['min_chunk_size']
+    length = len(text)
+
+    if length <= chunk_size:
+        return [text] if length >= min_size else []
+
+    chunks = []
+    start = 0
+
+    while start < length:
+        end = start + chunk_size
+
+        # 문장 경계에서 자르기 시도 (윈도우 절반 이후에서 시작하는 마지막 경계)
+        if end < length:
+            for sep in CHUNK_SEPARATORS:
+                last_sep = text.rfind(sep, start + chunk_size // 2 + 1, end)
+                if last_sep >= 0:
+                    end = last_sep + len(sep)
+                    break
+
+        chunk = text[start:end].strip()
+
+        if len(chunk) >= min_size:
+            chunks.append(chunk)
+        elif chunks:
+            # 너무 작으면 이전 청크에 병합
+            chunks[-1] += " " + chunk
+
+        # 오버랩이 진행 거리보다 크면 오버랩 없이 진행 (무한 루프 방지)
+        start = end - overlap if end - overlap > start else end
+
+        # 무한 루프 방지
+        if start >= length - min_size:
+            break
+
+    return chunks
+
+
+# ==================== 테이블 / 섹션 경로 ====================
+
+def convert_table_to_markdown(table_element) -> Tuple[str, Dict]:
+    """
+    HTML 테이블을 Markdown 형식으로 변환
+
+    Args:
+        table_element: BeautifulSoup table 요소
+
+    Returns:
+        Tuple[str, Dict]: (Markdown 테이블 문자열, 메타데이터)
+    """
+    try:
+        # 이미 파싱된 트리에서 바로 셀 격자 구성 (pandas 재파싱 없음)
+        if not has_text(table_element):
+            raise ValueError("텍스트가 없는 테이블")
+        return table_to_markdown(table_element)
+
+    except Exception as e:
+        # 파싱 실패 시 텍스트로 추출
+        text = table_element.get_text(separator=' ', strip=True)
+        return f"[표 데이터]\n{text}", {"error": str(e)}
+
+
+def convert_table(table_element, unit_text: Optional[str] = None) -> Tuple[str, Dict, Optional[List[TableCell]]]:
+    """
+    HTML 테이블을 Markdown + 수치 셀 레코드로 변환 (셀 격자는 한 번만 전개)
+
+    convert_table_to_markdown() 결과에 단위 표기(table_metadata['unit'])와 수치 셀을 더합니다.
+
+    Args:
+        table_element: BeautifulSoup table 요소
+        unit_text: 앞 텍스트/테이블의 단위 표기 (테이블 첫 행/캡션에 단위가 있으면 그것을 우선)
+
+    Returns:
+        Tuple[str, Dict, Optional[List[TableCell]]]: (Markdown 테이블 문자열, 메타데이터, 수치 셀 (없으면 None))
+    """
+    try:
+        # 이미 파싱된 트리에서 바로 셀 격자 구성 (pandas 재파싱 없음)
+        if not has_text(table_element):
+            raise ValueError("텍스트가 없는 테이블")
+        expanded = expand_table(table_element)
+        markdown_table, table_meta = table_to_markdown(table_element, expanded)
+
+        unit_text = table_unit(table_element) or unit_text
+        if unit_text:
+            table_meta["unit"] = unit_text
+        cells = table_cells(table_element, expanded, unit_text)
+        return markdown_table, table_meta, cells or None
+
+    except Exception as e:
+        # 파싱 실패 시 텍스트로 추출
+        text = table_element.get_text(separator=' ', strip=True)
+        return f"[표 데이터]\n{text}", {"error": str(e)}, None
+
+
+def table_unit(table_element) -> Optional[str]:
+    """테이블 캡션 / 첫 행의 단위 표기"""
+    texts = [element.get_text(' ') for element in (table_element.find('caption'), table_element.find('tr')) if element]
+    return find_unit('\n'.join(texts))
+
+
+def update_section_path(current_path: str, header_text: str, tag_name: str) -> str:
+    """
+    헤더를 만났을 때 섹션 경로 업데이트
+
+    Args:
+        current_path: 현재 경로
+        header_text: 헤더 텍스트
+        tag_name: 헤더 태그명 (h1, h2, ...)
+
+    Returns:
+        str: 업데이트된 경로
+    """
+    path_parts = split_section_path(current_path)
+    return push_section_path(path_parts, header_text, int(tag_name[1]))
+
+
+def split_section_path(section_path: Optional[str]) -> List[str]:
+    """섹션 경로를 단계별 이름 리스트로 분할"""
+    return section_path.split(PATH_SEPARATOR) if section_path else []
+
+
+def push_section_path(path_parts: List[str], header_text: str, level: int) -> str:
+    """
+    경로 스택에 헤더 추가 (h1은 루트, h2는 첫 번째 하위, ... 같은/하위 레벨은 제거)
+
+    Args:
+        path_parts: 현재 경로 스택 (제자리 수정)
+        header_text: 헤더 텍스트
+        level: 헤더 레벨 (h1=1, h2=2, ...)
+
+    Returns:
+        str: 경로 문자열 (intern되어 같은 경로의 블록이 하나의 문자열을 공유)
+    """
+    if level <= len(path_parts):
+        del path_parts[level - 1:]
+    path_parts.append(header_text)
+    return sys.intern(PATH_SEPARATOR.join(path_parts))
+
+
+# ==================== 순차적 블록 처리 ====================
+
+def iter_sequential_blocks(container, current_path: str, start_sequence: int = 0) -> Iterator[Dict]:
+    """
+    컨테이너 내의 요소들을 순차적으로 파싱해 블록을 하나씩 생성
+
+    재귀 대신 자식 이터레이터 스택으로 트리를 순회하므로 중첩 깊이에 제한이 없고,
+    블록은 만들어지는 즉시 반환되어 누적되지 않습니다.
+
+    Args:
+        container: BeautifulSoup 요소 (body 또는 div)
+        current_path: 현재 섹션 경로
+        start_sequence: 시작 시퀀스 번호
+
+    Yields:
+        Dict: 블록 {chunk_type, section_path, content, sequence_order, table_metadata, token_count, table_cells}
+    """
+    sequence = start_sequence
+    text_buffer = []  # 텍스트 누적 버퍼
+    path_parts = split_section_path(current_path)  # 섹션 경로 스택 (헤더마다 문자열 재분할 없음)
+    current_path = sys.intern(current_path) if current_path else current_path
+    unit_text = None  # 현재 섹션에서 마지막으로 나온 단위 표기 (다음 테이블에 적용)
+    stack = [iter(container.children)]
+
+    while stack:
+        element = next(stack[-1], None)
+        if element is None:
+            stack.pop()
+            continue
+
+        if isinstance(element, NavigableString):
+            text = str(element).strip()
+            if text:
+                text_buffer.append(text)
+            continue
+
+        if not isinstance(element, Tag):
+            continue
+
+        tag_name = element.name
+
+        # 1. 컨테이너 요소는 자식 순회 (스택에 추가)
+        if tag_name in CONTAINER_TAGS:
+            stack.append(iter(element.children))
+            continue
+
+        # 2. 텍스트를 포함하는 블록 요소 / 기타 태그는 텍스트 누적
+        if tag_name not in HEADER_TAGS and tag_name != 'table':
+            text = element.get_text(strip=True)
+            if text:
+                text_buffer.append(text)
+            continue
+
+        # 3. 헤더 / 테이블 앞까지 누적된 텍스트를 블록으로 저장
+        if text_buffer:
+            combined_text = '\n'.join(text_buffer)
+            unit_text = find_unit(combined_text) or unit_text
+            for chunk, token_count in text_chunks(combined_text, current_path):
+                yield _block("text", current_path, chunk, sequence, None, token_count)
+                sequence += 1
+            text_buffer.clear()
+
+        # 4. 헤더 태그 -> 경로 업데이트 (단위 표기는 섹션이 바뀌면 초기화)
+        if tag_name in HEADER_TAGS:
+            header_text = element.get_text(strip=True)
+            if header_text:
+                current_path = push_section_path(path_parts, header_text, int(tag_name[1]))
+            unit_text = None
+            continue
+
+        # 5. 테이블 -> 'table' 타입으로 저장 (단위만 있는 테이블은 다음 테이블에도 적용)
+        markdown_table, table_meta, cells = convert_table(element, unit_text)
+        unit_text = table_meta.get("unit", unit_text)
+        if markdown_table:
+            token_count = count_tokens([markdown_table])[0] if token_mode() else None
+            yield _block("table", current_path, markdown_table, sequence, table_meta, token_count, cells)
+            sequence += 1
+
+    # 남은 텍스트 버퍼 처리
+    for chunk, token_count in text_chunks('\n'.join(text_buffer), current_path):
+        yield _block("text", current_path, chunk, sequence, None, token_count)
+        sequence += 1
+
+
+def text_chunks(text: str, section_path: str) -> List[Tuple[str, Optional[int]]]:
+    """
+    누적 텍스트를 정제 후 청크로 분할 (CHUNK_CONFIG['mode'] 기준)
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: (청크, 토큰 수) 리스트 - 문자 수 기준이면 토큰 수는 None
+    """
+    combined_text = clean_text(text.strip())
+    if len(combined_text) < CHUNK_CONFIG['min_chunk_size']:
+        return []
+    if token_mode():
+        return chunk_text_by_tokens(combined_text, chunk_budget(section_path))
+    return [(chunk, None) for chunk in chunk_text(combined_text)]
+
+
+def _block(
+    chunk_type: str,
+    section_path: str,
+    content: str,
+    sequence: int,
+    table_metadata: Optional[Dict],
+    token_count: Optional[int],
+    table_cells: Optional[List[TableCell]] = None
+) -> Dict:
+    return {
+        "chunk_type": chunk_type,
+        "section_path": section_path,
+        "content": content,
+        "sequence_order": sequence,
+        "table_metadata": table_metadata,
+        "token_count": token_count,
+        "table_cells": table_cells
+    }
+
+
+def parse_sequential_blocks(container, current_path: str, start_sequence: int) -> Tuple[List[Dict], int]:
+    """
+    컨테이너 내의 요소들을 순차적으로 파싱 (iter_sequential_blocks 결과를 리스트로 수집)
+
+    Args:
+        container: BeautifulSoup 요소 (body 또는 div)
+        current_path: 현재 섹션 경로
+        start_sequence: 시작 시퀀스 번호
+
+    Returns:
+        Tuple[List[Dict], int]: (블록 리스트, 다음 시퀀스 번호)
+    """
+    blocks = list(iter_sequential_blocks(container, current_path, start_sequence))
+    return blocks, start_sequence + len(blocks)
+
+
+def iter_page_blocks(html: Union[str, bytes], page_title: str) -> Iterator[Dict]:
+    """
+    단일 페이지 HTML을 순차적 블록으로 파싱 (블록 단위 생성)
+
+    Args:
+        html: 페이지 HTML (bytes면 UTF-8로 디코딩)
+        page_title: 최상위 섹션 경로 (페이지 제목)
+
+    Yields:
+        Dict: 블록 (sequence_order는 페이지 내 순서)
+    """
+    if isinstance(html, bytes):
+        html = html.decode('utf-8')
+    soup = make_soup(html)
+    yield from iter_sequential_blocks(soup.body if soup.body else soup, page_title, 0)
+
+
+def parse_page_blocks(html: Union[str, bytes], page_title: str) -> List[Dict]:
+    """
+    단일 페이지 HTML을 순차적 블록으로 파싱
+
+    Args:
+        html: 페이지 HTML (bytes면 UTF-8로 디코딩)
+        page_title: 최상위 섹션 경로 (페이지 제목)
+
+    Returns:
+        List[Dict]: 블록 리스트 (sequence_order는 페이지 내 순서)
+    """
+    return list(iter_page_blocks(html, page_title))
+
+
+# ==================== 프로세스 풀 워커 ====================
+
+def parse_page_records(html: bytes, page_title: str) -> List[Tuple]:
+    """
+    프로세스 풀 워커 진입점: 페이지 HTML -> 블록 레코드 튜플
+
+    프로세스 간 전송량을 줄이기 위해 HTML은 bytes로 받고,
+    블록은 BLOCK_FIELDS 순서의 튜플로 반환합니다.
+    """
+    return [tuple(block[field] for field in BLOCK_FIELDS) for block in iter_page_blocks(html, page_title)]
+
+
+def records_to_blocks(records: List[Tuple]) -> List[Dict]:
+    """parse_page_records() 결과를 블록 딕셔너리로 복원"""
+    return [
+        {
+            "chunk_type": chunk_type,
+            "section_path": section_path,
+            "content": content,
+            "sequence_order": sequence,
+            "table_metadata": table_metadata,
+            "token_count": token_count,
+            "table_cells": table_cells
+        }
+        for sequence, (chunk_type, section_path, content, table_metadata, token_count, table_cells)
+        in enumerate(records)
+    ]
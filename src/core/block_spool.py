@@ -0,0 +1,45 @@
+"""
+블록 스풀 모듈 - 페이지별 블록을 임시 파일에 기록했다가 순서대로 다시 읽기
+보고서 다운로드/파싱을 DB 트랜잭션 밖에서 끝내면서도 보고서 전체 블록을 메모리에 올리지 않기 위해 사용
+"""
+import pickle
+import tempfile
+from typing import Dict, Iterator, List
+
+
+class BlockSpool:
+    """
+    페이지별 블록 리스트 임시 파일 스풀 (with 구문으로 사용, 종료 시 파일 삭제)
+
+    - write(): 페이지 블록 리스트를 파일 끝에 기록 (메모리에는 한 페이지 분량만 유지)
+    - 순회: 기록한 순서대로 페이지 블록 리스트를 하나씩 읽어 반환
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(prefix="dart_blocks_")
+        self.pages = 0  # 기록한 페이지 수
+        self.counts: Dict[str, int] = {'text': 0, 'table': 0}  # 블록 종류별 수
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self._file.close()
+
+    def write(self, blocks: List[Dict]):
+        """페이지 블록 리스트 기록"""
+        pickle.dump(blocks, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.pages += 1
+        for block in blocks:
+            self.counts[block['chunk_type']] = self.counts.get(block['chunk_type'], 0) + 1
+
+    def __iter__(self) -> Iterator[List[Dict]]:
+        """기록한 페이지 블록 리스트를 순서대로 반환"""
+        self._file.flush()
+        self._file.seek(0)
+        for _ in range(self.pages):
+            yield pickle.load(self._file)
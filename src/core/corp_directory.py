@@ -0,0 +1,127 @@
+"""
+기업 디렉터리 모듈 - DART 기업 리스트 인덱싱
+corp_code / stock_code / 기업명 기반 O(1) 조회 지원
+"""
+from bisect import bisect_left
+from typing import Optional, List, Dict, Iterable, Iterator
+
+
+class CorpDirectory:
+    """
+    DART 기업 리스트(dart.get_corp_list() 결과)에 대한 해시 인덱스
+
+    기업 리스트(약 10만 개)를 한 번만 순회하여 인덱스를 구축하고,
+    이후 모든 조회는 딕셔너리/이진 탐색으로 처리합니다.
+    인덱스는 행 번호를 저장하므로 CorpTable(컬럼형 스냅샷)도 레코드 생성 없이 인덱싱됩니다.
+    """
+
+    def __init__(self, corps: Iterable):
+        """
+        인덱스 구축
+
+        Args:
+            corps: Corp 객체 목록 또는 CorpTable
+                (corp_code, corp_name, stock_code 속성을 가진 객체 목록)
+        """
+        if hasattr(corps, 'column'):
+            # 컬럼형 스냅샷: 컬럼을 그대로 사용
+            self._corps = corps
+            corp_codes = corps.column('corp_code')
+            stock_codes = corps.column('stock_code')
+            self._corp_names = corps.column('corp_name')
+        else:
+            self._corps = list(corps)
+            corp_codes = [getattr(c, 'corp_code', None) for c in self._corps]
+            stock_codes = [getattr(c, 'stock_code', None) for c in self._corps]
+            self._corp_names = [getattr(c, 'corp_name', None) for c in self._corps]
+
+        self._by_corp_code: Dict[str, int] = dict(zip(corp_codes, range(len(corp_codes))))
+        self._by_corp_code.pop(None, None)
+
+        # 동일 종목코드가 여러 번 나오면 선형 탐색과 동일하게 첫 번째 기업 유지 (역순 삽입)
+        self._by_stock_code: Dict[str, int] = dict(zip(reversed(stock_codes), reversed(range(len(stock_codes)))))
+        self._by_stock_code.pop(None, None)
+        self._by_stock_code.pop('', None)
+
+        self._listed_idx = [idx for idx, code in enumerate(stock_codes) if code]
+        self._listed: Optional[List] = None
+
+        # 기업명 인덱스는 첫 기업명 조회 시 구축 (파이프라인은 코드 조회만 사용)
+        self._by_name: Optional[Dict[str, List[int]]] = None
+        self._sorted_names: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._corps)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._corps)
+
+    # ==================== 코드 조회 ====================
+
+    def get_by_corp_code(self, corp_code: str):
+        """법인코드로 기업 조회 (없으면 None)"""
+        idx = self._by_corp_code.get(corp_code)
+        return self._corps[idx] if idx is not None else None
+
+    def get_by_stock_code(self, stock_code: str):
+        """종목코드로 기업 조회 (없으면 None)"""
+        idx = self._by_stock_code.get(stock_code)
+        return self._corps[idx] if idx is not None else None
+
+    # ==================== 기업명 조회 ====================
+
+    def _build_name_index(self):
+        """기업명 / 접두어 인덱스 구축"""
+        by_name: Dict[str, List[int]] = {}
+        for idx, name in enumerate(self._corp_names):
+            if name:
+                by_name.setdefault(name, []).append(idx)
+        self._by_name = by_name
+        self._sorted_names = sorted(by_name)
+
+    def find_by_name(self, corp_name: str) -> List:
+        """기업명이 정확히 일치하는 기업 목록 조회"""
+        if self._by_name is None:
+            self._build_name_index()
+        return [self._corps[idx] for idx in self._by_name.get(corp_name, [])]
+
+    def find_by_name_prefix(self, prefix: str, limit: Optional[int] = None) -> List:
+        """
+        기업명 접두어로 기업 목록 조회
+
+        Args:
+            prefix: 기업명 접두어 (예: "삼성")
+            limit: 최대 반환 개수 (None이면 전체)
+
+        Returns:
+            List: 기업명 오름차순으로 정렬된 기업 목록
+        """
+        if self._by_name is None:
+            self._build_name_index()
+
+        result = []
+        pos = bisect_left(self._sorted_names, prefix)
+
+        while pos < len(self._sorted_names):
+            name = self._sorted_names[pos]
+            if not name.startswith(prefix):
+                break
+            result.extend(self._corps[idx] for idx in self._by_name[name])
+            if limit is not None and len(result) >= limit:
+                return result[:limit]
+            pos += 1
+
+        return result
+
+    # ==================== 상장사 ====================
+
+    @property
+    def listed(self) -> List:
+        """상장 기업 목록 (종목코드 보유 기업, 원본 순서 유지, 최초 접근 시 1회 생성)"""
+        if self._listed is None:
+            self._listed = [self._corps[idx] for idx in self._listed_idx]
+        return self._listed
+
+    def get_listed_corps(self) -> List:
+        """상장 기업 목록 사본 반환 (호출자가 수정해도 인덱스에 영향 없음)"""
+        return list(self.listed)
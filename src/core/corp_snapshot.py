@@ -0,0 +1,249 @@
+"""
+기업 리스트 스냅샷 모듈 - dart.get_corp_list() 결과를 로컬 파일로 보관
+CORPCODE 아카이브 재다운로드 없이 밀리초 단위로 기업 리스트 로드
+"""
+import os
+import json
+import mmap
+import time
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from collections.abc import Sequence
+from typing import Optional, List, Dict, Callable, Iterable, Iterator, NamedTuple
+from config import CORP_SNAPSHOT_CONFIG
+
+
+# 스냅샷 파일 포맷 버전 (컬럼 구성이 바뀌면 올려서 기존 파일을 무효화)
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MAGIC = b"CORPSNAP"
+_HEADER_LEN = struct.Struct("<I")
+_FIELD_SEP = "\x1f"  # ASCII Unit Separator (기업명에 등장하지 않는 문자)
+
+
+class CorpRecord(NamedTuple):
+    """스냅샷에서 복원한 기업 정보 (Corp 객체와 동일한 속성명 사용)"""
+    corp_code: str
+    corp_name: Optional[str]
+    stock_code: Optional[str]
+    modify_date: Optional[str]
+    corp_cls: Optional[str]
+
+
+class CorpTable(Sequence):
+    """
+    컬럼 단위로 보관되는 기업 리스트
+
+    10만 개 레코드 객체를 한 번에 만들지 않고, 접근 시점에 CorpRecord를 생성합니다.
+    CorpDirectory는 column()으로 컬럼을 직접 읽어 인덱스를 구축합니다.
+    """
+
+    def __init__(self, columns: Dict[str, List[Optional[str]]]):
+        self._columns = [columns[name] for name in CorpRecord._fields]
+        self._count = len(self._columns[0])
+
+    def column(self, name: str) -> List[Optional[str]]:
+        """컬럼 값 리스트 반환 (예: column('stock_code'))"""
+        return self._columns[CorpRecord._fields.index(name)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._count))]
+        return CorpRecord(*(col[idx] for col in self._columns))
+
+    def __iter__(self) -> Iterator[CorpRecord]:
+        return map(CorpRecord._make, zip(*self._columns))
+
+
+class CorpSnapshot:
+    """
+    기업 리스트 컬럼형(columnar) 스냅샷
+
+    파일 구조:
+        MAGIC(8B) | 헤더 길이(4B) | 헤더 JSON | 컬럼별 UTF-8 블록
+
+    헤더에는 포맷 버전, 생성 시각, 건수, 컬럼별 오프셋이 기록됩니다.
+    로드 시에는 파일을 mmap으로 열어 컬럼 블록만 디코딩하므로
+    10만 건 기준 수 ms 내에 복원됩니다.
+
+    같은 호스트의 여러 워커는 하나의 스냅샷 파일을 공유하며,
+    갱신은 잠금 파일로 직렬화되어 한 프로세스만 다운로드합니다.
+    """
+
+    def __init__(self, path: str = None, ttl_hours: float = None):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (기본: config 설정값)
+            ttl_hours: 스냅샷 유효 시간 (기본: config 설정값)
+        """
+        self.path = Path(path or CORP_SNAPSHOT_CONFIG['path'])
+        self.ttl_sec = (ttl_hours if ttl_hours is not None else CORP_SNAPSHOT_CONFIG['ttl_hours']) * 3600
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.lock_timeout_sec = CORP_SNAPSHOT_CONFIG.get('lock_timeout_sec', 300)
+        self._lock_requested_at = 0.0
+
+    # ==================== 로드 / 갱신 ====================
+
+    def load(self, fetcher: Callable[[], Iterable], force_refresh: bool = False) -> CorpTable:
+        """
+        스냅샷 로드 (만료/손상/강제 갱신 시 fetcher로 다시 받아 저장)
+
+        Args:
+            fetcher: 기업 리스트를 반환하는 함수 (예: dart.get_corp_list)
+            force_refresh: True면 TTL과 무관하게 갱신 (--refresh-corps)
+
+        Returns:
+            CorpTable: 기업 정보 리스트
+        """
+        if not force_refresh:
+            records = self._read_if_fresh()
+            if records is not None:
+                return records
+
+        with self._lock():
+            # 잠금 대기 중 다른 워커가 이미 갱신했다면 그 결과를 사용
+            if not force_refresh or self._created_after_lock_request():
+                records = self._read_if_fresh()
+                if records is not None:
+                    return records
+
+            print("🔄 기업 리스트 스냅샷 갱신 중 (DART CORPCODE 다운로드)...")
+            table = self.to_table(fetcher())
+            self.write(table)
+            print(f"💾 기업 리스트 스냅샷 저장: {self.path} ({len(table)}개 기업)")
+            return table
+
+    def _read_if_fresh(self) -> Optional[CorpTable]:
+        """유효한 스냅샷이면 로드, 없거나 만료/손상이면 None"""
+        try:
+            header, table = self.read()
+        except FileNotFoundError:
+            return None
+        except (ValueError, OSError) as e:
+            print(f"⚠️ 기업 리스트 스냅샷 손상 - 재생성합니다: {e}")
+            return None
+
+        age = time.time() - header['created_at']
+        if age > self.ttl_sec:
+            print(f"⏰ 기업 리스트 스냅샷 만료 ({age / 3600:.1f}시간 경과)")
+            return None
+
+        return table
+
+    def _created_after_lock_request(self) -> bool:
+        """강제 갱신 요청 중 다른 워커가 방금 갱신했는지 확인"""
+        try:
+            return self.path.stat().st_mtime >= self._lock_requested_at
+        except FileNotFoundError:
+            return False
+
+    # ==================== 직렬화 ====================
+
+    @staticmethod
+    def to_table(corps: Iterable) -> CorpTable:
+        """Corp 객체 목록을 CorpTable로 변환"""
+        corps = list(corps)
+        return CorpTable({
+            name: [getattr(corp, name, None) or None for corp in corps]
+            for name in CorpRecord._fields
+        })
+
+    def write(self, table: CorpTable):
+        """스냅샷 파일 원자적 저장 (임시 파일 작성 후 교체)"""
+        columns = []
+        blobs = []
+        offset = 0
+        for name in CorpRecord._fields:
+            blob = _FIELD_SEP.join(v or "" for v in table.column(name)).encode('utf-8')
+            columns.append({"name": name, "offset": offset, "length": len(blob)})
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = json.dumps({
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": time.time(),
+            "count": len(table),
+            "columns": columns
+        }).encode('utf-8')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_HEADER_LEN.pack(len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, self.path)
+
+    def read(self):
+        """
+        스냅샷 파일 읽기
+
+        Returns:
+            Tuple[Dict, CorpTable]: (헤더, 기업 정보 리스트)
+
+        Raises:
+            FileNotFoundError: 스냅샷 없음
+            ValueError: 포맷/버전 불일치 또는 손상
+        """
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(_MAGIC)] != _MAGIC:
+                raise ValueError("스냅샷 형식이 아닙니다")
+
+            pos = len(_MAGIC)
+            (header_len,) = _HEADER_LEN.unpack_from(mm, pos)
+            pos += _HEADER_LEN.size
+            header = json.loads(mm[pos:pos + header_len])
+            pos += header_len
+
+            if header.get('version') != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"스냅샷 버전 불일치 ({header.get('version')})")
+            if [c['name'] for c in header['columns']] != list(CorpRecord._fields):
+                raise ValueError("스냅샷 컬럼 구성 불일치")
+
+            count = header['count']
+            columns = {}
+            for col in header['columns']:
+                if count == 0:
+                    columns[col['name']] = []
+                    continue
+                start = pos + col['offset']
+                values = mm[start:start + col['length']].decode('utf-8').split(_FIELD_SEP)
+                if len(values) != count:
+                    raise ValueError(f"컬럼 길이 불일치 ({col['name']})")
+                columns[col['name']] = [v or None for v in values]
+
+        return header, CorpTable(columns)
+
+    # ==================== 프로세스 간 잠금 ====================
+
+    @contextmanager
+    def _lock(self):
+        """잠금 파일 기반 프로세스 간 잠금 (POSIX/Windows 공통)"""
+        self._lock_requested_at = time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + self.lock_timeout_sec
+
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                break
+            except FileExistsError:
+                if time.time() > deadline:
+                    # 갱신 중 비정상 종료된 워커가 남긴 잠금으로 간주
+                    print(f"⚠️ 오래된 스냅샷 잠금 제거: {self.lock_path}")
+                    self.lock_path.unlink(missing_ok=True)
+                    deadline = time.time() + self.lock_timeout_sec
+                time.sleep(0.2)
+
+        try:
+            yield
+        finally:
+            self.lock_path.unlink(missing_ok=True)
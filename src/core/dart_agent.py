@@ -3,15 +3,41 @@ DART 보고서 에이전트 모듈 - DART API를 통한 사업보고서 수집 
 순차적 블록 처리(Sequential Block Processing) 지원
 """
 import dart_fss as dart
-from bs4 import BeautifulSoup, NavigableString, Tag
 import re
-import json
 import time
+import asyncio
+import multiprocessing
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
-import pandas as pd
-from io import StringIO
-from typing import Optional, List, Dict, Tuple
-from config import DART_API_KEY, TARGET_SECTIONS, CHUNK_CONFIG, REPORT_SEARCH_CONFIG
+from dart_fss.errors import NoDataReceived
+from dart_fss.filings.reports import Report
+from dart_fss.utils.regex import str_to_regex
+from typing import Optional, List, Dict, Tuple, Iterator
+from config import (
+    DART_API_KEY, TARGET_SECTIONS, CHUNK_CONFIG, REPORT_SEARCH_CONFIG,
+    CORP_SNAPSHOT_CONFIG, PAGE_CACHE_CONFIG, PAGE_FETCH_CONFIG, DART_CLIENT_CONFIG, PARSER_CONFIG
+)
+from . import block_parser
+from .async_dart_client import AsyncDartClient, BackgroundLoop
+from .corp_directory import CorpDirectory
+from .corp_snapshot import CorpSnapshot, CorpRecord
+from .html_parser import make_soup
+from .html_table import has_text, table_to_records
+from .page_cache import PageCache, CachedPage
+from .rate_limiter import install_dart_rate_limiter
+
+
+class ReportFetchError(RuntimeError):
+    """보고서 페이지 목록 조회 또는 페이지 수집/파싱 실패 (strict 모드, 일부 페이지만 적재되지 않도록)"""
+
+
+class _EmptySearchResult:
+    """검색 결과가 없을 때의 SearchResults 대체 객체"""
+    report_list = []
+    total_page = 1
+    total_count = 0
 
 
 class DartReportAgent:
@@ -19,39 +45,117 @@ class DartReportAgent:
     DART API를 사용하여 사업보고서를 수집하고 파싱하는 에이전트
     """
 
-    def __init__(self):
-        """에이전트 초기화 및 DART API 설정"""
+    def __init__(self, refresh_corps: bool = False, offline: bool = False, backend: str = None):
+        """
+        에이전트 초기화 및 DART API 설정
+
+        Args:
+            refresh_corps: True면 기업 리스트 스냅샷을 TTL과 무관하게 갱신
+            offline: True면 DART에 접속하지 않고 페이지 캐시만 사용
+            backend: "dart_fss"(동기) 또는 "async"(AsyncDartClient), 기본: config 설정값
+        """
+        self.refresh_corps = refresh_corps
+        self.offline = offline
+        self._corp_list = None
+        self._corp_directory = None
+
+        # 비동기 백엔드: 전용 이벤트 루프 스레드에서 AsyncDartClient 연결 풀 유지
+        backend = backend or DART_CLIENT_CONFIG.get('backend', 'dart_fss')
+        if backend not in ('dart_fss', 'async'):
+            raise ValueError(f"지원하지 않는 DART 백엔드: {backend}")
+        self.dart_client = AsyncDartClient() if backend == 'async' and not offline else None
+        self._async_loop = BackgroundLoop() if self.dart_client is not None else None
+
+        # 페이지 파싱 프로세스 풀 (첫 파싱 시 생성, 보고서 간 재사용)
+        self.parse_workers = PARSER_CONFIG.get('parse_workers', 1)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        if offline and not PAGE_CACHE_CONFIG.get('enabled', True):
+            raise ValueError("오프라인 모드는 페이지 캐시(PAGE_CACHE_CONFIG['enabled'])가 필요합니다")
+        self.page_cache = PageCache() if PAGE_CACHE_CONFIG.get('enabled', True) else None
+
+        if offline:
+            print("📴 오프라인 모드: 페이지 캐시만 사용합니다")
+            return
+
+        # 모든 dart_fss 요청에 공용 토큰 버킷 적용 (API 키 검증 요청 포함)
+        install_dart_rate_limiter()
         dart.set_api_key(api_key=DART_API_KEY)
         print("🔄 기업 리스트 로딩 중...")
-        self._corp_list = None
 
     @property
     def corp_list(self):
-        """기업 리스트 (lazy loading)"""
+        """기업 리스트 (lazy loading, 로컬 스냅샷 우선)"""
         if self._corp_list is None:
-            self._corp_list = dart.get_corp_list()
+            fetcher = self._fetch_corp_list if self.dart_client is not None else dart.get_corp_list
+            if CORP_SNAPSHOT_CONFIG.get('enabled', True):
+                self._corp_list = CorpSnapshot().load(
+                    fetcher,
+                    force_refresh=self.refresh_corps
+                )
+            else:
+                self._corp_list = fetcher()
             print(f"✅ 기업 리스트 로드 완료: {len(self._corp_list)}개 기업")
         return self._corp_list
 
+    def _fetch_corp_list(self) -> List[CorpRecord]:
+        """비동기 백엔드로 기업 고유번호 목록 조회"""
+        rows = self._async_loop.run(self.dart_client.get_corp_codes())
+        return [CorpRecord(corp_cls=None, **row) for row in rows]
+
+    def close(self):
+        """비동기 백엔드 연결 풀 / 이벤트 루프, 파싱 프로세스 풀 종료"""
+        if self._async_loop is not None:
+            self._async_loop.run(self.dart_client.aclose())
+            self._async_loop.close()
+            self._async_loop = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+
+    def _reset_parse_pool(self):
+        """비정상 종료된 파싱 프로세스 풀 폐기 (다음 보고서에서 새로 생성)"""
+        if self._parse_pool is not None:
+            print("   ⚠️ 파싱 프로세스 풀 비정상 종료 - 현재 프로세스에서 파싱")
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """페이지 파싱 프로세스 풀 (parse_workers가 1 이하면 None)"""
+        if self._parse_pool is None and self.parse_workers > 1:
+            # 다운로드 스레드/이벤트 루프가 도는 중에 fork하지 않도록 spawn 사용
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._parse_pool
+
+    @property
+    def corp_directory(self) -> CorpDirectory:
+        """기업 리스트 인덱스 (corp_list 로드 후 1회만 구축)"""
+        if self._corp_directory is None:
+            self._corp_directory = CorpDirectory(self.corp_list)
+        return self._corp_directory
+
     # ==================== 기업 조회 ====================
 
     def get_corp_by_stock_code(self, stock_code: str):
         """종목코드로 기업 정보 조회"""
-        for corp in self.corp_list:
-            if corp.stock_code == stock_code:
-                return corp
-        return None
+        return self.corp_directory.get_by_stock_code(stock_code)
 
     def get_corp_by_corp_code(self, corp_code: str):
         """법인코드로 기업 정보 조회"""
-        for corp in self.corp_list:
-            if corp.corp_code == corp_code:
-                return corp
-        return None
+        return self.corp_directory.get_by_corp_code(corp_code)
+
+    def find_corps_by_name(self, corp_name: str, prefix: bool = False) -> List:
+        """기업명(또는 접두어)으로 기업 목록 조회"""
+        if prefix:
+            return self.corp_directory.find_by_name_prefix(corp_name)
+        return self.corp_directory.find_by_name(corp_name)
 
     def get_listed_corps(self) -> List:
         """상장 기업만 필터링 (사업보고서 존재 가능성 높음)"""
-        return [c for c in self.corp_list if c.stock_code]
+        return self.corp_directory.get_listed_corps()
 
     def search_all_reports(
         self,
@@ -62,7 +166,8 @@ class DartReportAgent:
         """
         기간 내 모든 사업보고서를 일괄 검색 (효율적인 방식)
 
-        corp_code가 없으면 검색 기간은 최대 3개월(90일)로 제한됩니다.
+        corp_code가 없으면 DART 검색 기간 제한(최대 90일)에 맞춰 기간을 구간으로 분할하고,
+        모든 구간/페이지를 동시에 조회한 뒤 rcept_no 기준으로 중복을 제거하여 병합합니다.
 
         Args:
             bgn_de: 검색 시작일 (YYYYMMDD), 기본값은 config에서 가져옴
@@ -70,7 +175,7 @@ class DartReportAgent:
             corp_code: 특정 기업만 검색할 경우 법인코드 지정
 
         Returns:
-            List[Dict]: 보고서 정보 딕셔너리 리스트
+            List[Dict]: 보고서 정보 딕셔너리 리스트 (최신 구간 → 과거 구간, 구간 내 페이지 순)
                 - corp_code, corp_name, stock_code, rcept_no, rcept_dt, report_nm 등
         """
         # 기본값 설정
@@ -79,68 +184,172 @@ class DartReportAgent:
         if bgn_de is None:
             bgn_de = REPORT_SEARCH_CONFIG['bgn_de']
 
-        # corp_code가 없으면 검색 기간을 최대 90일(3개월)로 제한
+        # corp_code가 없으면 검색 기간을 최대 90일(3개월) 구간으로 분할
         if corp_code is None:
+            windows = self._split_search_windows(bgn_de, end_de)
+        else:
+            windows = [(bgn_de, end_de)]
+
+        print(f"📋 사업보고서 검색 시작: {bgn_de} ~ {end_de}")
+        if corp_code:
+            print(f"   대상 기업: {corp_code}")
+        if len(windows) > 1:
             max_days = REPORT_SEARCH_CONFIG.get('max_search_days', 90)
-            bgn_date = datetime.strptime(bgn_de, "%Y%m%d")
-            end_date = datetime.strptime(end_de, "%Y%m%d")
+            print(f"   📅 검색 기간을 {len(windows)}개 구간으로 분할 (구간당 최대 {max_days}일)")
+
+        window_kwargs = []
+        for window_bgn, window_end in windows:
+            search_kwargs = {
+                'bgn_de': window_bgn,
+                'end_de': window_end,
+                'pblntf_detail_ty': REPORT_SEARCH_CONFIG['pblntf_detail_ty'],
+                'page_count': REPORT_SEARCH_CONFIG.get('page_count', 100)
+            }
+            # corp_code가 있으면 특정 기업만 검색
+            if corp_code:
+                search_kwargs['corp_code'] = corp_code
+            window_kwargs.append(search_kwargs)
+
+        # (구간 번호, 페이지 번호) → report_list
+        pages = {}
+        failed_pages = []
+        max_workers = REPORT_SEARCH_CONFIG.get('search_workers', 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 비동기 백엔드는 이벤트 루프에, 기본 백엔드는 스레드 풀에 페이지 조회 제출
+            if self.dart_client is not None:
+                def submit(kwargs, page_no):
+                    return self._async_loop.submit(self._search_page_async(kwargs, page_no))
+            else:
+                def submit(kwargs, page_no):
+                    return executor.submit(self._search_page, kwargs, page_no)
+
+            # 1. 구간별 첫 페이지로 전체 페이지 수 확인
+            first_futures = [submit(kwargs, 1) for kwargs in window_kwargs]
+            first_pages = [future.result() for future in first_futures]
+
+            remaining = []
+            for w_idx, first_page in enumerate(first_pages):
+                window_bgn, window_end = windows[w_idx]
+                if first_page is None:
+                    failed_pages.append((window_bgn, window_end, 1))
+                    continue
+
+                report_list = getattr(first_page, 'report_list', []) or []
+                total_page = getattr(first_page, 'total_page', 1) or 1
+                total_count = getattr(first_page, 'total_count', 0) or 0
+                pages[(w_idx, 1)] = report_list
+                print(f"   📄 [{window_bgn}~{window_end}] Page 1/{total_page}: "
+                      f"{len(report_list)}건 (전체 {total_count}건)")
 
-            if (end_date - bgn_date).days > max_days:
-                bgn_date = end_date - timedelta(days=max_days)
-                bgn_de = bgn_date.strftime("%Y%m%d")
-                print(f"⚠️ corp_code 미지정: 검색 기간을 최대 {max_days}일로 제한 ({bgn_de} ~ {end_de})")
+                remaining.extend((w_idx, page_no) for page_no in range(2, total_page + 1))
 
+            # 2. 나머지 페이지 동시 조회 (호출량은 공용 Rate Limiter로 제한)
+            futures = {
+                submit(window_kwargs[w_idx], page_no): (w_idx, page_no)
+                for w_idx, page_no in remaining
+            }
+            for future in as_completed(futures):
+                w_idx, page_no = futures[future]
+                result = future.result()
+                if result is None:
+                    failed_pages.append((*windows[w_idx], page_no))
+                    continue
+                pages[(w_idx, page_no)] = getattr(result, 'report_list', []) or []
+
+        if failed_pages:
+            failed_desc = ", ".join(f"{b}~{e} p{p}" for b, e, p in sorted(failed_pages))
+            print(f"⚠️ 재시도 후에도 실패한 페이지: {failed_desc} "
+                  f"(페이지당 최대 {REPORT_SEARCH_CONFIG.get('page_count', 100)}건 누락 가능)")
+
+        # 3. 구간/페이지 순으로 병합 (결정적 순서) + rcept_no 기준 중복 제거
         all_reports = []
-        page_no = 1
-        page_count = REPORT_SEARCH_CONFIG.get('page_count', 100)
-        page_delay = REPORT_SEARCH_CONFIG.get('page_delay_sec', 0.5)
+        seen_rcept_nos = set()
+        for key in sorted(pages):
+            for report in pages[key]:
+                rcept_no = getattr(report, 'rcept_no', None)
+                if rcept_no in seen_rcept_nos:
+                    continue
+                seen_rcept_nos.add(rcept_no)
+                all_reports.append(report)
 
-        print(f"📋 사업보고서 검색 시작: {bgn_de} ~ {end_de}")
-        if corp_code:
-            print(f"   대상 기업: {corp_code}")
+        print(f"✅ 검색 완료: 총 {len(all_reports)}건의 사업보고서")
+        return all_reports
 
-        while True:
-            try:
-                # dart.filings.search 사용 (기간 내 모든 사업보고서 검색)
-                search_kwargs = {
-                    'bgn_de': bgn_de,
-                    'end_de': end_de,
-                    'pblntf_detail_ty': REPORT_SEARCH_CONFIG['pblntf_detail_ty'],
-                    'page_count': page_count,
-                    'page_no': page_no
-                }
+    def _split_search_windows(self, bgn_de: str, end_de: str) -> List[Tuple[str, str]]:
+        """
+        검색 기간을 max_search_days 이하의 구간으로 분할 (최신 구간부터)
 
-                # corp_code가 있으면 특정 기업만 검색
-                if corp_code:
-                    search_kwargs['corp_code'] = corp_code
+        Args:
+            bgn_de: 검색 시작일 (YYYYMMDD)
+            end_de: 검색 종료일 (YYYYMMDD)
 
-                search_result = dart.filings.search(**search_kwargs)
+        Returns:
+            List[Tuple[str, str]]: (구간 시작일, 구간 종료일) 리스트, 양 끝 포함
+        """
+        max_days = REPORT_SEARCH_CONFIG.get('max_search_days', 90)
+        bgn_date = datetime.strptime(bgn_de, "%Y%m%d")
+        window_end = datetime.strptime(end_de, "%Y%m%d")
 
-                # 결과 추출 (SearchResults 객체는 속성으로 접근)
-                report_list = getattr(search_result, 'report_list', []) or []
-                if not report_list:
-                    break
+        windows = []
+        while window_end >= bgn_date:
+            window_bgn = max(bgn_date, window_end - timedelta(days=max_days))
+            windows.append((window_bgn.strftime("%Y%m%d"), window_end.strftime("%Y%m%d")))
+            window_end = window_bgn - timedelta(days=1)
 
-                all_reports.extend(report_list)
+        return windows
 
-                total_page = getattr(search_result, 'total_page', 1) or 1
-                total_count = getattr(search_result, 'total_count', 0) or 0
+    def _search_page(self, search_kwargs: Dict, page_no: int):
+        """
+        dart.filings.search 단일 페이지 조회 (페이지 단위 재시도)
 
-                print(f"   📄 Page {page_no}/{total_page}: {len(report_list)}건 (누적 {len(all_reports)}/{total_count})")
+        Args:
+            search_kwargs: 공통 검색 조건
+            page_no: 페이지 번호
 
-                # 마지막 페이지면 종료
-                if page_no >= total_page:
-                    break
+        Returns:
+            SearchResults 객체 (결과 없음은 빈 report_list), 재시도 초과 시 None
+        """
+        max_retries = REPORT_SEARCH_CONFIG.get('page_max_retries', 3)
+        retry_delay = REPORT_SEARCH_CONFIG.get('page_retry_delay_sec', 1)
 
-                page_no += 1
-                time.sleep(page_delay)  # Rate Limiting
+        for attempt in range(1, max_retries + 1):
+            try:
+                return dart.filings.search(**search_kwargs, page_no=page_no)
+            except NoDataReceived:
+                # 검색 결과 없음 (DART status 013) - 재시도 불필요
+                return _EmptySearchResult()
+            except Exception as e:
+                print(f"⚠️ 보고서 검색 오류 (page={page_no}, 시도 {attempt}/{max_retries}): {e}")
+                if attempt < max_retries:
+                    time.sleep(retry_delay * attempt)
 
+        return None
+
+    async def _search_page_async(self, search_kwargs: Dict, page_no: int):
+        """
+        AsyncDartClient로 단일 페이지 조회 (_search_page와 같은 형식으로 반환)
+
+        Returns:
+            report_list / total_page / total_count를 가진 객체, 재시도 초과 시 None
+        """
+        max_retries = REPORT_SEARCH_CONFIG.get('page_max_retries', 3)
+        retry_delay = REPORT_SEARCH_CONFIG.get('page_retry_delay_sec', 1)
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                data = await self.dart_client.search_filings(**search_kwargs, page_no=page_no)
+                return SimpleNamespace(
+                    report_list=[self.get_report(row) for row in data.get('list', [])],
+                    total_page=data.get('total_page', 1),
+                    total_count=data.get('total_count', 0)
+                )
             except Exception as e:
-                print(f"⚠️ 보고서 검색 오류 (page={page_no}): {e}")
-                break
+                print(f"⚠️ 보고서 검색 오류 (page={page_no}, 시도 {attempt}/{max_retries}): {e}")
+                if attempt < max_retries:
+                    await asyncio.sleep(retry_delay * attempt)
 
-        print(f"✅ 검색 완료: 총 {len(all_reports)}건의 사업보고서")
-        return all_reports
+        return None
 
     def get_corps_with_reports(
         self,
@@ -229,17 +438,109 @@ class DartReportAgent:
             print(f"⚠️ 보고서 검색 오류 (corp_code={corp_code}): {e}")
             return None
 
+    def get_report(self, source, **meta) -> Report:
+        """
+        검색 결과 또는 접수번호로 보고서 핸들 생성 (추가 검색 API 호출 없음)
+
+        dart.filings.search 결과는 이미 lazy loading Report이므로 그대로 사용하고,
+        딕셔너리(검색 결과 행)나 접수번호만 있으면 Report를 직접 생성합니다.
+        페이지 목록과 HTML은 find_all() 등으로 처음 접근할 때 로드됩니다.
+
+        Args:
+            source: Report 객체, 검색 결과 딕셔너리, 또는 접수번호(rcept_no) 문자열
+            **meta: 추가 메타정보 (corp_code, corp_name, report_nm, rcept_dt 등)
+
+        Returns:
+            Report 객체
+
+        Raises:
+            ValueError: 접수번호를 찾을 수 없는 경우
+        """
+        if isinstance(source, Report):
+            if meta:
+                for key, value in meta.items():
+                    source.info.setdefault(key, value)
+            return source
+
+        if isinstance(source, dict):
+            info = {**meta, **source}
+        else:
+            info = {**meta, 'rcept_no': source}
+
+        rcept_no = info.pop('rcept_no', None) or info.pop('rcp_no', None)
+        if not rcept_no:
+            raise ValueError(f"접수번호(rcept_no)가 없는 보고서 정보입니다: {source!r}")
+
+        info.setdefault('lazy_loading', True)
+        return Report(rcp_no=str(rcept_no), **info)
+
     def get_report_info(self, report) -> Dict:
-        """보고서 메타정보 추출"""
+        """보고서 메타정보 추출 (접수번호만으로 만든 보고서는 접수일을 접수번호 앞 8자리로 대체)"""
+        rcept_no = report.rcept_no
         return {
-            "title": report.report_nm,
-            "rcept_no": report.rcept_no,
-            "rcept_dt": report.rcept_dt,
-            "corp_code": report.corp_code,
-            "corp_name": report.corp_name,
+            "title": getattr(report, 'report_nm', None),
+            "rcept_no": rcept_no,
+            "rcept_dt": getattr(report, 'rcept_dt', None) or rcept_no[:8],
+            "corp_code": getattr(report, 'corp_code', None),
+            "corp_name": getattr(report, 'corp_name', None),
             "report_type": "annual"
         }
 
+    def get_report_pages(self, report) -> List:
+        """
+        보고서 페이지 목록 (페이지 캐시 사용 시 캐시 경유)
+
+        Returns:
+            List: page.title / page.html을 제공하는 페이지 객체 리스트
+
+        Raises:
+            PageCacheMiss: 오프라인 모드에서 캐시에 없는 보고서
+        """
+        list_pages = None
+        if self.dart_client is not None:
+            def list_pages():
+                return self._async_loop.run(self.dart_client.get_report_pages(report.rcept_no))
+
+        if self.page_cache is None:
+            if list_pages is None:
+                return report.pages
+            return [CachedPage(None, report.rcept_no, spec) for spec in list_pages()]
+        return self.page_cache.get_pages(report, offline=self.offline, list_pages=list_pages)
+
+    def find_section_pages(self, report, section_keyword: str) -> List:
+        """
+        제목에 섹션 키워드가 포함된 페이지 목록 (get_report_pages() 경유 - 페이지 캐시 / 오프라인 모드 적용)
+
+        report.find_all(includes=...)와 같은 매칭 규칙을 사용합니다.
+
+        Raises:
+            PageCacheMiss: 오프라인 모드에서 캐시에 없는 보고서
+        """
+        regex = str_to_regex(section_keyword)
+        return [page for page in self.get_report_pages(report) if regex.search(getattr(page, 'title', '') or '')]
+
+    def get_cached_reports(self) -> List[Tuple]:
+        """
+        페이지 캐시에 저장된 보고서 목록 (오프라인 재처리용)
+
+        Returns:
+            List[Tuple]: (CorpRecord, Report 핸들) 튜플 리스트
+        """
+        if self.page_cache is None:
+            return []
+
+        corps_with_reports = []
+        for info in self.page_cache.list_reports():
+            corp = CorpRecord(
+                corp_code=info.get('corp_code'),
+                corp_name=info.get('corp_name'),
+                stock_code=info.get('stock_code'),
+                modify_date=None,
+                corp_cls=info.get('corp_cls')
+            )
+            corps_with_reports.append((corp, self.get_report(info)))
+        return corps_with_reports
+
     # ==================== 섹션 추출 ====================
 
     def get_all_sections(self, report) -> List[Dict]:
@@ -250,8 +551,7 @@ class DartReportAgent:
             List[Dict]: 섹션 정보 리스트
         """
         try:
-            all_pages = report.find_all()
-            pages = all_pages.get('pages', [])
+            pages = self.get_report_pages(report)
 
             sections = []
             for i, page in enumerate(pages):
@@ -277,8 +577,7 @@ class DartReportAgent:
             Dict: {"section_name": str, "text": str, "tables": list, "page_count": int}
         """
         try:
-            result = report.find_all(includes=section_keyword)
-            pages = result.get('pages', [])
+            pages = self.find_section_pages(report, section_keyword)
 
             if not pages:
                 return None
@@ -288,7 +587,7 @@ class DartReportAgent:
             tables = []
 
             for page in pages:
-                soup = BeautifulSoup(page.html, 'html.parser')
+                soup = make_soup(page.html)
 
                 # 테이블 추출
                 for table in soup.find_all('table'):
@@ -345,42 +644,32 @@ class DartReportAgent:
         Returns:
             Dict: {"title": str, "content_text": str, "tables": list}
         """
-        html = page.html
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(page.html)
 
-        # 1. 먼저 테이블 데이터 추출 (JSON 직렬화 가능한 형태로)
+        # 1. 테이블 데이터 추출 (파싱된 트리에서 바로 레코드로 변환)
         tables_json = []
-        try:
-            html_io = StringIO(str(soup))
-            dfs = pd.read_html(html_io, flavor='bs4')
-
-            for idx, df in enumerate(dfs):
-                # NaN -> 빈 문자열
-                df_clean = df.where(pd.notnull(df), "")
-                # DataFrame -> JSON -> Dict 변환 (Numpy 타입 해결)
-                json_str = df_clean.to_json(orient='records', force_ascii=False)
-                table_data = json.loads(json_str)
-
-                tables_json.append({
-                    "table_index": idx,
-                    "data": table_data
-                })
-        except ValueError:
-            pass  # 테이블 없음
-        except Exception as e:
-            print(f"   ⚠️ 테이블 파싱 중 오류: {e}")
+        tables = soup.find_all('table')
+        for table in tables:
+            if not has_text(table):
+                continue
+            try:
+                table_data = table_to_records(table)
+            except Exception as e:
+                print(f"   ⚠️ 테이블 파싱 중 오류: {e}")
+                continue
 
-        # 2. HTML에서 테이블 요소 제거 후 텍스트 추출
-        # 복사본에서 작업
-        soup_for_text = BeautifulSoup(html, 'html.parser')
+            tables_json.append({
+                "table_index": len(tables_json),
+                "data": table_data
+            })
 
-        # 모든 <table> 태그와 그 내용을 제거
-        for table in soup_for_text.find_all('table'):
+        # 2. 같은 트리에서 테이블 요소를 마커로 바꾼 뒤 텍스트 추출
+        for table in tables:
             # 테이블 위치에 마커 추가
             table.replace_with('[TABLE]')
 
         # 테이블 제거 후 텍스트 추출
-        content_text = soup_for_text.get_text(separator='\n').strip()
+        content_text = soup.get_text(separator='\n').strip()
         content_text = self._clean_text(content_text)
 
         # [TABLE] 마커 정리 (연속된 마커 제거 및 안내문 변환)
@@ -479,8 +768,7 @@ class DartReportAgent:
             Dict: {"chapter": str, "pages_data": list, "page_count": int}
         """
         try:
-            result = report.find_all(includes=section_keyword)
-            pages = result.get('pages', [])
+            pages = self.find_section_pages(report, section_keyword)
 
             if not pages:
                 return None
@@ -570,43 +858,7 @@ class DartReportAgent:
         Returns:
             List[str]: 청크 리스트
         """
-        chunk_size = chunk_size or CHUNK_CONFIG['max_chunk_size']
-        overlap = overlap or CHUNK_CONFIG['overlap']
-        min_size = CHUNK_CONFIG['min_chunk_size']
-
-        if len(text) <= chunk_size:
-            return [text] if len(text) >= min_size else []
-
-        chunks = []
-        start = 0
-
-        while start < len(text):
-            end = start + chunk_size
-
-            # 문장 경계에서 자르기 시도
-            if end < len(text):
-                # 마침표, 줄바꿈 등에서 자르기
-                for sep in ['\n\n', '\n', '. ', '다. ', '요. ']:
-                    last_sep = text[start:end].rfind(sep)
-                    if last_sep > chunk_size // 2:  # 최소 절반 이상일 때만
-                        end = start + last_sep + len(sep)
-                        break
-
-            chunk = text[start:end].strip()
-
-            if len(chunk) >= min_size:
-                chunks.append(chunk)
-            elif chunks:
-                # 너무 작으면 이전 청크에 병합
-                chunks[-1] += " " + chunk
-
-            start = end - overlap
-
-            # 무한 루프 방지
-            if start >= len(text) - min_size:
-                break
-
-        return chunks
+        return block_parser.chunk_text(text, chunk_size, overlap)
 
     def chunk_section(self, section_data: Dict) -> List[Dict]:
         """
@@ -702,16 +954,7 @@ class DartReportAgent:
 
     def _clean_text(self, text: str) -> str:
         """텍스트 정제"""
-        # 연속 공백/줄바꿈 정리
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
-        text = re.sub(r'\t+', ' ', text)
-
-        # 불필요한 문자 제거
-        text = text.replace('\xa0', ' ')
-        text = text.replace('\r', '')
-
-        return text.strip()
+        return block_parser.clean_text(text)
 
     def _parse_table(self, table_element) -> Optional[List[Dict]]:
         """HTML 테이블을 딕셔너리 리스트로 파싱"""
@@ -756,57 +999,7 @@ class DartReportAgent:
         Returns:
             Tuple[str, Dict]: (Markdown 테이블 문자열, 메타데이터)
         """
-        try:
-            # pandas로 테이블 파싱
-            html_str = str(table_element)
-            dfs = pd.read_html(StringIO(html_str), flavor='bs4')
-
-            if not dfs:
-                return "", {}
-
-            df = dfs[0]
-
-            # NaN 처리
-            df = df.fillna('')
-
-            # 메타데이터 추출
-            metadata = {
-                "rows": len(df),
-                "cols": len(df.columns),
-                "columns": [str(col) for col in df.columns.tolist()]
-            }
-
-            # 테이블 제목 추출 시도 (caption 또는 첫 번째 행)
-            caption = table_element.find('caption')
-            if caption:
-                metadata["title"] = caption.get_text(strip=True)
-
-            # Markdown 테이블 생성
-            markdown_lines = []
-
-            # 헤더 행 - 셀 내용 정리
-            headers = []
-            for col in df.columns:
-                header_text = str(col).replace("|", "｜").replace("\n", " ").strip()
-                headers.append(header_text)
-
-            markdown_lines.append("| " + " | ".join(headers) + " |")
-            markdown_lines.append("|" + "|".join(["---"] * len(headers)) + "|")
-
-            # 데이터 행
-            for _, row in df.iterrows():
-                cells = []
-                for val in row:
-                    cell_text = str(val).replace("|", "｜").replace("\n", " ").strip()
-                    cells.append(cell_text)
-                markdown_lines.append("| " + " | ".join(cells) + " |")
-
-            return "\n".join(markdown_lines), metadata
-
-        except Exception as e:
-            # 파싱 실패 시 텍스트로 추출
-            text = table_element.get_text(separator=' ', strip=True)
-            return f"[표 데이터]\n{text}", {"error": str(e)}
+        return block_parser.convert_table_to_markdown(table_element)
 
     def extract_section_sequential(self, report, section_keyword: str) -> Optional[Dict]:
         """
@@ -821,42 +1014,101 @@ class DartReportAgent:
         Returns:
             Dict: {"chapter": str, "blocks": list, "page_count": int}
         """
-        try:
-            result = report.find_all(includes=section_keyword)
-            pages = result.get('pages', [])
+        sections = self.extract_target_sections_sequential(report, section_names=[section_keyword])
+        return sections[0] if sections else None
 
-            if not pages:
-                return None
+    def _fetch_and_parse_pages(self, pages: List[Tuple]) -> Dict[int, Optional[List[Dict]]]:
+        """
+        페이지 HTML을 스레드 풀로 미리 받아 도착하는 순서대로 파싱
 
-            all_blocks = []
-            global_sequence = 0
+        다운로드는 PAGE_FETCH_CONFIG['prefetch_workers']개 스레드가 동시에 진행하고
+        (호출량은 공용 토큰 버킷이 제한), 도착한 HTML은 파싱 프로세스 풀
+        (PARSER_CONFIG['parse_workers'])로 넘겨 나머지 페이지 다운로드와 동시에 파싱합니다.
+        프로세스 풀을 쓰지 않으면 현재 스레드에서 도착 순서대로 파싱합니다.
 
-            for page in pages:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                page_title = getattr(page, 'title', section_keyword)
+        Args:
+            pages: (페이지 객체, 대체 섹션 경로) 튜플 리스트
 
-                # 현재 섹션 경로 초기화
-                current_path = page_title
+        Returns:
+            Dict[int, Optional[List[Dict]]]: id(page) -> 블록 리스트 (실패 시 None)
+        """
+        parsed: Dict[int, Optional[List[Dict]]] = {}
+        parse_futures = {}  # 파싱 Future -> (페이지, 페이지 제목, HTML bytes)
+        workers = min(PAGE_FETCH_CONFIG.get('prefetch_workers', 8), len(pages))
+        pool = self._get_parse_pool() if pages else None
 
-                # 페이지의 블록들을 순차적으로 처리
-                blocks, global_sequence = self._parse_sequential_blocks(
-                    soup.body if soup.body else soup,
-                    current_path,
-                    global_sequence
-                )
-                all_blocks.extend(blocks)
+        def parse_inline(page, page_title, html):
+            try:
+                parsed[id(page)] = block_parser.parse_page_blocks(html, page_title)
+            except Exception as e:
+                print(f"   ⚠️ 페이지 파싱 실패 ({page_title}): {e}")
+                parsed[id(page)] = None
 
-            return {
-                "chapter": section_keyword,
-                "blocks": all_blocks,
-                "page_count": len(pages)
+        def parse(page, fallback_title, fetch):
+            page_title = getattr(page, 'title', fallback_title)
+            try:
+                html = fetch()
+            except Exception as e:
+                print(f"   ⚠️ 페이지 파싱 실패 ({page_title}): {e}")
+                parsed[id(page)] = None
+                return
+
+            if pool is None or self._parse_pool is None:
+                parse_inline(page, page_title, html)
+                return
+            # 프로세스 간 전송은 bytes + 튜플 레코드로 최소화
+            data = html.encode('utf-8')
+            try:
+                future = pool.submit(block_parser.parse_page_records, data, page_title)
+            except BrokenProcessPool:
+                self._reset_parse_pool()
+                parse_inline(page, page_title, data)
+                return
+            parse_futures[future] = (page, page_title, data)
+
+        if self.dart_client is not None:
+            # 비동기 백엔드: 모든 페이지를 이벤트 루프에 제출 (동시 요청 수는 연결 풀/토큰 버킷이 제한)
+            futures = {
+                self._async_loop.submit(self._fetch_page_html_async(page)): (page, fallback_title)
+                for page, fallback_title in pages
             }
+            for future in as_completed(futures):
+                page, fallback_title = futures[future]
+                parse(page, fallback_title, future.result)
+        elif workers <= 1:
+            for page, fallback_title in pages:
+                parse(page, fallback_title, lambda: page.html)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(lambda p: p.html, page): (page, fallback_title)
+                    for page, fallback_title in pages
+                }
+                for future in as_completed(futures):
+                    page, fallback_title = futures[future]
+                    parse(page, fallback_title, future.result)
 
-        except Exception as e:
-            print(f"⚠️ 순차적 섹션 추출 실패 ({section_keyword}): {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        # 파싱 프로세스 결과 수집 (워커가 비정상 종료되면 현재 프로세스에서 다시 파싱)
+        for future in as_completed(parse_futures):
+            page, page_title, data = parse_futures.pop(future)
+            try:
+                parsed[id(page)] = block_parser.records_to_blocks(future.result())
+            except BrokenProcessPool:
+                self._reset_parse_pool()
+                parse_inline(page, page_title, data)
+            except Exception as e:
+                print(f"   ⚠️ 페이지 파싱 실패 ({page_title}): {e}")
+                parsed[id(page)] = None
+
+        return parsed
+
+    async def _fetch_page_html_async(self, page: CachedPage) -> str:
+        """AsyncDartClient로 페이지 HTML 조회 (캐시 우선, 다운로드 시 캐시 저장)"""
+        html = page.cached_html()
+        if html is None:
+            html = await self.dart_client.get_page_html({**page.spec, 'rcp_no': page.rcp_no})
+            page.store(html)
+        return html
 
     def _parse_sequential_blocks(
         self,
@@ -875,98 +1127,7 @@ class DartReportAgent:
         Returns:
             Tuple[List[Dict], int]: (블록 리스트, 다음 시퀀스 번호)
         """
-        blocks = []
-        sequence = start_sequence
-        text_buffer = []  # 텍스트 누적 버퍼
-
-        # 헤더 태그 패턴
-        header_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-
-        def flush_text_buffer():
-            """누적된 텍스트를 블록으로 저장"""
-            nonlocal sequence
-            if text_buffer:
-                combined_text = '\n'.join(text_buffer).strip()
-                combined_text = self._clean_text(combined_text)
-
-                if len(combined_text) >= CHUNK_CONFIG['min_chunk_size']:
-                    # 청크 크기가 크면 분할
-                    chunks = self.chunk_text(combined_text)
-                    for chunk in chunks:
-                        blocks.append({
-                            "chunk_type": "text",
-                            "section_path": current_path,
-                            "content": chunk,
-                            "sequence_order": sequence,
-                            "table_metadata": None
-                        })
-                        sequence += 1
-                text_buffer.clear()
-
-        def process_element(element):
-            """단일 요소 처리"""
-            nonlocal current_path, sequence
-
-            if isinstance(element, NavigableString):
-                text = str(element).strip()
-                if text:
-                    text_buffer.append(text)
-                return
-
-            if not isinstance(element, Tag):
-                return
-
-            tag_name = element.name
-
-            # 1. 헤더 태그 -> 경로 업데이트
-            if tag_name in header_tags:
-                flush_text_buffer()
-                header_text = element.get_text(strip=True)
-                if header_text:
-                    current_path = self._update_section_path(current_path, header_text, tag_name)
-                return
-
-            # 2. 테이블 -> 'table' 타입으로 저장
-            if tag_name == 'table':
-                flush_text_buffer()
-                markdown_table, table_meta = self.convert_table_to_markdown(element)
-                if markdown_table:
-                    blocks.append({
-                        "chunk_type": "table",
-                        "section_path": current_path,
-                        "content": markdown_table,
-                        "sequence_order": sequence,
-                        "table_metadata": table_meta
-                    })
-                    sequence += 1
-                return
-
-            # 3. 텍스트를 포함하는 블록 요소 (p, div, span 등)
-            if tag_name in ['p', 'li', 'span', 'td', 'th']:
-                text = element.get_text(strip=True)
-                if text:
-                    text_buffer.append(text)
-                return
-
-            # 4. 컨테이너 요소는 자식 순회
-            if tag_name in ['div', 'section', 'article', 'body', 'tr', 'tbody', 'thead']:
-                for child in element.children:
-                    process_element(child)
-                return
-
-            # 5. 기타 태그는 텍스트 추출
-            text = element.get_text(strip=True)
-            if text:
-                text_buffer.append(text)
-
-        # 컨테이너의 직계 자식들 순회
-        for child in container.children:
-            process_element(child)
-
-        # 남은 텍스트 버퍼 처리
-        flush_text_buffer()
-
-        return blocks, sequence
+        return block_parser.parse_sequential_blocks(container, current_path, start_sequence)
 
     def _update_section_path(self, current_path: str, header_text: str, tag_name: str) -> str:
         """
@@ -980,48 +1141,134 @@ class DartReportAgent:
         Returns:
             str: 업데이트된 경로
         """
-        # 헤더 레벨 추출 (h1=1, h2=2, ...)
-        level = int(tag_name[1])
+        return block_parser.update_section_path(current_path, header_text, tag_name)
 
-        # 경로를 ' > '로 분할
-        path_parts = current_path.split(' > ') if current_path else []
-
-        # 현재 레벨에 맞게 경로 조정
-        # h1은 루트, h2는 첫 번째 하위, ...
-        if level <= len(path_parts):
-            path_parts = path_parts[:level-1]
-
-        path_parts.append(header_text)
+    def extract_target_sections_sequential(self, report, section_names: List[str] = None) -> List[Dict]:
+        """
+        핵심 섹션들을 순차적 블록 처리 방식으로 추출 (단일 패스)
 
-        return ' > '.join(path_parts)
+        iter_target_section_blocks()의 페이지별 블록을 섹션 단위로 모읍니다.
+        보고서 전체 블록을 메모리에 올리지 않으려면 iter_target_section_blocks()를 직접 사용합니다.
 
-    def extract_target_sections_sequential(self, report) -> List[Dict]:
-        """
-        핵심 섹션들을 순차적 블록 처리 방식으로 추출
+        Args:
+            report: DART 보고서 객체
+            section_names: 추출할 섹션 키워드 목록 (기본: config의 TARGET_SECTIONS)
 
         Returns:
-            List[Dict]: 추출된 섹션 정보 리스트
+            List[Dict]: 추출된 섹션 정보 리스트 (section_names 순서)
         """
         extracted = []
-        global_sequence = 0  # 전체 문서에서 연속되는 시퀀스 번호
+        for section_name, page_blocks in self.iter_target_section_blocks(report, section_names):
+            if not extracted or extracted[-1]['chapter'] != section_name:
+                extracted.append({"chapter": section_name, "blocks": [], "page_count": 0})
+            extracted[-1]['blocks'].extend(page_blocks)
+            extracted[-1]['page_count'] += 1
+
+        for section in extracted:
+            blocks = section['blocks']
+            text_blocks = sum(1 for b in blocks if b['chunk_type'] == 'text')
+            table_blocks = sum(1 for b in blocks if b['chunk_type'] == 'table')
+            print(f"   ✅ '{section['chapter']}' 추출 완료 "
+                  f"({section['page_count']}페이지, {len(blocks)}블록: 텍스트 {text_blocks}, 테이블 {table_blocks})")
 
-        for section_name in TARGET_SECTIONS:
-            section_data = self.extract_section_sequential(report, section_name)
-            if section_data:
-                # 시퀀스 번호를 전역적으로 재조정
-                blocks = section_data.get('blocks', [])
-                for block in blocks:
-                    block['sequence_order'] = global_sequence
-                    global_sequence += 1
+        return extracted
 
-                extracted.append(section_data)
-                block_count = len(blocks)
-                text_blocks = sum(1 for b in blocks if b['chunk_type'] == 'text')
-                table_blocks = sum(1 for b in blocks if b['chunk_type'] == 'table')
-                print(f"   ✅ '{section_name}' 추출 완료 "
-                      f"({section_data['page_count']}페이지, {block_count}블록: 텍스트 {text_blocks}, 테이블 {table_blocks})")
-            else:
+    def iter_target_section_blocks(
+        self,
+        report,
+        section_names: List[str] = None,
+        strict: bool = False
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        핵심 섹션들의 블록을 페이지 단위로 생성 (스트리밍)
+
+        보고서의 페이지 목록을 한 번만 순회하며 각 페이지를 모든 대상 섹션에 분류하고,
+        페이지 HTML은 여러 섹션에 걸쳐 있어도 한 번만 받아 파싱합니다.
+        페이지는 PAGE_FETCH_CONFIG['stream_window']개씩 병렬로 받아 파싱한 뒤 순서대로 반환하므로
+        보고서 크기와 관계없이 메모리에는 최대 한 구간 분량의 블록만 유지됩니다.
+
+        Args:
+            report: DART 보고서 객체
+            section_names: 추출할 섹션 키워드 목록 (기본: config의 TARGET_SECTIONS)
+            strict: True면 페이지 목록 조회나 페이지 수집/파싱이 실패할 때 ReportFetchError 발생
+                (DB 적재처럼 일부 페이지가 빠진 결과를 쓰면 안 되는 경우)
+
+        Yields:
+            Tuple[str, List[Dict]]: (섹션명, 페이지 블록 리스트) - section_names / 페이지 순서,
+                sequence_order는 보고서 전체에서 연속 (strict가 아니면 파싱 실패 페이지는 빈 리스트)
+
+        Raises:
+            ReportFetchError: strict 모드에서 페이지 목록 조회 또는 페이지 수집/파싱 실패
+        """
+        section_names = section_names or TARGET_SECTIONS
+
+        try:
+            pages = self.get_report_pages(report)
+        except Exception as e:
+            print(f"⚠️ 페이지 목록 조회 실패: {e}")
+            if strict:
+                raise ReportFetchError(f"페이지 목록 조회 실패: {e}") from e
+            return
+
+        # 1. 페이지 목록 1회 순회: 제목 기준으로 섹션 분류 (find_all(includes=...)와 동일한 매칭 규칙)
+        matchers = [(name, str_to_regex(name)) for name in section_names]
+        section_pages = {name: [] for name in section_names}
+        for page in pages:
+            title = getattr(page, 'title', '') or ''
+            for name, regex in matchers:
+                if regex.search(title):
+                    section_pages[name].append(page)
+
+        # 2. 섹션 순서대로 (섹션, 페이지) 나열, 여러 섹션에 속한 페이지는 한 번만 파싱
+        entries = []
+        remaining_uses: Dict[int, int] = {}  # id(page) -> 남은 사용 횟수
+        unique_pages = []
+        for section_name in section_names:
+            if not section_pages[section_name]:
                 print(f"   ⚠️ '{section_name}' 섹션 없음")
+            for page in section_pages[section_name]:
+                entries.append((section_name, page))
+                if id(page) not in remaining_uses:
+                    unique_pages.append((page, section_name))
+                remaining_uses[id(page)] = remaining_uses.get(id(page), 0) + 1
+
+        # 3. 구간별 병렬 수집 + 파싱 결과를 순서대로 반환
+        parsed_stream = self._iter_parsed_pages(unique_pages)
+        reused: Dict[int, Optional[List[Dict]]] = {}
+        global_sequence = 0  # 전체 문서에서 연속되는 시퀀스 번호
 
-        return extracted
+        for section_name, page in entries:
+            if id(page) not in reused:
+                _, page_blocks = next(parsed_stream)
+                if page_blocks is None and strict:
+                    raise ReportFetchError(f"페이지 수집/파싱 실패: {getattr(page, 'title', section_name)}")
+                reused[id(page)] = page_blocks
+            page_blocks = reused[id(page)]
+
+            remaining_uses[id(page)] -= 1
+            if not remaining_uses[id(page)]:
+                del reused[id(page)]
+
+            # 여러 섹션에 속한 페이지는 블록 사본을 사용 (시퀀스 번호 독립)
+            blocks = [dict(block) for block in page_blocks or []]
+            for block in blocks:
+                block['sequence_order'] = global_sequence
+                global_sequence += 1
+            yield section_name, blocks
+
+    def _iter_parsed_pages(self, pages: List[Tuple]) -> Iterator[Tuple[object, Optional[List[Dict]]]]:
+        """
+        페이지를 stream_window개씩 _fetch_and_parse_pages()로 처리해 입력 순서대로 반환
 
+        Args:
+            pages: (페이지 객체, 대체 섹션 경로) 튜플 리스트
+
+        Yields:
+            Tuple: (페이지 객체, 블록 리스트 (실패 시 None))
+        """
+        window = max(PAGE_FETCH_CONFIG.get('stream_window', 32), 1)
+        for start in range(0, len(pages), window):
+            chunk = pages[start:start + window]
+            parsed = self._fetch_and_parse_pages(chunk)
+            for page, _ in chunk:
+                yield page, parsed.pop(id(page), None)
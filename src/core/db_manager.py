@@ -1,42 +1,99 @@
 """
 DB Manager 모듈 - PostgreSQL 데이터베이스 연결 및 CRUD 작업 관리
 """
+import io
+import csv
+import time
+import weakref
 import psycopg2
-from psycopg2.extras import Json
-from typing import Optional, List, Dict
-from config import DB_CONFIG, EMBEDDING_CONFIG
+from contextlib import contextmanager
+from psycopg2 import errors, extensions
+from psycopg2.extras import Json, execute_values
+from typing import Optional, List, Dict, Iterable, Tuple, Set, NamedTuple, Sequence, Union
+from config import DB_WRITE_CONFIG, EMBEDDING_CONFIG, VECTOR_INDEX_CONFIG
+from .db_pool import ConnectionPool, get_pool
+
+# 리포트 적재 상태 (ingest_report는 커밋 직전에만 완료 상태로 변경)
+REPORT_STATUS_LOADING = 'Loading'
+REPORT_STATUS_LOADED = 'Raw_Loaded'
+
+# 벡터 인덱스 거리 함수별 (연산자 클래스, 거리 연산자)
+VECTOR_OPS = {
+    'cosine': 'vector_cosine_ops',
+    'l2': 'vector_l2_ops',
+    'ip': 'vector_ip_ops'
+}
+VECTOR_DISTANCE = {
+    'cosine': '<=>',
+    'l2': '<->',
+    'ip': '<#>'
+}
+
+# 유사도 검색 prepared statement (연결별 1회 PREPARE, 필터는 NULL이면 무시)
+SEARCH_STATEMENT = "search_similar_chunks"
+HNSW_MAX_EF_SEARCH = 1000  # pgvector hnsw.ef_search 상한 (검색 가능한 최대 k)
+_prepared_connections = weakref.WeakSet()  # search_similar_chunks를 PREPARE한 연결
+_pgvector_iterative_scan: Optional[bool] = None  # pgvector 0.8+ 여부 (프로세스당 1회 확인)
+_query_embedder = None
+
+
+class SimilarChunk(NamedTuple):
+    """유사도 검색 결과 행"""
+    id: int
+    report_id: int
+    chunk_type: str
+    section_path: Optional[str]
+    sequence_order: int
+    content: str
+    distance: float
 
 
 class DBManager:
     """
     PostgreSQL 데이터베이스 연결 및 데이터 조작을 담당하는 클래스
     Context Manager 패턴을 지원하여 with 구문 사용이 가능합니다.
+    with 구문마다 프로세스 공용 커넥션 풀(db_pool)에서 연결을 대여하고 종료 시 반납합니다.
     """
 
-    def __init__(self):
+    def __init__(self, pool: Optional[ConnectionPool] = None):
+        """
+        Args:
+            pool: 연결을 대여할 커넥션 풀 (기본: 프로세스 공용 풀)
+        """
         self.conn = None
         self.cursor = None
-        self.db_config = DB_CONFIG
+        self.pool = pool
+        self._section_path_ids: Dict[str, int] = {}  # 섹션 경로 → Section_Paths.id 캐시 (DBManager 인스턴스 단위)
 
     def __enter__(self):
-        """Context Manager 진입: DB 연결"""
+        """Context Manager 진입: 풀에서 DB 연결 대여"""
         try:
-            self.conn = psycopg2.connect(**self.db_config)
+            self.pool = self.pool or get_pool()
+            self.conn = self.pool.getconn()
             self.cursor = self.conn.cursor()
             return self
         except psycopg2.Error as e:
+            if self.conn:
+                self.pool.putconn(self.conn)
+                self.conn = None
             print(f"❌ DB 연결 실패: {e}")
             raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context Manager 종료: 연결 해제"""
+        """Context Manager 종료: 커밋/롤백 후 연결 반납"""
         if self.conn:
-            if exc_type:
-                self.conn.rollback()
-                print(f"⚠️ 트랜잭션 롤백: {exc_val}")
-            else:
-                self.conn.commit()
-            self.conn.close()
+            try:
+                if exc_type:
+                    self._rollback()
+                    print(f"⚠️ 트랜잭션 롤백: {exc_val}")
+                else:
+                    self.conn.commit()
+            finally:
+                if not self.cursor.closed:
+                    self.cursor.close()
+                self.pool.putconn(self.conn)
+                self.conn = None
+                self.cursor = None
 
     # ==================== 스키마 관리 ====================
 
@@ -45,14 +102,17 @@ class DBManager:
         try:
             print("💥 기존 테이블 삭제 중...")
             self.cursor.execute('DROP TABLE IF EXISTS "Generated_Reports" CASCADE;')
+            self.cursor.execute('DROP TABLE IF EXISTS "Table_Cells" CASCADE;')
             self.cursor.execute('DROP TABLE IF EXISTS "Source_Materials" CASCADE;')
+            self.cursor.execute('DROP TABLE IF EXISTS "Section_Paths" CASCADE;')
             self.cursor.execute('DROP TABLE IF EXISTS "Analysis_Reports" CASCADE;')
             self.cursor.execute('DROP TABLE IF EXISTS "Companies" CASCADE;')
             self.conn.commit()
+            self._section_path_ids.clear()  # 삭제된 Section_Paths의 ID
             print("🧹 DB 초기화 완료")
             self.init_db()
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ DB 리셋 실패: {e}")
             raise
 
@@ -96,22 +156,39 @@ class DBManager:
                 );
             """)
 
-            # 3. 원천 데이터 테이블 (순차적 블록 처리 - 텍스트/테이블 통합)
+            # 3. 섹션 경로 사전 테이블 (반복되는 경로 문자열을 정수 ID로 참조)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS "Section_Paths" (
+                    id SERIAL PRIMARY KEY,
+                    section_path TEXT UNIQUE NOT NULL
+                );
+            """)
+
+            # 4. 원천 데이터 테이블 (순차적 블록 처리 - 텍스트/테이블 통합)
             self.cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS "Source_Materials" (
                     id SERIAL PRIMARY KEY,
                     report_id INTEGER REFERENCES "Analysis_Reports"(id) ON DELETE CASCADE,
                     chunk_type VARCHAR(20) NOT NULL DEFAULT 'text',
-                    section_path TEXT,
+                    section_path_id INTEGER REFERENCES "Section_Paths"(id),
                     sequence_order INTEGER,
                     raw_content TEXT,
                     table_metadata JSONB,
+                    token_count INTEGER,
                     embedding vector({EMBEDDING_CONFIG['dimension']}),
                     metadata JSONB,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
             """)
 
+            # 기존 DB에 임베딩 토크나이저 기준 토큰 수 컬럼 추가
+            self.cursor.execute("""
+                ALTER TABLE "Source_Materials" ADD COLUMN IF NOT EXISTS token_count INTEGER;
+            """)
+
+            # 기존 DB의 section_path 문자열 컬럼을 Section_Paths 참조로 이관
+            self._migrate_section_paths()
+
             # 인덱스 추가 (순차적 블록 처리 지원)
             self.cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_source_materials_report_sequence 
@@ -123,7 +200,46 @@ class DBManager:
                 ON "Source_Materials"(report_id, chunk_type);
             """)
 
-            # 4. AI 생성 리포트 테이블
+            # 섹션 범위 검색용 인덱스 (정수 비교)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_source_materials_section_path 
+                ON "Source_Materials"(section_path_id);
+            """)
+
+            # 5. 테이블 수치 셀 (테이블 블록의 정규화된 수치, COPY로 적재)
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS "Table_Cells" (
+                    report_id INTEGER NOT NULL REFERENCES "Analysis_Reports"(id) ON DELETE CASCADE,
+                    sequence_order INTEGER NOT NULL,
+                    row_idx INTEGER NOT NULL,
+                    col_idx INTEGER NOT NULL,
+                    row_label TEXT,
+                    col_label TEXT,
+                    value_text TEXT,
+                    value NUMERIC NOT NULL,
+                    unit TEXT,
+                    scale NUMERIC NOT NULL DEFAULT 1,
+                    amount NUMERIC GENERATED ALWAYS AS (value * scale) STORED
+                );
+            """)
+
+            # 기존 DB의 단위 컬럼 길이 제한 해제 (긴 단위 표기로 COPY가 실패하지 않도록)
+            self.cursor.execute("""
+                ALTER TABLE "Table_Cells" ALTER COLUMN unit TYPE TEXT;
+            """)
+
+            # 블록 조인 (Source_Materials.report_id, sequence_order) / 기업 간 항목 비교용 인덱스
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_table_cells_block 
+                ON "Table_Cells"(report_id, sequence_order);
+            """)
+
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_table_cells_row_label 
+                ON "Table_Cells"(row_label, col_label);
+            """)
+
+            # 6. AI 생성 리포트 테이블
             self.cursor.execute("""
                 CREATE TABLE IF NOT EXISTS "Generated_Reports" (
                     id SERIAL PRIMARY KEY,
@@ -153,10 +269,40 @@ class DBManager:
             self.conn.commit()
             print("🛠️ DB 테이블 생성/확인 완료")
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ DB 생성 실패: {e}")
             raise
 
+    def _migrate_section_paths(self):
+        """Source_Materials.section_path (TEXT) → section_path_id 이관 (기존 컬럼이 있을 때만)"""
+        self.cursor.execute("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'Source_Materials' AND column_name = 'section_path'
+        """)
+        if not self.cursor.fetchone():
+            return
+
+        print("🔄 section_path 컬럼을 Section_Paths 참조로 이관 중...")
+        self.cursor.execute("""
+            ALTER TABLE "Source_Materials" 
+            ADD COLUMN IF NOT EXISTS section_path_id INTEGER REFERENCES "Section_Paths"(id);
+        """)
+        self.cursor.execute("""
+            INSERT INTO "Section_Paths" (section_path)
+            SELECT DISTINCT section_path FROM "Source_Materials" WHERE section_path IS NOT NULL
+            ON CONFLICT (section_path) DO NOTHING;
+        """)
+        self.cursor.execute("""
+            UPDATE "Source_Materials" sm SET section_path_id = sp.id
+            FROM "Section_Paths" sp WHERE sp.section_path = sm.section_path;
+        """)
+        self.cursor.execute('ALTER TABLE "Source_Materials" DROP COLUMN section_path;')
+
+    def _rollback(self):
+        """트랜잭션 롤백 (커밋되지 않은 섹션 경로 ID가 캐시에 남지 않도록 캐시도 비움)"""
+        self.conn.rollback()
+        self._section_path_ids.clear()
+
     # ==================== 기업 관리 ====================
 
     def insert_company(
@@ -173,26 +319,37 @@ class DBManager:
             int: Company ID
         """
         try:
-            sql = """
-                INSERT INTO "Companies" (company_name, corp_code, stock_code, industry)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (company_name) 
-                DO UPDATE SET 
-                    corp_code = EXCLUDED.corp_code,
-                    stock_code = EXCLUDED.stock_code,
-                    industry = COALESCE(EXCLUDED.industry, "Companies".industry),
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id;
-            """
-            self.cursor.execute(sql, (name, corp_code, stock_code, industry))
-            result = self.cursor.fetchone()
+            company_id = self._upsert_company(name, corp_code, stock_code, industry)
             self.conn.commit()
-            return result[0] if result else None
+            return company_id
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ 기업 등록 실패 ({name}): {e}")
             raise
 
+    def _upsert_company(
+        self,
+        name: str,
+        corp_code: str,
+        stock_code: str,
+        industry: Optional[str] = None
+    ) -> Optional[int]:
+        """기업 UPSERT (커밋은 호출한 메서드가 수행)"""
+        sql = """
+            INSERT INTO "Companies" (company_name, corp_code, stock_code, industry)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (company_name) 
+            DO UPDATE SET 
+                corp_code = EXCLUDED.corp_code,
+                stock_code = EXCLUDED.stock_code,
+                industry = COALESCE(EXCLUDED.industry, "Companies".industry),
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id;
+        """
+        self.cursor.execute(sql, (name, corp_code, stock_code, industry))
+        result = self.cursor.fetchone()
+        return result[0] if result else None
+
     def get_company_by_corp_code(self, corp_code: str) -> Optional[Dict]:
         """법인코드로 기업 조회"""
         sql = 'SELECT id, company_name, corp_code, stock_code FROM "Companies" WHERE corp_code = %s'
@@ -245,16 +402,60 @@ class DBManager:
             self.conn.commit()
             return self.cursor.fetchone()[0]
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ 리포트 생성 실패: {e}")
             raise
 
+    def _upsert_report(self, company_id: int, info: Dict, status: str) -> int:
+        """리포트 헤더 UPSERT (rcept_no 기준, 커밋은 호출한 메서드가 수행)"""
+        sql = """
+            INSERT INTO "Analysis_Reports" 
+            (company_id, title, rcept_no, rcept_dt, report_type, basic_info, status)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (rcept_no) 
+            DO UPDATE SET 
+                company_id = EXCLUDED.company_id,
+                title = EXCLUDED.title,
+                rcept_dt = EXCLUDED.rcept_dt,
+                report_type = EXCLUDED.report_type,
+                basic_info = EXCLUDED.basic_info,
+                status = EXCLUDED.status
+            RETURNING id;
+        """
+        self.cursor.execute(sql, (
+            company_id,
+            info.get('title'),
+            info.get('rcept_no'),
+            info.get('rcept_dt'),
+            info.get('report_type', 'annual'),
+            Json(info),
+            status
+        ))
+        return self.cursor.fetchone()[0]
+
     def update_report_status(self, report_id: int, status: str):
         """리포트 상태 업데이트"""
         sql = 'UPDATE "Analysis_Reports" SET status = %s WHERE id = %s'
         self.cursor.execute(sql, (status, report_id))
         self.conn.commit()
 
+    def get_loaded_rcept_nos(self, rcept_nos: Iterable[str]) -> Set[str]:
+        """
+        적재가 완료된 접수번호 일괄 조회 (수집 전 사전 필터용, 쿼리 1회)
+
+        Args:
+            rcept_nos: 후보 접수번호 목록
+
+        Returns:
+            Set[str]: 상태가 REPORT_STATUS_LOADED인 리포트의 접수번호
+        """
+        candidates = list({rcept_no for rcept_no in rcept_nos if rcept_no})
+        if not candidates:
+            return set()
+        sql = 'SELECT rcept_no FROM "Analysis_Reports" WHERE rcept_no = ANY(%s) AND status = %s'
+        self.cursor.execute(sql, (candidates, REPORT_STATUS_LOADED))
+        return {row[0] for row in self.cursor.fetchall()}
+
     def get_report_by_rcept_no(self, rcept_no: str) -> Optional[Dict]:
         """접수번호로 리포트 조회"""
         sql = 'SELECT id, company_id, title, status FROM "Analysis_Reports" WHERE rcept_no = %s'
@@ -269,8 +470,94 @@ class DBManager:
             }
         return None
 
+    # ==================== 보고서 적재 ====================
+
+    def ingest_report(
+        self,
+        name: str,
+        corp_code: str,
+        stock_code: str,
+        info: Dict,
+        block_pages: Iterable[List[Dict]],
+        industry: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Tuple[int, int]:
+        """
+        기업/리포트 UPSERT와 블록 교체를 한 트랜잭션으로 적재
+
+        같은 rcept_no의 기존 블록(수치 셀 포함)은 삭제 후 다시 저장하므로 재실행해도 블록이
+        중복되지 않고, 도중에 실패하면 전체가 롤백되어 일부 블록만 남는 리포트가 생기지 않습니다.
+        리포트 상태는 커밋 직전에만 완료(REPORT_STATUS_LOADED)로 바뀝니다.
+        block_pages는 페이지 단위로 읽으며 저장하므로 보고서 전체 블록을 메모리에 올리지 않습니다.
+        트랜잭션 동안 기업/리포트 행 잠금을 잡으므로 다운로드/파싱이 끝난 블록을 넘겨야 합니다.
+        (파이프라인은 블록을 BlockSpool 임시 파일에 기록한 뒤 넘김)
+
+        Args:
+            name: 기업명
+            corp_code: 고유번호
+            stock_code: 종목코드
+            info: 보고서 정보 dict (title, rcept_no, rcept_dt 등)
+            block_pages: 페이지별 블록 리스트 스트림 (수집이 끝난 블록, 예: BlockSpool)
+            industry: 업종 (선택)
+            metadata: 블록 공통 메타데이터
+
+        Returns:
+            Tuple[int, int]: (Report ID, 저장된 블록 수)
+        """
+        try:
+            company_id = self._upsert_company(name, corp_code, stock_code, industry)
+            report_id = self._upsert_report(company_id, info, REPORT_STATUS_LOADING)
+
+            self.cursor.execute('DELETE FROM "Table_Cells" WHERE report_id = %s', (report_id,))
+            self.cursor.execute('DELETE FROM "Source_Materials" WHERE report_id = %s', (report_id,))
+
+            count = 0
+            for blocks in block_pages:
+                if blocks:
+                    count += len(self._insert_materials(report_id, blocks, metadata))
+
+            self.cursor.execute(
+                'UPDATE "Analysis_Reports" SET status = %s WHERE id = %s',
+                (REPORT_STATUS_LOADED, report_id)
+            )
+            self.conn.commit()
+            return report_id, count
+        except Exception as e:
+            self._rollback()
+            print(f"❌ 보고서 적재 실패 ({name}, {info.get('rcept_no')}): {e}")
+            raise
+
     # ==================== 원천 데이터 관리 ====================
 
+    def get_section_path_ids(self, section_paths: Iterable[Optional[str]]) -> Dict[str, int]:
+        """
+        섹션 경로 문자열 → Section_Paths.id 조회 (없는 경로는 추가)
+
+        DBManager 인스턴스 단위 캐시에 없는 경로만 INSERT ... ON CONFLICT DO NOTHING 후 SELECT로 조회합니다.
+        (롤백/reset_db 시 캐시를 비우며, 다른 인스턴스가 Section_Paths를 삭제한 경우는 감지하지 않음)
+        이미 있는 경로의 행을 갱신하지 않으므로 트랜잭션이 끝날 때까지 행 잠금을 잡지 않습니다.
+        (커밋은 호출한 저장 메서드가 수행)
+
+        Args:
+            section_paths: 섹션 경로 목록 (None/빈 문자열은 무시)
+
+        Returns:
+            Dict[str, int]: 섹션 경로 → ID
+        """
+        missing = {path for path in section_paths if path and path not in self._section_path_ids}
+        if missing:
+            missing = sorted(missing)
+            execute_values(self.cursor, """
+                INSERT INTO "Section_Paths" (section_path) VALUES %s
+                ON CONFLICT (section_path) DO NOTHING
+            """, [(path,) for path in missing])
+            self.cursor.execute(
+                'SELECT section_path, id FROM "Section_Paths" WHERE section_path = ANY(%s)',
+                (missing,)
+            )
+            self._section_path_ids.update(self.cursor.fetchall())
+        return self._section_path_ids
+
     def insert_source_material(
         self,
         report_id: int,
@@ -280,7 +567,9 @@ class DBManager:
         sequence_order: Optional[int] = None,
         table_metadata: Optional[Dict] = None,
         embedding: Optional[List[float]] = None,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        token_count: Optional[int] = None,
+        section_path_id: Optional[int] = None
     ) -> bool:
         """
         순차적 블록 저장 (텍스트 또는 테이블)
@@ -294,13 +583,18 @@ class DBManager:
             table_metadata: 테이블 메타데이터 (단위, 제목 등)
             embedding: 임베딩 벡터 (선택)
             metadata: 추가 메타데이터 (선택)
+            token_count: 임베딩 토크나이저 기준 토큰 수 (토큰 기준 청킹 시)
+            section_path_id: Section_Paths ID (주어지면 section_path 조회 생략)
         """
         try:
+            if section_path_id is None and section_path:
+                section_path_id = self.get_section_path_ids([section_path])[section_path]
+
             sql = """
                 INSERT INTO "Source_Materials" 
-                (report_id, chunk_type, section_path, sequence_order, 
-                 raw_content, table_metadata, embedding, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+                (report_id, chunk_type, section_path_id, sequence_order, 
+                 raw_content, table_metadata, token_count, embedding, metadata)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
             """
             meta = metadata or {}
             meta["length"] = len(content)
@@ -309,17 +603,18 @@ class DBManager:
             self.cursor.execute(sql, (
                 report_id,
                 chunk_type,
-                section_path,
+                section_path_id,
                 sequence_order,
                 content,
                 Json(table_metadata) if table_metadata else None,
+                token_count,
                 embedding,
                 Json(meta)
             ))
             self.conn.commit()
             return True
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ 원천 데이터 저장 실패: {e}")
             return False
 
@@ -328,9 +623,13 @@ class DBManager:
         report_id: int,
         blocks: List[Dict],
         metadata: Optional[Dict] = None
-    ) -> int:
+    ) -> List[int]:
         """
-        여러 블록을 배치로 저장 (순차적 블록 처리)
+        여러 블록을 한 트랜잭션으로 일괄 저장 (순차적 블록 처리)
+
+        블록마다 INSERT/커밋하지 않고 다중 행 INSERT ... RETURNING id와
+        테이블 수치 셀 COPY를 한 번의 커밋으로 처리합니다.
+        실패하면 전체를 롤백하므로 일부 블록만 저장되는 일이 없습니다.
 
         Args:
             report_id: 리포트 ID
@@ -338,30 +637,98 @@ class DBManager:
             metadata: 공통 메타데이터
 
         Returns:
-            int: 저장된 블록 수
+            List[int]: 저장된 블록 ID (blocks 순서, 실패 시 빈 리스트)
         """
+        if not blocks:
+            return []
+
+        try:
+            ids = self._insert_materials(report_id, blocks, metadata)
+            self.conn.commit()
+            return ids
+        except Exception as e:
+            self._rollback()
+            print(f"❌ 원천 데이터 일괄 저장 실패: {e}")
+            return []
+
+    def _insert_materials(self, report_id: int, blocks: List[Dict], metadata: Optional[Dict] = None) -> List[int]:
+        """블록 다중 행 INSERT + 수치 셀 COPY (커밋은 호출한 메서드가 수행)"""
+        path_ids = self.get_section_path_ids(block.get('section_path') for block in blocks)
+        rows = []
+        for idx, block in enumerate(blocks):
+            content = block.get('content', '')
+            table_metadata = block.get('table_metadata')
+            rows.append((
+                report_id,
+                block.get('chunk_type', 'text'),
+                path_ids.get(block.get('section_path')),
+                block.get('sequence_order', idx),
+                content,
+                Json(table_metadata) if table_metadata else None,
+                block.get('token_count'),
+                Json({**(metadata or {}), "length": len(content), "has_embedding": False})
+            ))
+
+        inserted = execute_values(self.cursor, """
+            INSERT INTO "Source_Materials" 
+            (report_id, chunk_type, section_path_id, sequence_order, 
+             raw_content, table_metadata, token_count, metadata)
+            VALUES %s
+            RETURNING id
+        """, rows, page_size=DB_WRITE_CONFIG['insert_page_size'], fetch=True)
+        self._copy_table_cells(report_id, blocks)
+        return [row[0] for row in inserted]
+
+    def copy_table_cells(self, report_id: int, blocks: List[Dict]) -> int:
+        """
+        테이블 블록의 수치 셀을 COPY로 일괄 적재
+
+        Args:
+            report_id: 리포트 ID
+            blocks: 블록 리스트 (table_cells가 있는 블록만 적재)
+
+        Returns:
+            int: 적재된 셀 수
+        """
+        try:
+            count = self._copy_table_cells(report_id, blocks)
+            self.conn.commit()
+            return count
+        except Exception as e:
+            self._rollback()
+            print(f"❌ 테이블 수치 셀 적재 실패: {e}")
+            return 0
+
+    def _copy_table_cells(self, report_id: int, blocks: List[Dict]) -> int:
+        """수치 셀 COPY (커밋은 호출한 메서드가 수행)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
         count = 0
         for idx, block in enumerate(blocks):
-            if self.insert_source_material(
-                report_id=report_id,
-                content=block.get('content', ''),
-                chunk_type=block.get('chunk_type', 'text'),
-                section_path=block.get('section_path'),
-                sequence_order=block.get('sequence_order', idx),
-                table_metadata=block.get('table_metadata'),
-                metadata=metadata
-            ):
+            for row_idx, col_idx, row_label, col_label, value_text, value, unit, scale in block.get('table_cells') or []:
+                writer.writerow((
+                    report_id, block.get('sequence_order', idx), row_idx, col_idx,
+                    row_label, col_label, value_text, value, unit, scale
+                ))
                 count += 1
+        if count:
+            buffer.seek(0)
+            self.cursor.copy_expert("""
+                COPY "Table_Cells"
+                (report_id, sequence_order, row_idx, col_idx, row_label, col_label, value_text, value, unit, scale)
+                FROM STDIN WITH (FORMAT csv)
+            """, buffer)
         return count
 
     def get_materials_by_report(self, report_id: int) -> List[Dict]:
         """리포트의 모든 원천 데이터 조회 (순서대로)"""
         sql = """
-            SELECT id, chunk_type, section_path, sequence_order, 
-                   raw_content, table_metadata, metadata 
-            FROM "Source_Materials" 
-            WHERE report_id = %s 
-            ORDER BY sequence_order
+            SELECT sm.id, sm.chunk_type, sp.section_path, sm.sequence_order, 
+                   sm.raw_content, sm.table_metadata, sm.metadata 
+            FROM "Source_Materials" sm
+            LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+            WHERE sm.report_id = %s 
+            ORDER BY sm.sequence_order
         """
         self.cursor.execute(sql, (report_id,))
         rows = self.cursor.fetchall()
@@ -442,10 +809,321 @@ class DBManager:
                 return None
 
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"❌ AI 리포트 저장 실패 ({company_name} - {topic}): {e}")
             return None
 
+    # ==================== 벡터 인덱스 관리 ====================
+
+    def get_vector_index(self, name: Optional[str] = None) -> Optional[Dict]:
+        """
+        임베딩 벡터 인덱스 정보 조회
+
+        Returns:
+            Dict: name, method(hnsw/ivfflat), valid, size_bytes, size, definition (없으면 None)
+        """
+        name = name or VECTOR_INDEX_CONFIG['name']
+        with self._lookup():
+            self.cursor.execute("""
+                SELECT am.amname, i.indisvalid, pg_relation_size(c.oid),
+                       pg_size_pretty(pg_relation_size(c.oid)), pg_get_indexdef(c.oid)
+                FROM pg_class c
+                JOIN pg_index i ON i.indexrelid = c.oid
+                JOIN pg_am am ON am.oid = c.relam
+                WHERE c.relname = %s AND c.relkind = 'i'
+            """, (name,))
+            row = self.cursor.fetchone()
+        if not row:
+            return None
+        return {
+            "name": name,
+            "method": row[0],
+            "valid": row[1],
+            "size_bytes": row[2],
+            "size": row[3],
+            "definition": row[4]
+        }
+
+    def create_vector_index(
+        self,
+        method: Optional[str] = None,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        lists: Optional[int] = None,
+        name: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        임베딩 벡터 인덱스 생성 (CREATE INDEX CONCURRENTLY - 적재/검색을 막지 않음)
+
+        대량 임베딩 중에는 인덱스 갱신 비용이 크므로 임베딩 완료 후 생성합니다.
+        이미 유효한 인덱스가 있으면 그대로 두고, 실패한 빌드가 남긴 INVALID 인덱스는 제거 후 다시 만듭니다.
+        CONCURRENTLY는 트랜잭션 밖에서만 실행되므로 진행 중인 트랜잭션이 있으면 RuntimeError가 발생합니다.
+
+        Args:
+            method: "hnsw" 또는 "ivfflat" (기본: VECTOR_INDEX_CONFIG['method'])
+            m: HNSW 노드당 연결 수
+            ef_construction: HNSW 빌드 후보 수
+            lists: IVFFlat 리스트 수 (기본: 임베딩 행 수 기준 자동 계산)
+            name: 인덱스 이름 (기본: VECTOR_INDEX_CONFIG['name'])
+
+        Returns:
+            Dict: 인덱스 정보 (get_vector_index 결과 + build_sec)
+        """
+        method = (method or VECTOR_INDEX_CONFIG['method']).lower()
+        name = name or VECTOR_INDEX_CONFIG['name']
+        if method == 'hnsw':
+            params = (f"m = {int(m or VECTOR_INDEX_CONFIG['hnsw_m'])}, "
+                      f"ef_construction = {int(ef_construction or VECTOR_INDEX_CONFIG['hnsw_ef_construction'])}")
+        elif method == 'ivfflat':
+            params = f"lists = {int(lists or VECTOR_INDEX_CONFIG.get('ivfflat_lists') or self._ivfflat_lists())}"
+        else:
+            raise ValueError(f"지원하지 않는 벡터 인덱스 방식: {method} (hnsw / ivfflat)")
+
+        existing = self.get_vector_index(name)
+        if existing and existing['valid']:
+            print(f"ℹ️ 벡터 인덱스가 이미 있습니다: {name} ({existing['method']}, {existing['size']})")
+            return existing
+
+        ops = VECTOR_OPS[VECTOR_INDEX_CONFIG['metric']]
+        print(f"🧭 벡터 인덱스 생성 중: {name} ({method}, {params})...")
+        try:
+            with self._autocommit():
+                if existing:
+                    self.cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+                if VECTOR_INDEX_CONFIG.get('maintenance_work_mem'):
+                    self.cursor.execute("SET maintenance_work_mem = %s", (VECTOR_INDEX_CONFIG['maintenance_work_mem'],))
+                started = time.perf_counter()
+                try:
+                    self.cursor.execute(f"""
+                        CREATE INDEX CONCURRENTLY "{name}" 
+                        ON "Source_Materials" USING {method} (embedding {ops}) 
+                        WITH ({params})
+                    """)
+                finally:
+                    self.cursor.execute("RESET maintenance_work_mem")
+                build_sec = time.perf_counter() - started
+        except Exception as e:
+            print(f"❌ 벡터 인덱스 생성 실패: {e}")
+            raise
+
+        info = self.get_vector_index(name)
+        info['build_sec'] = build_sec
+        print(f"✅ 벡터 인덱스 생성 완료: {name} ({method}, {build_sec:.1f}초, {info['size']})")
+        return info
+
+    def drop_vector_index(self, name: Optional[str] = None) -> bool:
+        """
+        임베딩 벡터 인덱스 제거 (DROP INDEX CONCURRENTLY)
+
+        Returns:
+            bool: 인덱스가 있어서 제거했으면 True
+        """
+        name = name or VECTOR_INDEX_CONFIG['name']
+        if not self.get_vector_index(name):
+            return False
+        with self._autocommit():
+            self.cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+        print(f"🗑️ 벡터 인덱스 제거: {name}")
+        return True
+
+    def rebuild_vector_index(self, **options) -> Optional[Dict]:
+        """
+        임베딩 벡터 인덱스 재생성 (파라미터 변경 / 대량 갱신 후)
+
+        새 인덱스를 다른 이름으로 CONCURRENTLY 생성한 뒤 기존 인덱스와 교체하므로
+        재생성 중에도 기존 인덱스로 검색할 수 있습니다.
+        교체(DROP INDEX + RENAME)는 Source_Materials에 ACCESS EXCLUSIVE 잠금을 잡으므로
+        lock_timeout(VECTOR_INDEX_CONFIG['swap_lock_timeout_ms'])으로 대기를 제한하고, 진행 중인 검색 때문에
+        잠금을 얻지 못하면 swap_retries회까지 다시 시도합니다. (대기 중에도 뒤따르는 쿼리가 막히는 구간은 이 시간 이내)
+
+        Args:
+            **options: create_vector_index 인자 (method, m, ef_construction, lists)
+
+        Returns:
+            Dict: 새 인덱스 정보
+        """
+        name = options.pop('name', None) or VECTOR_INDEX_CONFIG['name']
+        if not self.get_vector_index(name):
+            return self.create_vector_index(name=name, **options)
+
+        temp_name = f"{name}_rebuild"
+        self.drop_vector_index(temp_name)  # 이전 재생성이 중단되며 남긴 인덱스
+        info = self.create_vector_index(name=temp_name, **options)
+        retries = VECTOR_INDEX_CONFIG.get('swap_retries', 5)
+        for attempt in range(retries + 1):
+            try:
+                self.cursor.execute("SET LOCAL lock_timeout = %s", (VECTOR_INDEX_CONFIG.get('swap_lock_timeout_ms', 2000),))
+                self.cursor.execute(f'DROP INDEX "{name}"')
+                self.cursor.execute(f'ALTER INDEX "{temp_name}" RENAME TO "{name}"')
+                self.conn.commit()
+                break
+            except errors.LockNotAvailable:
+                self._rollback()
+                if attempt == retries:
+                    print(f"❌ 벡터 인덱스 교체 실패: 잠금 대기 초과 {retries + 1}회 (새 인덱스는 {temp_name}으로 남음)")
+                    raise
+                print(f"   ⏳ 벡터 인덱스 교체 잠금 대기 초과 - 재시도 ({attempt + 1}/{retries})")
+                time.sleep(min(2 ** attempt, 30))
+            except Exception as e:
+                self._rollback()
+                print(f"❌ 벡터 인덱스 교체 실패: {e}")
+                raise
+        info['name'] = name
+        return info
+
+    def _ivfflat_lists(self) -> int:
+        """IVFFlat 리스트 수 (pgvector 권장: 100만 행까지 행 수/1000, 그 이상은 sqrt(행 수))"""
+        with self._lookup():
+            self.cursor.execute('SELECT COUNT(*) FROM "Source_Materials" WHERE embedding IS NOT NULL')
+            rows = self.cursor.fetchone()[0]
+        return max(rows // 1000 if rows <= 1_000_000 else int(rows ** 0.5), 1)
+
+    @contextmanager
+    def _lookup(self):
+        """카탈로그 조회용 (조회가 새로 시작한 트랜잭션만 닫고, 호출자의 트랜잭션은 그대로 둠)"""
+        started = self.conn.info.transaction_status == extensions.TRANSACTION_STATUS_IDLE
+        try:
+            yield
+        finally:
+            if started:
+                self.conn.rollback()
+
+    @contextmanager
+    def _autocommit(self):
+        """
+        트랜잭션 블록 밖에서 실행해야 하는 작업용 (CREATE/DROP INDEX CONCURRENTLY)
+
+        Raises:
+            RuntimeError: 호출자의 트랜잭션이 진행 중 (커밋하지 않은 작업을 대신 커밋하지 않음)
+        """
+        if self.conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            raise RuntimeError("진행 중인 트랜잭션이 있어 인덱스 작업을 실행할 수 없습니다 (먼저 커밋/롤백하세요)")
+        self.conn.autocommit = True
+        try:
+            yield
+        finally:
+            self.conn.autocommit = False
+
+    # ==================== 유사도 검색 ====================
+
+    def search_similar(
+        self,
+        query: Union[str, Sequence[float]],
+        k: int = 10,
+        company: Optional[str] = None,
+        report_id: Optional[int] = None,
+        chunk_type: Optional[str] = None,
+        section_prefix: Optional[str] = None,
+        rcept_dt_from: Optional[str] = None,
+        rcept_dt_to: Optional[str] = None,
+        ef_search: Optional[int] = None
+    ) -> List[SimilarChunk]:
+        """
+        임베딩 유사도 top-k 검색 (필터 조건 포함)
+
+        벡터 인덱스를 타도록 거리 연산자로 정렬하고, 필터로 후보가 걸러져 결과가 k개보다 적어지지 않도록
+        pgvector 0.8+의 iterative index scan을 켭니다. SQL은 연결마다 한 번만 PREPARE합니다.
+        검색은 SAVEPOINT 안에서 실행되므로 호출자의 트랜잭션을 커밋하거나 롤백하지 않습니다.
+
+        Args:
+            query: 검색어 (임베딩 모델로 변환) 또는 임베딩 벡터
+            k: 반환할 최대 개수 (1 ~ HNSW_MAX_EF_SEARCH)
+            company: 기업명, 고유번호 또는 종목코드
+            report_id: 리포트 ID
+            chunk_type: 'text' 또는 'table'
+            section_prefix: 섹션 경로 접두어 (예: "II. 사업의 내용")
+            rcept_dt_from: 접수일 시작 (YYYYMMDD, 포함)
+            rcept_dt_to: 접수일 종료 (YYYYMMDD, 포함)
+            ef_search: HNSW 검색 후보 수 (기본: VECTOR_INDEX_CONFIG['ef_search'], k ~ HNSW_MAX_EF_SEARCH로 보정)
+
+        Returns:
+            List[SimilarChunk]: 거리 오름차순 결과 (cosine/l2는 작을수록, ip는 음의 내적)
+        """
+        if not 1 <= k <= HNSW_MAX_EF_SEARCH:
+            raise ValueError(f"k는 1 ~ {HNSW_MAX_EF_SEARCH} 범위여야 합니다: {k} (pgvector hnsw.ef_search 상한)")
+        vector = embed_query(query) if isinstance(query, str) else list(query)
+        if len(vector) != EMBEDDING_CONFIG['dimension']:
+            raise ValueError(f"쿼리 벡터 차원 불일치: {len(vector)} (기대: {EMBEDDING_CONFIG['dimension']})")
+
+        # 호출자의 트랜잭션은 커밋/롤백하지 않도록 savepoint 안에서 검색하고, 끝나면 SET LOCAL 설정과 함께 되돌림
+        self.cursor.execute("SAVEPOINT search_similar")
+        try:
+            self._prepare_search()
+            self.cursor.execute("SET LOCAL hnsw.ef_search = %s",
+                                (min(max(ef_search or VECTOR_INDEX_CONFIG['ef_search'], k), HNSW_MAX_EF_SEARCH),))
+            self.cursor.execute("SET LOCAL ivfflat.probes = %s", (VECTOR_INDEX_CONFIG['ivfflat_probes'],))
+            if self._iterative_scan_supported():
+                iterative_scan = VECTOR_INDEX_CONFIG.get('iterative_scan') or 'off'
+                self.cursor.execute("SET LOCAL hnsw.iterative_scan = %s", (iterative_scan,))
+                self.cursor.execute("SET LOCAL ivfflat.iterative_scan = %s", (iterative_scan,))
+
+            self.cursor.execute(
+                f"EXECUTE {SEARCH_STATEMENT} (%s, %s, %s, %s, %s, %s, %s, %s)",
+                (vector_literal(vector), k, chunk_type, report_id, section_prefix,
+                 company, rcept_dt_from, rcept_dt_to)
+            )
+            rows = self.cursor.fetchall()
+        except Exception as e:
+            _prepared_connections.discard(self.conn)
+            print(f"❌ 유사도 검색 실패: {e}")
+            try:
+                self.cursor.execute("ROLLBACK TO SAVEPOINT search_similar")
+                self.cursor.execute("RELEASE SAVEPOINT search_similar")
+            except psycopg2.Error:
+                pass
+            raise
+
+        self.cursor.execute("ROLLBACK TO SAVEPOINT search_similar")
+        self.cursor.execute("RELEASE SAVEPOINT search_similar")
+        return [SimilarChunk(*row) for row in rows]
+
+    def _prepare_search(self):
+        """유사도 검색 SQL을 현재 연결에 PREPARE (연결당 1회)"""
+        if self.conn in _prepared_connections:
+            return
+        self.cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (SEARCH_STATEMENT,))
+        if self.cursor.fetchone():
+            _prepared_connections.add(self.conn)
+            return
+
+        distance = VECTOR_DISTANCE[VECTOR_INDEX_CONFIG['metric']]
+        self.cursor.execute(f"""
+            PREPARE {SEARCH_STATEMENT} (vector, int, text, int, text, text, text, text) AS
+            SELECT * FROM (
+                SELECT sm.id, sm.report_id, sm.chunk_type, sp.section_path, sm.sequence_order,
+                       sm.raw_content, sm.embedding {distance} $1 AS distance
+                FROM "Source_Materials" sm
+                LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+                WHERE sm.embedding IS NOT NULL
+                  AND ($3 IS NULL OR sm.chunk_type = $3)
+                  AND ($4 IS NULL OR sm.report_id = $4)
+                  AND ($5 IS NULL OR sm.section_path_id IN (
+                      SELECT id FROM "Section_Paths" WHERE starts_with(section_path, $5)
+                  ))
+                  AND (($6 IS NULL AND $7 IS NULL AND $8 IS NULL) OR sm.report_id IN (
+                      SELECT r.id FROM "Analysis_Reports" r
+                      JOIN "Companies" c ON c.id = r.company_id
+                      WHERE ($6 IS NULL OR $6 IN (c.company_name, c.corp_code, c.stock_code))
+                        AND ($7 IS NULL OR r.rcept_dt >= $7)
+                        AND ($8 IS NULL OR r.rcept_dt <= $8)
+                  ))
+                ORDER BY sm.embedding {distance} $1
+                LIMIT $2
+            ) hits
+            ORDER BY distance
+        """)
+        _prepared_connections.add(self.conn)
+
+    def _iterative_scan_supported(self) -> bool:
+        """pgvector iterative index scan 지원 여부 (0.8.0 이상)"""
+        global _pgvector_iterative_scan
+        if _pgvector_iterative_scan is None:
+            self.cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            row = self.cursor.fetchone()
+            version = tuple(int(part) for part in row[0].split('.')[:2]) if row else (0, 0)
+            _pgvector_iterative_scan = version >= (0, 8)
+        return _pgvector_iterative_scan
+
     # ==================== 유틸리티 ====================
 
     def get_stats(self) -> Dict:
@@ -472,3 +1150,18 @@ class DBManager:
 
         return stats
 
+
+# ==================== 검색 쿼리 변환 ====================
+
+def vector_literal(vector: Sequence[float]) -> str:
+    """pgvector 입력 형식 문자열 ('[0.1,0.2,...]')"""
+    return '[' + ','.join(repr(float(value)) for value in vector) + ']'
+
+
+def embed_query(text: str) -> List[float]:
+    """검색어 임베딩 (임베딩 모델은 프로세스당 1회 로드)"""
+    global _query_embedder
+    if _query_embedder is None:
+        from src.utils.embedding_generator import EmbeddingGenerator
+        _query_embedder = EmbeddingGenerator()
+    return _query_embedder.embed_text(text)
@@ -0,0 +1,146 @@
+"""
+DB 커넥션 풀 모듈 - 프로세스 공용 PostgreSQL 연결 재사용
+DBManager가 with 구문마다 새로 연결하지 않고 풀에서 연결을 대여/반납하며,
+동시에 사용하는 연결 수는 DB_POOL_CONFIG['max_connections']로 제한
+"""
+import os
+import time
+import atexit
+import threading
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+from typing import Optional, Callable, List, Tuple
+from config import DB_CONFIG, DB_POOL_CONFIG
+
+
+class ConnectionPool:
+    """
+    스레드 안전 커넥션 풀
+
+    - 연결이 모두 대여 중이면 반납될 때까지 대기 (checkout_timeout_sec 초과 시 PoolError)
+    - 대여 시 상태 확인: 끊긴 연결은 버리고, 오래 쉬던 연결은 SELECT 1로 확인 후 대여
+    - 반납 시 끊긴 연결은 풀에 넣지 않고 닫음
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], extensions.connection],
+        max_connections: int,
+        checkout_timeout_sec: float = 30,
+        health_check_idle_sec: float = 30
+    ):
+        """
+        Args:
+            connect: 새 연결 생성 함수
+            max_connections: 최대 연결 수 (대여 중 + 유휴)
+            checkout_timeout_sec: 대여 대기 최대 시간 (초)
+            health_check_idle_sec: 이 시간 이상 유휴였던 연결은 대여 전 SELECT 1로 확인 (초)
+        """
+        self._connect = connect
+        self._slots = threading.BoundedSemaphore(max(max_connections, 1))
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[extensions.connection, float]] = []  # (연결, 반납 시각), 최근 반납 순
+        self.max_connections = max(max_connections, 1)
+        self.checkout_timeout_sec = checkout_timeout_sec
+        self.health_check_idle_sec = health_check_idle_sec
+        self.created = 0  # 생성한 연결 수 (통계)
+        self.pid = os.getpid()
+
+    def getconn(self) -> extensions.connection:
+        """연결 대여 (유휴 연결 재사용, 없으면 새로 연결)"""
+        if not self._slots.acquire(timeout=self.checkout_timeout_sec):
+            raise PoolError(f"DB 연결 대기 시간 초과 ({self.checkout_timeout_sec}초, 최대 {self.max_connections}개)")
+        try:
+            while True:
+                with self._lock:
+                    conn, returned_at = self._idle.pop() if self._idle else (None, None)
+                if conn is None:
+                    conn = self._connect()
+                    self.created += 1
+                    return conn
+                if self._is_healthy(conn, time.monotonic() - returned_at):
+                    return conn
+                self._discard(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn: extensions.connection):
+        """연결 반납 (열린 트랜잭션은 롤백, 끊긴 연결은 닫음)"""
+        try:
+            if not conn.closed and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    pass
+            if conn.closed or conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def closeall(self):
+        """유휴 연결 모두 닫기 (대여 중인 연결은 반납 시 다시 풀에 들어감)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def _is_healthy(self, conn: extensions.connection, idle_sec: float) -> bool:
+        """대여 전 연결 상태 확인"""
+        if conn.closed or conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        if idle_sec < self.health_check_idle_sec:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @staticmethod
+    def _discard(conn: extensions.connection):
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+
+# ==================== 공용 풀 ====================
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+_inherited_pools: List[ConnectionPool] = []  # fork 전 부모 프로세스의 풀 (부모 연결을 닫지 않도록 보관만 함)
+
+
+def get_pool() -> ConnectionPool:
+    """프로세스 공용 커넥션 풀 반환 (config의 DB_CONFIG / DB_POOL_CONFIG 기준, fork된 프로세스는 새 풀 사용)"""
+    global _pool
+    if _pool is None or _pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is not None and _pool.pid != os.getpid():
+                _inherited_pools.append(_pool)
+                _pool = None
+            if _pool is None:
+                _pool = ConnectionPool(
+                    lambda: psycopg2.connect(**DB_CONFIG),
+                    max_connections=DB_POOL_CONFIG['max_connections'],
+                    checkout_timeout_sec=DB_POOL_CONFIG.get('checkout_timeout_sec', 30),
+                    health_check_idle_sec=DB_POOL_CONFIG.get('health_check_idle_sec', 30)
+                )
+    return _pool
+
+
+@atexit.register
+def close_pool():
+    """공용 풀의 유휴 연결 닫기 (프로세스 종료 시 자동 호출)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.closeall()
+            _pool = None
@@ -13,6 +13,7 @@ Context Look-back 임베딩 워커
     python scripts/embedding_worker.py --batch-size 32
     python scripts/embedding_worker.py --limit 100  # 테스트용
     python scripts/embedding_worker.py --force      # 기존 임베딩 재생성
+    python scripts/embedding_worker.py --no-index   # 종료 후 벡터 인덱스 생성 안 함
 """
 import sys
 import os
@@ -28,8 +29,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from tqdm import tqdm
 from src.core.db_manager import DBManager
+from src.core.token_chunker import embedding_prefix
 from src.utils.embedding_generator import EmbeddingGenerator
-from config import EMBEDDING_CONFIG
+from config import EMBEDDING_CONFIG, VECTOR_INDEX_CONFIG
 
 
 @dataclass
@@ -96,19 +98,21 @@ class ContextLookbackEmbeddingWorker:
         if force:
             # 전체 데이터 조회 (재처리)
             sql = """
-                SELECT id, report_id, chunk_type, section_path, 
-                       sequence_order, raw_content
-                FROM "Source_Materials"
-                ORDER BY report_id, sequence_order, id
+                SELECT sm.id, sm.report_id, sm.chunk_type, sp.section_path, 
+                       sm.sequence_order, sm.raw_content
+                FROM "Source_Materials" sm
+                LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+                ORDER BY sm.report_id, sm.sequence_order, sm.id
             """
         else:
             # 임베딩이 없는 데이터만 조회
             sql = """
-                SELECT id, report_id, chunk_type, section_path, 
-                       sequence_order, raw_content
-                FROM "Source_Materials"
-                WHERE embedding IS NULL
-                ORDER BY report_id, sequence_order, id
+                SELECT sm.id, sm.report_id, sm.chunk_type, sp.section_path, 
+                       sm.sequence_order, sm.raw_content
+                FROM "Source_Materials" sm
+                LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+                WHERE sm.embedding IS NULL
+                ORDER BY sm.report_id, sm.sequence_order, sm.id
             """
 
         if limit is not None:
@@ -144,12 +148,13 @@ class ContextLookbackEmbeddingWorker:
             직전 행 (없으면 None)
         """
         sql = """
-            SELECT id, report_id, chunk_type, section_path, 
-                   sequence_order, raw_content
-            FROM "Source_Materials"
-            WHERE report_id = %s 
-              AND sequence_order < %s
-            ORDER BY sequence_order DESC
+            SELECT sm.id, sm.report_id, sm.chunk_type, sp.section_path, 
+                   sm.sequence_order, sm.raw_content
+            FROM "Source_Materials" sm
+            LEFT JOIN "Section_Paths" sp ON sp.id = sm.section_path_id
+            WHERE sm.report_id = %s 
+              AND sm.sequence_order < %s
+            ORDER BY sm.sequence_order DESC
             LIMIT 1
         """
         db.cursor.execute(sql, (current.report_id, current.sequence_order))
@@ -188,7 +193,7 @@ class ContextLookbackEmbeddingWorker:
                       같은 section_path인 경우 → 문맥 주입
             - Case B: 그 외 모든 경우 → 기본 포맷
         """
-        section_path = current.section_path or "알 수 없음"
+        prefix = embedding_prefix(current.section_path)
         raw_content = current.raw_content or ""
 
         # Case A: 표(table)에 직전 텍스트 문맥 주입
@@ -206,7 +211,7 @@ class ContextLookbackEmbeddingWorker:
                 context_text = context_text[:max_context_len] + "..."
 
             embedding_text = (
-                f"문서 경로: {section_path}\n"
+                f"{prefix}"
                 f"[문맥 설명: {context_text}]\n"
                 f"[표 데이터]\n"
                 f"{raw_content}"
@@ -214,7 +219,7 @@ class ContextLookbackEmbeddingWorker:
             return embedding_text, True  # 문맥 주입됨
 
         # Case B: 일반 텍스트 또는 문맥 없는 표
-        embedding_text = f"문서 경로: {section_path}\n{raw_content}"
+        embedding_text = f"{prefix}{raw_content}"
         return embedding_text, False
 
     # ==================== 임베딩 생성 및 DB 업데이트 ====================
@@ -323,15 +328,23 @@ class ContextLookbackEmbeddingWorker:
     def run(
         self,
         limit: Optional[int] = None,
-        force: bool = False
+        force: bool = False,
+        build_index: Optional[bool] = None
     ):
         """
         Context Look-back 임베딩 파이프라인 실행
 
+        처리 대상이 VECTOR_INDEX_CONFIG['defer_threshold'] 이상이면 벡터 인덱스를 먼저 제거하고
+        (행마다 인덱스를 갱신하지 않도록) 임베딩이 끝난 뒤 한 번에 생성합니다.
+
         Args:
             limit: 최대 처리 개수 (테스트용)
             force: True면 기존 임베딩이 있어도 재처리
+            build_index: 종료 후 벡터 인덱스가 없으면 생성 (기본: VECTOR_INDEX_CONFIG['auto_build'])
         """
+        if build_index is None:
+            build_index = VECTOR_INDEX_CONFIG.get('auto_build', True)
+
         self.stats["start_time"] = datetime.now()
 
         print("\n" + "=" * 70)
@@ -368,18 +381,47 @@ class ContextLookbackEmbeddingWorker:
         previous_cache: Dict[int, MaterialRow] = {}
 
         with DBManager() as db:
-            for batch in tqdm(batches, desc="임베딩 생성"):
-                previous_cache = self.process_batch(db, batch, previous_cache)
-
-                # 메모리 관리를 위한 짧은 딜레이
-                time.sleep(0.05)
-
-        # 5. 결과 요약
+            # 대량 임베딩 중에는 인덱스를 유지하지 않음 (종료 후 재생성)
+            index_dropped = False
+            if build_index and self.stats["total"] >= VECTOR_INDEX_CONFIG['defer_threshold']:
+                index_dropped = db.drop_vector_index()
+                if index_dropped:
+                    print("   ↪️ 대량 임베딩 후 벡터 인덱스를 다시 생성합니다")
+
+            try:
+                for batch in tqdm(batches, desc="임베딩 생성"):
+                    previous_cache = self.process_batch(db, batch, previous_cache)
+
+                    # 메모리 관리를 위한 짧은 딜레이
+                    time.sleep(0.05)
+            except BaseException:
+                # 중단/실패 시에도 제거한 인덱스는 복구 (인덱스 없이 검색이 전체 스캔으로 남지 않도록)
+                if index_dropped:
+                    self._restore_vector_index(db)
+                raise
+
+            # 5. 벡터 인덱스 생성 (없을 때만)
+            if build_index:
+                db.create_vector_index()
+
+        # 6. 결과 요약
         self.stats["end_time"] = datetime.now()
         self._print_summary()
 
         return self.stats
 
+    def _restore_vector_index(self, db: DBManager):
+        """임베딩 도중 중단된 경우 제거했던 벡터 인덱스 재생성 (실패하면 경고만 출력)"""
+        try:
+            db.conn.rollback()
+            db.create_vector_index()
+        except Exception as e:
+            print("\n" + "!" * 70)
+            print(f"🚨 제거한 벡터 인덱스를 다시 생성하지 못했습니다: {e}")
+            print("   유사도 검색이 전체 스캔으로 동작합니다. 다음 워커 실행(auto_build) 또는")
+            print("   'python scripts/vector_index.py create'로 인덱스를 생성하세요.")
+            print("!" * 70)
+
     def _print_summary(self):
         """실행 결과 요약 출력"""
         duration = self.stats["end_time"] - self.stats["start_time"]
@@ -426,6 +468,12 @@ class ContextLookbackEmbeddingWorker:
                 embed_rate = (stats['embedded_materials'] / stats['materials']) * 100
                 print(f"      - 임베딩 비율: {embed_rate:.1f}%")
 
+            index = db.get_vector_index()
+            if index:
+                print(f"      - 벡터 인덱스: {index['method']} ({index['size']})")
+            else:
+                print(f"      - 벡터 인덱스: 없음")
+
         print("=" * 70)
 
 
@@ -450,11 +498,16 @@ def main():
         action='store_true',
         help='기존 임베딩이 있어도 재생성'
     )
+    parser.add_argument(
+        '--no-index',
+        action='store_true',
+        help='종료 후 벡터 인덱스를 생성하지 않음'
+    )
 
     args = parser.parse_args()
 
     worker = ContextLookbackEmbeddingWorker(batch_size=args.batch_size)
-    worker.run(limit=args.limit, force=args.force)
+    worker.run(limit=args.limit, force=args.force, build_index=False if args.no_index else None)
 
 
 if __name__ == "__main__":
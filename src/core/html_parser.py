@@ -0,0 +1,51 @@
+"""
+HTML 파서 모듈 - BeautifulSoup 트리 빌더 선택
+블록 파서(_parse_sequential_blocks)는 bs4 Tag/NavigableString API로 작성되어 있으므로
+트리 빌더만 교체 (lxml: C 구현으로 html.parser 대비 수 배 빠름)
+"""
+from typing import Optional, List
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from config import PARSER_CONFIG
+
+# 지원 파서 (빠른 순)
+SUPPORTED_PARSERS = ("lxml", "html.parser", "html5lib")
+FALLBACK_PARSER = "html.parser"
+
+_resolved: dict = {}
+
+
+def available_parsers() -> List[str]:
+    """현재 환경에 설치된 파서 목록"""
+    return [name for name in SUPPORTED_PARSERS if builder_registry.lookup(name) is not None]
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """
+    사용할 트리 빌더 이름 결정
+
+    Args:
+        name: 파서 이름 (기본: config의 PARSER_CONFIG['html_parser'])
+
+    Returns:
+        str: 설치된 파서 이름 (미설치 시 html.parser)
+    """
+    name = name or PARSER_CONFIG.get('html_parser') or FALLBACK_PARSER
+    if name not in _resolved:
+        if name in SUPPORTED_PARSERS and builder_registry.lookup(name) is not None:
+            _resolved[name] = name
+        else:
+            print(f"⚠️ HTML 파서 '{name}' 사용 불가 - {FALLBACK_PARSER}로 대체")
+            _resolved[name] = FALLBACK_PARSER
+    return _resolved[name]
+
+
+def make_soup(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    설정된 파서로 BeautifulSoup 생성
+
+    Args:
+        html: HTML 문자열
+        parser: 파서 이름 (기본: config 설정값)
+    """
+    return BeautifulSoup(html, resolve_parser(parser))
@@ -0,0 +1,424 @@
+"""
+HTML 테이블 모듈 - 파싱된 DOM에서 테이블 직접 변환
+pd.read_html의 헤더 판별 / rowspan·colspan 전개 / 타입 추론 규칙을 따르되
+HTML 재직렬화·재파싱과 DataFrame 변환 없이 한 번 파싱한 트리에서 바로 레코드를 만듦
+"""
+import re
+from typing import Optional, List, Dict, Tuple, Union
+
+# pd.read_html 셀 텍스트 공백 정리 규칙
+_RE_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+# pd.read_html(match='.+')와 같은 테이블 선택 기준 (텍스트가 있는 테이블만)
+_RE_ANY_TEXT = re.compile(r".+")
+# 천 단위 구분자(,)를 포함할 수 있는 숫자
+_RE_NUMBER_CHARS = re.compile(r"[-+0-9,.eE]+")
+_RE_INT = re.compile(r"[-+]?\d+")
+_RE_FLOAT = re.compile(r"[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?")
+
+# pandas 기본 결측값 표기
+_NA_VALUES = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+])
+
+Cell = Union[str, int, float]
+
+
+def has_text(table) -> bool:
+    """변환 대상 테이블 여부 (pd.read_html과 같이 텍스트가 없는 테이블 제외)"""
+    return any(_RE_ANY_TEXT.search(text) for text in table.strings)
+
+
+def _cell_text(cell) -> str:
+    """셀 텍스트 (pd.read_html과 같은 공백 정리)"""
+    return _RE_WHITESPACE.sub(" ", cell.get_text().strip())
+
+
+def _children(element, names) -> List:
+    """직계 자식 중 태그 이름이 names에 속하는 요소 (find_all(recursive=False)보다 빠름)"""
+    return [child for child in element.children if child.name in names]
+
+
+def _row_cells(row) -> List:
+    return _children(row, ('td', 'th'))
+
+
+def _section_rows(table, name: str) -> List:
+    return [row for section in _children(table, (name,)) for row in _children(section, ('tr',))]
+
+
+def _expand_spans(
+    rows: List,
+    remainder: List[Tuple[int, str, int]] = None,
+    overflow: bool = True
+) -> Tuple[List[List[str]], List[Tuple[int, str, int]]]:
+    """
+    rowspan / colspan 전개 (병합 셀 텍스트를 차지하는 모든 칸에 복제)
+
+    Args:
+        rows: <tr> 요소 리스트
+        remainder: 앞 구역(thead 등)에서 넘어온 rowspan 셀 (열 위치, 텍스트, 남은 행 수)
+        overflow: True면 구역 밖으로 넘친 rowspan 셀을 다음 구역으로 넘기고,
+            False면 행을 추가해 모두 채움
+
+    Returns:
+        Tuple: (행별 셀 텍스트 (행마다 길이가 다를 수 있음), 다음 구역으로 넘길 rowspan 셀)
+    """
+    grid = []
+    remainder = list(remainder or [])
+
+    for row in rows:
+        texts = []
+        next_remainder = []
+        index = 0
+
+        for cell in _row_cells(row):
+            # 이 셀 앞쪽에 위 행의 rowspan 셀 채우기
+            while remainder and remainder[0][0] <= index:
+                prev_index, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+                index += 1
+
+            text = _cell_text(cell)
+            rowspan = _span(cell, 'rowspan')
+            for _ in range(_span(cell, 'colspan')):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+
+        # 행 끝에 남은 rowspan 셀
+        for prev_index, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+
+        grid.append(texts)
+        remainder = next_remainder
+
+    if not overflow:
+        # 마지막 행의 rowspan이 표 밖으로 넘친 경우 행 추가
+        while remainder:
+            texts = []
+            next_remainder = []
+            for prev_index, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+            grid.append(texts)
+            remainder = next_remainder
+
+    return grid, remainder
+
+
+def _span(cell, name: str) -> int:
+    try:
+        return max(int(cell.get(name) or 1), 1)
+    except ValueError:
+        return 1
+
+
+def expand_table(table) -> Tuple[List[List[str]], List[List[str]]]:
+    """
+    테이블을 헤더 / 본문 텍스트 격자로 변환
+
+    <thead>가 없으면 맨 위의 <th>로만 이루어진 행을 헤더로 사용합니다.
+    빈 칸은 ""로 채워 모든 행의 길이를 맞추고, 셀이 하나뿐인 빈 행은 제외합니다.
+
+    Returns:
+        Tuple[List[List[str]], List[List[str]]]: (헤더 행, 본문 행 (<tfoot> 포함))
+    """
+    header_rows = _section_rows(table, 'thead')
+    body_rows = _section_rows(table, 'tbody') + _children(table, ('tr',))
+    footer_rows = _section_rows(table, 'tfoot')
+
+    if not header_rows:
+        while body_rows and all(cell.name == 'th' for cell in _row_cells(body_rows[0])):
+            header_rows.append(body_rows.pop(0))
+
+    # 헤더의 rowspan은 본문으로, 본문의 rowspan은 <tfoot>으로 이어짐
+    header, remainder = _expand_spans(header_rows)
+    body, remainder = _expand_spans(body_rows, remainder, overflow=bool(footer_rows))
+    footer, _ = _expand_spans(footer_rows, remainder, overflow=False)
+    body += footer
+
+    width = max((len(row) for row in header + body), default=0)
+    for row in header + body:
+        row.extend([""] * (width - len(row)))
+
+    # 헤더가 여러 행이면 텍스트가 있는 행만 헤더로 사용 (pd.read_html과 동일)
+    header_index = [0] if len(header) == 1 else [i for i, row in enumerate(header) if any(row)]
+
+    # 셀이 하나뿐인 빈 행은 건너뛰고 남은 행 기준으로 헤더 선택 (pandas skip_blank_lines)
+    rows = [row for row in header + body if not (len(row) == 1 and not row[0].strip())]
+    if not header_index:
+        return [], rows
+    return [rows[i] for i in header_index if i < len(rows)], rows[header_index[-1] + 1:]
+
+
+def table_columns(header: List[List[str]], width: int) -> List[str]:
+    """
+    열 이름 (pd.read_html + DataFrame.to_json의 키와 동일)
+
+    - 헤더 없음: "0", "1", ...
+    - 헤더 1행: 셀 텍스트 (빈 칸은 "Unnamed: i", 중복은 "이름.1")
+    - 헤더 여러 행: "('상위', '하위')" 형식의 튜플 문자열
+    """
+    if not header:
+        return [str(i) for i in range(width)]
+
+    if len(header) == 1:
+        names = [name or f"Unnamed: {i}" for i, name in enumerate(header[0])]
+    else:
+        names = [
+            tuple(row[i] or f"Unnamed: {i}_level_{level}" for level, row in enumerate(header))
+            for i in range(width)
+        ]
+
+    # 중복 이름은 마지막 단계에 ".1", ".2" 추가
+    columns = []
+    counts: Dict = {}
+    for name in names:
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        if count:
+            name = name[:-1] + (f"{name[-1]}.{count}",) if isinstance(name, tuple) else f"{name}.{count}"
+        columns.append(str(name))
+    return columns
+
+
+def _parse_number(text: str) -> Optional[Union[int, float]]:
+    """숫자 셀 변환 (천 단위 구분자 허용, 숫자가 아니면 None)"""
+    if not _RE_NUMBER_CHARS.fullmatch(text):
+        return None
+    value = text.replace(",", "")
+    if _RE_INT.fullmatch(value):
+        return int(value)
+    if _RE_FLOAT.fullmatch(value):
+        return float(value)
+    return None
+
+
+def _convert_column(values: List[str]) -> List[Cell]:
+    """
+    열 단위 타입 추론 (pandas와 동일하게 열 전체가 숫자일 때만 변환)
+
+    - 모두 정수: int
+    - 소수 또는 결측값 포함: float (결측값은 "")
+    - 그 외: 문자열 (결측값은 "", 숫자 형태 셀은 천 단위 구분자 제거)
+    """
+    present = [v for v in values if v not in _NA_VALUES]
+    numbers = [_parse_number(v) for v in present]
+
+    if not present or any(n is None for n in numbers):
+        return [
+            "" if v in _NA_VALUES else (v.replace(",", "") if _parse_number(v) is not None else v)
+            for v in values
+        ]
+
+    as_float = len(present) < len(values) or any(isinstance(n, float) for n in numbers)
+    converted = iter(numbers)
+    return [
+        "" if v in _NA_VALUES else (float(next(converted)) if as_float else next(converted))
+        for v in values
+    ]
+
+
+def _table_columns_data(table, expanded: Tuple = None) -> Tuple[List[str], List[List[Cell]], int]:
+    """테이블 열 이름 / 열별 변환 값 / 행 수 (expanded: 이미 계산한 expand_table 결과)"""
+    header, body = expanded or expand_table(table)
+
+    width = len(header[0]) if header else (len(body[0]) if body else 0)
+    columns = table_columns(header, width)
+    data = [_convert_column([row[i] for row in body]) for i in range(width)]
+    return columns, data, len(body)
+
+
+def table_to_records(table) -> List[Dict[str, Cell]]:
+    """
+    테이블을 레코드 리스트로 변환 (DataFrame.to_json(orient='records') 결과와 같은 형식)
+
+    Args:
+        table: BeautifulSoup table 요소
+
+    Returns:
+        List[Dict]: 행별 {열 이름: 값} 딕셔너리 (결측값은 "")
+    """
+    columns, data, row_count = _table_columns_data(table)
+    return [
+        {column: data[i][r] for i, column in enumerate(columns)}
+        for r in range(row_count)
+    ]
+
+
+def _markdown_cell(value) -> str:
+    return str(value).replace("|", "｜").replace("\n", " ").strip()
+
+
+def table_to_markdown(table, expanded: Tuple = None) -> Tuple[str, Dict]:
+    """
+    테이블을 Markdown 표로 변환 (pd.read_html + DataFrame.iterrows 결과와 동일한 출력)
+
+    Args:
+        table: BeautifulSoup table 요소
+        expanded: 이미 계산한 expand_table 결과 (없으면 새로 계산)
+
+    Returns:
+        Tuple[str, Dict]: (Markdown 테이블 문자열, 메타데이터 {rows, cols, columns[, title]})
+    """
+    columns, data, row_count = _table_columns_data(table, expanded)
+
+    # 모든 열이 결측값 없는 숫자이고 소수 열이 있으면 iterrows가 행 전체를 float로 올림
+    numeric = [
+        bool(values) and all(isinstance(v, (int, float)) for v in values)
+        for values in data
+    ]
+    if data and all(numeric) and any(isinstance(v, float) for values in data for v in values):
+        data = [[float(v) for v in values] for values in data]
+
+    metadata = {
+        "rows": row_count,
+        "cols": len(columns),
+        "columns": columns
+    }
+
+    caption = table.find('caption')
+    if caption:
+        metadata["title"] = caption.get_text(strip=True)
+
+    headers = [_markdown_cell(column) for column in columns]
+    lines = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join(["---"] * len(headers)) + "|"
+    ]
+    for r in range(row_count):
+        lines.append("| " + " | ".join(_markdown_cell(values[r]) for values in data) + " |")
+
+    return "\n".join(lines), metadata
+
+
+# ==================== 수치 셀 ====================
+
+# "(단위 : 백만원)", "[단위: 천주, %]" 등 단위 표기
+# (괄호 안 캡션 형식만 인정 - "단위당 판매가격은 ..." 같은 본문 문장은 제외)
+_RE_UNIT = re.compile(r"[(\[]\s*단위\s*[:：]\s*([^)\]]{1,15})[)\]]")
+_RE_AMOUNT = re.compile(r"[-+]?\d+(\.\d+)?")
+# 단위 배수 접두어 (긴 것부터 비교)
+_UNIT_SCALES = (
+    ("조", 10 ** 12), ("억", 10 ** 8), ("천만", 10 ** 7), ("백만", 10 ** 6),
+    ("십만", 10 ** 5), ("만", 10 ** 4), ("천", 10 ** 3), ("백", 10 ** 2)
+)
+# 인정하는 기본 단위 (배수 접두어를 뗀 뒤 비교)
+_BASE_UNITS = {
+    "원", "달러", "USD", "엔", "JPY", "위안", "CNY", "유로", "EUR", "%", "주", "좌", "명", "개", "건",
+    "대", "톤", "kg", "㎏", "m2", "㎡", "배", "회", "개월", "년", "일", "시간", "kWh", "MWh", "GWh", "bbl"
+}
+# 단위 표기에 %가 함께 있을 때 % 단위로 보는 열 이름
+_RE_RATIO_LABEL = re.compile(r"비중|비율|률|%")
+# 음수 표기 (△1,234 / ▲1,234)
+_NEGATIVE_MARKS = ("△", "▲")
+
+# (행 번호, 열 번호, 행 이름, 열 이름, 원문, 값, 단위, 배수)
+TableCell = Tuple[int, int, str, str, str, Union[int, float], Optional[str], int]
+
+
+def find_unit(text: str) -> Optional[str]:
+    """
+    텍스트의 마지막 단위 표기 ("(단위 : 억원, %)" -> "억원, %")
+
+    인정하는 기본 단위(_BASE_UNITS)가 아닌 항목은 버리고, 남는 항목이 없으면 None
+    """
+    for unit_text in reversed(_RE_UNIT.findall(text)):
+        parts = [part.strip() for part in re.split(r"[,/]", unit_text) if part.strip()]
+        known = [part for part in parts if unit_scales(part) and unit_scales(part)[0][0] in _BASE_UNITS]
+        if known:
+            return ", ".join(known)
+    return None
+
+
+def unit_scales(unit_text: str) -> List[Tuple[str, int]]:
+    """
+    단위 표기를 (기본 단위, 배수) 목록으로 변환
+
+    예: "백만원" -> [("원", 1000000)], "억원, %" -> [("원", 100000000), ("%", 1)]
+    """
+    units = []
+    for part in re.split(r"[,/]", unit_text):
+        part = part.replace(" ", "")
+        if not part:
+            continue
+        scale = 1
+        for prefix, multiplier in _UNIT_SCALES:
+            if part.startswith(prefix) and len(part) > len(prefix):
+                scale, part = multiplier, part[len(prefix):]
+                break
+        units.append((part, scale))
+    return units
+
+
+def parse_amount(text: str) -> Optional[Union[int, float]]:
+    """
+    재무 수치 셀 변환 (천 단위 구분자, 괄호/△ 음수, % 허용, 숫자가 아니면 None)
+
+    예: "1,234" -> 1234, "(1,234)" -> -1234, "△12.5" -> -12.5, "65.0%" -> 65.0, "-" -> None
+    """
+    value = text.replace(",", "").replace(" ", "")
+    negative = False
+    if value.startswith("(") and value.endswith(")"):
+        negative, value = True, value[1:-1]
+    if value.startswith(_NEGATIVE_MARKS):
+        negative, value = True, value[1:]
+    value = value[:-1] if value.endswith("%") else value
+
+    if not _RE_AMOUNT.fullmatch(value):
+        return None
+    number = float(value) if "." in value else int(value)
+    return -number if negative else number
+
+
+def table_cells(table, expanded: Tuple = None, unit_text: Optional[str] = None) -> List[TableCell]:
+    """
+    테이블의 수치 셀을 (행 이름, 열 이름, 값, 단위, 배수) 레코드로 변환
+
+    - 수치가 하나도 없는 열은 행 이름 열로 보고, 행 이름은 그 열들의 텍스트를 " > "로 연결
+    - 열 이름은 헤더 행들의 텍스트를 " > "로 연결 (헤더가 없으면 수치가 없는 첫 행을 헤더로 사용)
+    - 단위는 unit_text의 첫 단위, 단위에 %가 있으면 비중/비율 열은 %
+
+    Args:
+        table: BeautifulSoup table 요소
+        expanded: 이미 계산한 expand_table 결과 (없으면 새로 계산)
+        unit_text: 단위 표기 (find_unit 결과)
+
+    Returns:
+        List[TableCell]: 수치 셀 레코드 (수치가 아닌 셀은 제외)
+    """
+    header, body = expanded or expand_table(table)
+    values = [[parse_amount(text) for text in row] for row in body]
+
+    if not header and values and all(value is None for value in values[0]):
+        header, body, values = [body[0]], body[1:], values[1:]
+    if not body:
+        return []
+
+    width = len(body[0])
+    label_columns = [c for c in range(width) if all(row[c] is None for row in values)]
+    column_labels = [" > ".join(dict.fromkeys(row[c] for row in header if row[c])) for c in range(width)]
+
+    units = unit_scales(unit_text) if unit_text else []
+    default_unit, default_scale = units[0] if units else (None, 1)
+    has_ratio = any(unit == "%" for unit, _ in units)
+
+    cells = []
+    for r, (row, row_values) in enumerate(zip(body, values)):
+        row_label = " > ".join(dict.fromkeys(row[c] for c in label_columns if row[c]))
+        for c, value in enumerate(row_values):
+            if value is None:
+                continue
+            if has_ratio and _RE_RATIO_LABEL.search(column_labels[c]):
+                unit, scale = "%", 1
+            else:
+                unit, scale = default_unit, default_scale
+            cells.append((r, c, row_label, column_labels[c], row[c], value, unit, scale))
+    return cells
@@ -0,0 +1,321 @@
+"""
+페이지 캐시 모듈 - DART 보고서 페이지 원본 HTML 로컬 보관
+접수번호(rcept_no) + 페이지 식별자 기준 압축 저장, 용량 상한 초과 시 LRU 제거
+"""
+import os
+import json
+import time
+import zlib
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Callable
+from config import PAGE_CACHE_CONFIG
+
+
+class PageCacheMiss(LookupError):
+    """오프라인 모드에서 캐시에 없는 보고서/페이지를 요청한 경우"""
+
+
+class CachedPage:
+    """
+    캐시를 거쳐 HTML을 읽는 페이지 (dart_fss Page와 동일한 속성 제공)
+
+    캐시에 없으면 페이지 정보(spec)로 dart_fss Page를 만들어 내려받은 뒤 저장합니다.
+    보고서 목차(main.do) 재조회 없이 페이지 단위로 다운로드할 수 있습니다.
+    """
+
+    def __init__(self, cache: Optional['PageCache'], rcept_no: str, spec: Dict, offline: bool = False):
+        """
+        Args:
+            cache: 페이지 캐시 (None이면 캐시 없이 페이지 정보만 보관)
+            rcept_no: 접수번호
+            spec: Page.to_dict(summary=False) 결과 (title, dcm_no, ele_id, offset, length, dtd)
+            offline: True면 캐시 미스 시 다운로드 대신 PageCacheMiss 발생
+        """
+        self.cache = cache
+        self.rcp_no = rcept_no
+        self.spec = spec
+        self.offline = offline
+        self.title = spec.get('title')
+        self.ele_id = spec.get('ele_id')
+        self.dcm_no = spec.get('dcm_no')
+
+    @property
+    def key(self) -> str:
+        """보고서 내 페이지 식별자"""
+        return PageCache.page_key(self.spec)
+
+    def cached_html(self) -> Optional[str]:
+        """캐시된 HTML (없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.rcp_no, self.key)
+
+    def store(self, html: str):
+        """다운로드한 HTML 캐시 저장"""
+        if self.cache is not None:
+            self.cache.put(self.rcp_no, self.key, html)
+
+    @property
+    def html(self) -> str:
+        """페이지 HTML (캐시 우선, 미스 시 다운로드 후 저장)"""
+        html = self.cached_html()
+        if html is not None:
+            return html
+
+        if self.offline:
+            raise PageCacheMiss(f"캐시에 없는 페이지: {self.rcp_no}/{self.key} ({self.title})")
+
+        from dart_fss.filings.pages import Page
+
+        page = Page(
+            self.title, self.rcp_no, self.dcm_no, int(self.ele_id),
+            self.spec.get('offset'), self.spec.get('length'), self.spec.get('dtd')
+        )
+        html = page.html
+        self.store(html)
+        return html
+
+
+class PageCache:
+    """
+    보고서 페이지 HTML 압축 캐시
+
+    디렉터리 구조:
+        {root}/{rcept_no}/manifest.json      # 보고서 메타정보 + 페이지 목록
+        {root}/{rcept_no}/{dcm_no}-{ele_id}.html.z   # zlib 압축 HTML
+
+    보고서 단위로 최근 접근 시각(manifest mtime)을 갱신하며,
+    전체 용량이 상한을 넘으면 가장 오래 사용하지 않은 보고서부터 제거합니다.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    PAGE_SUFFIX = ".html.z"
+
+    def __init__(self, root: str = None, max_size_mb: float = None, compress_level: int = None):
+        """
+        Args:
+            root: 캐시 디렉터리 (기본: config 설정값)
+            max_size_mb: 최대 용량 (MB, 기본: config 설정값)
+            compress_level: zlib 압축 레벨 1~9 (기본: config 설정값)
+        """
+        self.root = Path(root or PAGE_CACHE_CONFIG['path'])
+        max_size_mb = max_size_mb if max_size_mb is not None else PAGE_CACHE_CONFIG['max_size_mb']
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.compress_level = compress_level or PAGE_CACHE_CONFIG.get('compress_level', 6)
+        self._total_bytes: Optional[int] = None  # 최초 저장 시 디렉터리 스캔으로 계산
+        self._evict_blocked: Optional[str] = None  # 제거할 수 있는 다른 보고서가 없었던 접수번호 (재스캔 생략)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def page_key(spec: Dict) -> str:
+        """페이지 식별자 (dcm_no-ele_id)"""
+        return f"{spec.get('dcm_no')}-{spec.get('ele_id')}"
+
+    def _report_dir(self, rcept_no: str) -> Path:
+        return self.root / str(rcept_no)
+
+    def _touch(self, rcept_no: str):
+        """보고서 최근 접근 시각 갱신 (LRU 기준)"""
+        try:
+            os.utime(self._report_dir(rcept_no) / self.MANIFEST_NAME)
+        except FileNotFoundError:
+            pass
+
+    # ==================== 페이지 ====================
+
+    def get(self, rcept_no: str, page_key: str) -> Optional[str]:
+        """캐시된 페이지 HTML 반환 (없거나 손상 시 None)"""
+        path = self._report_dir(rcept_no) / (page_key + self.PAGE_SUFFIX)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            html = zlib.decompress(data).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            print(f"⚠️ 손상된 페이지 캐시 삭제: {path}")
+            path.unlink(missing_ok=True)
+            return None
+
+        self._touch(rcept_no)
+        return html
+
+    def put(self, rcept_no: str, page_key: str, html: str):
+        """페이지 HTML 압축 저장"""
+        data = zlib.compress(html.encode('utf-8'), self.compress_level)
+        added = self._write(self._report_dir(rcept_no) / (page_key + self.PAGE_SUFFIX), data)
+        self._touch(rcept_no)
+        self._account(added, keep=rcept_no)
+
+    # ==================== 보고서 목차 ====================
+
+    def get_manifest(self, rcept_no: str) -> Optional[Dict]:
+        """보고서 manifest (메타정보 + 페이지 목록) 반환"""
+        path = self._report_dir(rcept_no) / self.MANIFEST_NAME
+        try:
+            manifest = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            print(f"⚠️ 손상된 보고서 manifest 무시: {path}")
+            return None
+
+        self._touch(rcept_no)
+        return manifest
+
+    def put_manifest(self, rcept_no: str, report_info: Dict, pages: List[Dict]):
+        """
+        보고서 manifest 저장
+
+        Args:
+            rcept_no: 접수번호
+            report_info: 보고서 메타정보 (corp_code, corp_name, report_nm 등)
+            pages: 페이지 정보 목록 (Page.to_dict(summary=False))
+        """
+        data = json.dumps({
+            "rcept_no": rcept_no,
+            "report": report_info,
+            "pages": pages,
+            "cached_at": time.time()
+        }, ensure_ascii=False).encode('utf-8')
+        added = self._write(self._report_dir(rcept_no) / self.MANIFEST_NAME, data)
+        self._account(added, keep=rcept_no)
+
+    def get_pages(
+        self,
+        report,
+        offline: bool = False,
+        list_pages: Callable[[], List[Dict]] = None
+    ) -> List[CachedPage]:
+        """
+        보고서 페이지 목록 (캐시 경유)
+
+        manifest가 있으면 보고서 목차 조회 없이 페이지 목록을 복원하고,
+        없으면 목차를 읽어 manifest로 저장합니다.
+
+        Args:
+            report: dart_fss Report 객체 (rcept_no 보유)
+            offline: True면 manifest가 없을 때 PageCacheMiss 발생
+            list_pages: 목차 조회 함수 (기본: report.pages, 비동기 클라이언트 사용 시 교체)
+
+        Returns:
+            List[CachedPage]: 캐시를 거쳐 HTML을 읽는 페이지 목록
+        """
+        rcept_no = report.rcept_no
+        manifest = self.get_manifest(rcept_no)
+
+        if manifest is None:
+            if offline:
+                raise PageCacheMiss(f"캐시에 없는 보고서: {rcept_no}")
+            if list_pages is not None:
+                pages = list_pages()
+            else:
+                pages = [page.to_dict(summary=False) for page in report.pages]
+            report_info = {
+                key: value for key, value in getattr(report, 'info', {}).items()
+                if isinstance(value, str)
+            }
+            self.put_manifest(rcept_no, report_info, pages)
+        else:
+            pages = manifest['pages']
+
+        return [CachedPage(self, rcept_no, spec, offline=offline) for spec in pages]
+
+    def list_reports(self) -> List[Dict]:
+        """
+        캐시된 보고서 메타정보 목록 (오프라인 재처리용, 접수번호 순)
+
+        Returns:
+            List[Dict]: rcept_no를 포함한 보고서 메타정보 리스트
+        """
+        reports = []
+        if not self.root.exists():
+            return reports
+
+        for report_dir in sorted(self.root.iterdir()):
+            manifest_path = report_dir / self.MANIFEST_NAME
+            if not manifest_path.is_file():
+                continue
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+            except ValueError:
+                continue
+            reports.append({**manifest.get('report', {}), "rcept_no": manifest['rcept_no']})
+        return reports
+
+    # ==================== 저장 / 용량 관리 ====================
+
+    def _write(self, path: Path, data: bytes) -> int:
+        """
+        원자적 파일 저장 (임시 파일 작성 후 교체)
+
+        Returns:
+            int: 늘어난 용량 (바이트, 기존 파일을 덮어쓰면 기존 크기를 뺀 값)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        os.replace(tmp_path, path)
+        return len(data) - old_size
+
+    @staticmethod
+    def _dir_size(report_dir: Path) -> int:
+        return sum(f.stat().st_size for f in report_dir.iterdir() if f.is_file())
+
+    def size_bytes(self) -> int:
+        """현재 캐시 전체 용량 (바이트, 디렉터리 스캔)"""
+        if not self.root.exists():
+            return 0
+        return sum(self._dir_size(d) for d in self.root.iterdir() if d.is_dir())
+
+    def _account(self, added: int, keep: str):
+        """저장 용량 반영 후 상한 초과 시 LRU 제거"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self.size_bytes()
+            else:
+                self._total_bytes += added
+
+            # 직전 정리에서 keep 외에 제거할 보고서가 없었다면 같은 보고서 저장 중에는 다시 스캔하지 않음
+            if self._total_bytes > self.max_bytes and self._evict_blocked != str(keep):
+                self._evict(keep=keep)
+
+    def _evict(self, keep: str):
+        """
+        오래 사용하지 않은 보고서부터 제거 (상한의 90%까지, lock 보유 상태에서 호출)
+
+        Args:
+            keep: 제거하지 않을 접수번호 (현재 저장 중인 보고서)
+        """
+        entries = []
+        for report_dir in self.root.iterdir():
+            if not report_dir.is_dir() or report_dir.name == str(keep):
+                continue
+            manifest_path = report_dir / self.MANIFEST_NAME
+            stat_target = manifest_path if manifest_path.exists() else report_dir
+            entries.append((stat_target.stat().st_mtime, report_dir))
+
+        self._total_bytes = self.size_bytes()
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+
+        for _, report_dir in sorted(entries):
+            if self._total_bytes <= target:
+                break
+            size = self._dir_size(report_dir)
+            shutil.rmtree(report_dir, ignore_errors=True)
+            self._total_bytes -= size
+            evicted += 1
+
+        # 다른 보고서를 모두 제거해도 목표를 넘으면 keep 보고서 저장이 끝날 때까지 정리 생략
+        self._evict_blocked = str(keep) if self._total_bytes > target else None
+
+        if evicted:
+            print(f"🧹 페이지 캐시 정리: {evicted}개 보고서 제거 (현재 {self._total_bytes / 1024 / 1024:.1f}MB)")
@@ -1,13 +1,14 @@
 """
 파이프라인 모듈 - DART 데이터 수집 및 DB 적재 오케스트레이션
-배치 처리, Rate Limiting, 에러 핸들링 담당
+배치 처리, 에러 핸들링 담당 (Rate Limiting은 rate_limiter 모듈의 토큰 버킷이 담당)
 """
 import time
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 from config import BATCH_CONFIG
+from .block_spool import BlockSpool
 from .db_manager import DBManager
-from .dart_agent import DartReportAgent
+from .dart_agent import DartReportAgent, ReportFetchError
 
 
 class DataPipeline:
@@ -15,8 +16,13 @@ class DataPipeline:
     DART 사업보고서 데이터 수집 및 DB 적재 파이프라인
     """
 
-    def __init__(self):
-        self.agent = DartReportAgent()
+    def __init__(self, refresh_corps: bool = False, offline: bool = False):
+        """
+        Args:
+            refresh_corps: True면 기업 리스트 스냅샷 강제 갱신
+            offline: True면 DART 접속 없이 페이지 캐시만 사용 (run_offline)
+        """
+        self.agent = DartReportAgent(refresh_corps=refresh_corps, offline=offline)
         self.stats = {
             "total": 0,
             "success": 0,
@@ -86,12 +92,6 @@ class DataPipeline:
 
             self._process_batch(batch, batch_idx, len(batches))
 
-            # 배치 간 딜레이 (마지막 배치 제외)
-            if batch_idx < len(batches) - 1:
-                delay = BATCH_CONFIG['batch_delay_sec']
-                print(f"   ⏳ 다음 배치까지 {delay}초 대기...")
-                time.sleep(delay)
-
         # 4. 결과 요약
         self.stats["end_time"] = datetime.now()
         self._print_summary()
@@ -120,19 +120,22 @@ class DataPipeline:
         bgn_de: str = None,
         end_de: str = None,
         reset_db: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        force: bool = False
     ):
         """
         효율적인 파이프라인 실행 - 사업보고서가 있는 기업만 처리
 
         기존 방식: 전체 상장사 순회 → 개별 API 호출로 보고서 확인
         새로운 방식: dart.filings.search로 기간 내 사업보고서 일괄 검색 후 처리
+        이미 적재가 완료된 보고서는 페이지 수집 전에 쿼리 1회로 걸러냅니다.
 
         Args:
             bgn_de: 검색 시작일 (YYYYMMDD)
             end_de: 검색 종료일 (YYYYMMDD), 기본값은 오늘
             reset_db: DB 초기화 여부
             limit: 최대 처리 기업 수 (테스트용)
+            force: True면 적재 완료된 보고서도 다시 처리
         """
         self.stats["start_time"] = datetime.now()
 
@@ -153,6 +156,10 @@ class DataPipeline:
         print("\n📋 사업보고서가 있는 기업 검색 중...")
         corps_with_reports = self.agent.get_corps_with_reports(bgn_de=bgn_de, end_de=end_de)
 
+        # 적재 완료된 보고서 제외 (새 보고서 / 적재가 끝나지 않은 보고서만 처리)
+        if not force and not reset_db:
+            corps_with_reports = self._exclude_loaded_reports(corps_with_reports)
+
         if limit:
             corps_with_reports = corps_with_reports[:limit]
 
@@ -169,11 +176,54 @@ class DataPipeline:
 
             self._process_batch_with_reports(batch, batch_idx, len(batches))
 
-            # 배치 간 딜레이 (마지막 배치 제외)
-            if batch_idx < len(batches) - 1:
-                delay = BATCH_CONFIG['batch_delay_sec']
-                print(f"   ⏳ 다음 배치까지 {delay}초 대기...")
-                time.sleep(delay)
+        # 4. 결과 요약
+        self.stats["end_time"] = datetime.now()
+        self._print_summary()
+
+        return self.stats
+
+    def run_offline(self, reset_db: bool = False, limit: Optional[int] = None):
+        """
+        오프라인 재처리 - 페이지 캐시에 저장된 보고서를 DART 접속 없이 다시 파싱/적재
+
+        CHUNK_CONFIG, TARGET_SECTIONS, 파서 변경 후 재처리에 사용합니다.
+        캐시에 없는 페이지는 건너뜁니다.
+
+        Args:
+            reset_db: DB 초기화 여부
+            limit: 최대 처리 보고서 수 (테스트용)
+        """
+        self.stats["start_time"] = datetime.now()
+
+        print("\n" + "=" * 60)
+        print("🚀 DART 데이터 파이프라인 시작 (오프라인 모드)")
+        print("=" * 60)
+        print(f"   시작 시간: {self.stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # 1. DB 초기화
+        with DBManager() as db:
+            if reset_db:
+                print("\n⚠️ DB 초기화 중...")
+                db.reset_db()
+            else:
+                db.init_db()
+
+        # 2. 캐시된 보고서 목록
+        corps_with_reports = self.agent.get_cached_reports()
+
+        if limit:
+            corps_with_reports = corps_with_reports[:limit]
+
+        self.stats["total"] = len(corps_with_reports)
+        print(f"\n📋 캐시된 보고서 수: {self.stats['total']}")
+
+        # 3. 배치 처리
+        batches = self._create_batches(corps_with_reports)
+        for batch_idx, batch in enumerate(batches):
+            print(f"\n{'─' * 50}")
+            print(f"📦 배치 {batch_idx + 1}/{len(batches)} 처리 중...")
+
+            self._process_batch_with_reports(batch, batch_idx, len(batches))
 
         # 4. 결과 요약
         self.stats["end_time"] = datetime.now()
@@ -181,6 +231,24 @@ class DataPipeline:
 
         return self.stats
 
+    def _exclude_loaded_reports(self, corps_with_reports: List[Tuple]) -> List[Tuple]:
+        """
+        적재가 완료된 보고서를 처리 대상에서 제외 (후보 접수번호 전체를 쿼리 1회로 확인)
+
+        Args:
+            corps_with_reports: (corp 객체, report) 튜플 리스트
+
+        Returns:
+            List[Tuple]: 새 보고서 또는 적재가 끝나지 않은 보고서만 남긴 리스트
+        """
+        rcept_nos = [getattr(report, 'rcept_no', None) for _, report in corps_with_reports]
+        with DBManager() as db:
+            loaded = db.get_loaded_rcept_nos(rcept_nos)
+
+        if loaded:
+            print(f"⏭️ 이미 적재된 보고서 {len(loaded)}건 제외")
+        return [item for item, rcept_no in zip(corps_with_reports, rcept_nos) if rcept_no not in loaded]
+
     def _process_batch_with_reports(self, batch: List[Tuple], batch_idx: int, total_batches: int):
         """
         사전 검색된 보고서 정보를 포함한 배치 처리
@@ -207,16 +275,14 @@ class DataPipeline:
                     "corp_code": corp.corp_code
                 })
 
-            # 요청 간 딜레이
-            time.sleep(BATCH_CONFIG['request_delay_sec'])
-
     def _process_single_corp_with_report(self, corp, report_info) -> Optional[bool]:
         """
         단일 기업 처리 (사전 검색된 보고서 정보 활용)
 
         Args:
             corp: 기업 객체
-            report_info: 사전 검색된 Report 객체 (dart.filings.search 결과)
+            report_info: 사전 검색된 Report 객체 (dart.filings.search 결과),
+                검색 결과 딕셔너리 또는 접수번호(rcept_no)
 
         Returns:
             True: 성공
@@ -225,63 +291,64 @@ class DataPipeline:
         """
         corp_name = corp.corp_name
         corp_code = corp.corp_code
-        stock_code = corp.stock_code
 
         try:
-            # Report 객체에서 정보 추출 (속성 접근)
-            rcept_no = getattr(report_info, 'rcp_no', None) or getattr(report_info, 'rcept_no', None)
-            report_nm = getattr(report_info, 'report_nm', 'Unknown')
-
-            print(f"   📄 보고서: {report_nm}")
-
-            # 이미 Report 객체를 가지고 있으므로 직접 사용
-            # 단, 상세 정보가 필요하면 get_annual_report로 다시 조회
-            report = self.agent.get_annual_report(corp_code)
-
-            if not report:
-                print(f"   ⚠️ 보고서 상세 조회 실패 - 스킵")
-                return None
+            # 검색된 보고서를 그대로 사용 (기업별 추가 검색 없음, 페이지는 lazy loading)
+            report = self.agent.get_report(report_info, corp_code=corp_code, corp_name=corp_name)
+            report_nm = getattr(report, 'report_nm', 'Unknown')
 
-            # 2. 핵심 섹션 순차적 블록 추출
-            sections = self.agent.extract_target_sections_sequential(report)
+            print(f"   📄 보고서: {report_nm} ({report.rcept_no})")
 
-            if not sections:
-                print(f"   ⚠️ 추출 가능한 섹션 없음 - 스킵")
-                return None
+            # 2. 핵심 섹션 블록을 임시 파일에 기록 (다운로드/파싱은 DB 트랜잭션 밖에서, 메모리는 페이지 구간 분량만 사용)
+            #    페이지가 하나라도 실패하면 ReportFetchError로 적재하지 않음 (실패로 집계되어 재시도 대상)
+            with BlockSpool() as spool:
+                for _, blocks in self.agent.iter_target_section_blocks(report, strict=True):
+                    spool.write(blocks)
 
-            # 3. DB 저장
-            with DBManager() as db:
-                # 기업 등록
-                company_id = db.insert_company(corp_name, corp_code, stock_code)
-                print(f"   🏢 기업 등록 완료 (ID: {company_id})")
+                if not spool.pages:
+                    print(f"   ⚠️ 추출 가능한 섹션 없음 - 스킵")
+                    return None
 
-                # 리포트 등록 - Report 객체에서 정보 추출
+                # 3. DB 저장 (기업/리포트 UPSERT + 블록 교체를 한 트랜잭션으로 적재)
                 report_meta = self.agent.get_report_info(report)
-                report_id = db.insert_report(company_id, report_meta)
-                print(f"   📋 리포트 등록 완료 (ID: {report_id})")
-
-                # 섹션별 블록 저장 (순차적 블록 처리)
-                total_blocks = 0
-                text_count = 0
-                table_count = 0
-
-                for section in sections:
-                    blocks = section.get('blocks', [])
-                    saved = db.insert_materials_batch(report_id, blocks)
-                    total_blocks += saved
-                    text_count += sum(1 for b in blocks if b['chunk_type'] == 'text')
-                    table_count += sum(1 for b in blocks if b['chunk_type'] == 'table')
-
-                print(f"   📥 {total_blocks}개 블록 저장 완료 (텍스트: {text_count}, 테이블: {table_count})")
+                with DBManager() as db:
+                    self._ingest_block_pages(db, corp, report_meta, spool)
 
             return True
 
+        except ReportFetchError as e:
+            print(f"   ❌ 처리 실패 (적재하지 않음, 재시도 대상): {e}")
+            return False
+
         except Exception as e:
             print(f"   ❌ 처리 실패: {e}")
             import traceback
             traceback.print_exc()
             return False
 
+    def _ingest_block_pages(self, db: DBManager, corp, report_info: Dict, spool: BlockSpool) -> int:
+        """
+        스풀에 기록된 섹션 블록을 한 트랜잭션으로 적재
+
+        페이지 다운로드/파싱 중에는 DB 연결과 행 잠금을 잡지 않도록 블록을 스풀에 모두 기록한 뒤 호출하며,
+        트랜잭션 안에서는 스풀을 페이지 단위로 읽어 저장합니다.
+
+        Args:
+            db: DBManager
+            corp: 기업 정보 (corp_name, corp_code, stock_code)
+            report_info: 보고서 정보 (DartReportAgent.get_report_info() 결과)
+            spool: DartReportAgent.iter_target_section_blocks()의 페이지 블록을 기록한 BlockSpool
+
+        Returns:
+            int: 리포트 ID
+        """
+        report_id, total_blocks = db.ingest_report(
+            corp.corp_name, corp.corp_code, corp.stock_code, report_info, spool
+        )
+        print(f"   📋 리포트 적재 완료 (ID: {report_id}) - {total_blocks}개 블록 "
+              f"(텍스트: {spool.counts['text']}, 테이블: {spool.counts['table']})")
+        return report_id
+
     # ==================== 배치 처리 ====================
 
     def _create_batches(self, items: List) -> List[List]:
@@ -310,9 +377,6 @@ class DataPipeline:
                     "corp_code": corp.corp_code
                 })
 
-            # 요청 간 딜레이
-            time.sleep(BATCH_CONFIG['request_delay_sec'])
-
     def _process_single_corp(self, corp) -> Optional[bool]:
         """
         단일 기업 처리 (순차적 블록 처리 방식)
@@ -322,9 +386,7 @@ class DataPipeline:
             False: 실패
             None: 스킵 (보고서 없음 등)
         """
-        corp_name = corp.corp_name
         corp_code = corp.corp_code
-        stock_code = corp.stock_code
 
         try:
             # 1. 사업보고서 검색
@@ -336,40 +398,27 @@ class DataPipeline:
 
             print(f"   📄 보고서: {report.report_nm}")
 
-            # 2. 핵심 섹션 순차적 블록 추출
-            sections = self.agent.extract_target_sections_sequential(report)
+            # 2. 핵심 섹션 블록을 임시 파일에 기록 (다운로드/파싱은 DB 트랜잭션 밖에서, 메모리는 페이지 구간 분량만 사용)
+            #    페이지가 하나라도 실패하면 ReportFetchError로 적재하지 않음 (실패로 집계되어 재시도 대상)
+            with BlockSpool() as spool:
+                for _, blocks in self.agent.iter_target_section_blocks(report, strict=True):
+                    spool.write(blocks)
 
-            if not sections:
-                print(f"   ⚠️ 추출 가능한 섹션 없음 - 스킵")
-                return None
+                if not spool.pages:
+                    print(f"   ⚠️ 추출 가능한 섹션 없음 - 스킵")
+                    return None
 
-            # 3. DB 저장
-            with DBManager() as db:
-                # 기업 등록
-                company_id = db.insert_company(corp_name, corp_code, stock_code)
-                print(f"   🏢 기업 등록 완료 (ID: {company_id})")
-
-                # 리포트 등록
+                # 3. DB 저장 (기업/리포트 UPSERT + 블록 교체를 한 트랜잭션으로 적재)
                 report_info = self.agent.get_report_info(report)
-                report_id = db.insert_report(company_id, report_info)
-                print(f"   📋 리포트 등록 완료 (ID: {report_id})")
-
-                # 섹션별 블록 저장 (순차적 블록 처리)
-                total_blocks = 0
-                text_count = 0
-                table_count = 0
-
-                for section in sections:
-                    blocks = section.get('blocks', [])
-                    saved = db.insert_materials_batch(report_id, blocks)
-                    total_blocks += saved
-                    text_count += sum(1 for b in blocks if b['chunk_type'] == 'text')
-                    table_count += sum(1 for b in blocks if b['chunk_type'] == 'table')
-
-                print(f"   📥 {total_blocks}개 블록 저장 완료 (텍스트: {text_count}, 테이블: {table_count})")
+                with DBManager() as db:
+                    self._ingest_block_pages(db, corp, report_info, spool)
 
             return True
 
+        except ReportFetchError as e:
+            print(f"   ❌ 처리 실패 (적재하지 않음, 재시도 대상): {e}")
+            return False
+
         except Exception as e:
             print(f"   ❌ 처리 실패: {e}")
             import traceback
@@ -388,7 +437,7 @@ class DataPipeline:
 
         retry_corps = []
         for failed in self.failed_corps:
-            corp = self.agent.get_corp_by_stock_code(failed['stock_code'])
+            corp = self.agent.get_corp_by_corp_code(failed['corp_code'])
             if corp:
                 retry_corps.append(corp)
 
@@ -409,8 +458,6 @@ class DataPipeline:
                     "corp_code": corp.corp_code
                 })
 
-            time.sleep(BATCH_CONFIG['request_delay_sec'])
-
     # ==================== 결과 출력 ====================
 
     def _print_summary(self):
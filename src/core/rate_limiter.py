@@ -0,0 +1,326 @@
+"""
+Rate Limiter 모듈 - DART API 호출량 제어
+토큰 버킷(Token Bucket) 방식으로 분당 호출 한도를 스레드/프로세스 간 공유하고,
+dart_fss의 모든 HTTP 요청(검색, 기업 리스트, 보고서 페이지)에 적용
+"""
+import os
+import re
+import time
+import struct
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Tuple
+from config import RATE_LIMIT_CONFIG
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class _BucketState:
+    """토큰 버킷 상태 (프로세스 간 공유 시 파일에 그대로 저장)"""
+    __slots__ = ('tokens', 'updated_at', 'rate_factor', 'cooldown_until')
+
+    _STRUCT = struct.Struct("<dddd")
+
+    def __init__(self, tokens: float, updated_at: float, rate_factor: float = 1.0, cooldown_until: float = 0.0):
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.rate_factor = rate_factor
+        self.cooldown_until = cooldown_until
+
+    def pack(self) -> bytes:
+        return self._STRUCT.pack(self.tokens, self.updated_at, self.rate_factor, self.cooldown_until)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Optional['_BucketState']:
+        if len(data) != cls._STRUCT.size:
+            return None
+        return cls(*cls._STRUCT.unpack(data))
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷
+
+    호출마다 토큰 1개를 소비하며, 토큰이 없으면 다음 토큰이 채워질 때까지 대기합니다.
+    보충 속도는 (분당 한도 - 버킷 크기)로 설정되어, 버스트를 포함해도
+    임의의 1분 구간 호출 수가 분당 한도를 넘지 않습니다.
+
+    한도 초과 응답을 받으면 penalize()로 일정 시간 호출을 멈추고 보충 속도를 절반으로 낮춘 뒤,
+    recovery_sec에 걸쳐 원래 속도로 서서히 회복합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        backoff_sec: float = 10.0,
+        recovery_sec: float = 60.0,
+        min_rate_factor: float = 0.1
+    ):
+        """
+        Args:
+            rate_per_minute: 분당 허용 호출 수 (임의의 1분 구간 기준 상한)
+            capacity: 버킷 크기 (순간 최대 호출 수, 기본: 1초 분량)
+            backoff_sec: 한도 초과 응답 시 호출 중단 시간 (Retry-After 헤더가 있으면 우선)
+            recovery_sec: 낮춘 보충 속도가 원래 속도로 회복되는 데 걸리는 시간
+            min_rate_factor: 연속 한도 초과 시 보충 속도 하한 (원래 속도 대비 비율)
+        """
+        if capacity is None:
+            capacity = max(1.0, rate_per_minute / 60.0)
+        self.capacity = min(float(capacity), rate_per_minute / 2.0)
+        self.rate_per_sec = (rate_per_minute - self.capacity) / 60.0
+        self.backoff_sec = backoff_sec
+        self.recovery_sec = recovery_sec
+        self.min_rate_factor = min_rate_factor
+        self._lock = threading.Lock()
+        self._memory_state = self._initial_state(time.time())
+
+    def _initial_state(self, now: float) -> _BucketState:
+        return _BucketState(tokens=self.capacity, updated_at=now)
+
+    @contextmanager
+    def _locked_state(self):
+        """상태 잠금 후 반환 (하위 클래스에서 저장소 교체)"""
+        with self._lock:
+            yield self._memory_state
+
+    def _refill(self, state: _BucketState, now: float):
+        """경과 시간만큼 토큰 보충 및 보충 속도 회복 (잠금 보유 상태에서 호출)"""
+        elapsed = now - state.updated_at
+        if elapsed <= 0:
+            return
+        state.tokens = min(self.capacity, state.tokens + elapsed * self.rate_per_sec * state.rate_factor)
+        if state.rate_factor < 1.0:
+            state.rate_factor = min(1.0, state.rate_factor + elapsed / self.recovery_sec)
+        state.updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 시도 (대기하지 않음, asyncio 클라이언트용)
+
+        Args:
+            tokens: 소비할 토큰 수
+
+        Returns:
+            float: 0이면 획득 성공, 양수면 다시 시도하기까지 기다릴 시간 (초)
+        """
+        with self._locked_state() as state:
+            now = time.time()
+            if now < state.cooldown_until:
+                return state.cooldown_until - now
+
+            self._refill(state, now)
+            if state.tokens >= tokens:
+                state.tokens -= tokens
+                return 0.0
+            return (tokens - state.tokens) / (self.rate_per_sec * state.rate_factor)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (필요 시 대기)
+
+        Args:
+            tokens: 소비할 토큰 수
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> float:
+        """
+        한도 초과 응답 반영 (호출 중단 + 보충 속도 감소)
+
+        Args:
+            retry_after: 서버가 지정한 대기 시간 (초, 없으면 backoff_sec)
+
+        Returns:
+            float: 적용된 호출 중단 시간 (초)
+        """
+        pause = retry_after if retry_after is not None else self.backoff_sec
+        with self._locked_state() as state:
+            now = time.time()
+            self._refill(state, now)
+            state.rate_factor = max(self.min_rate_factor, state.rate_factor * 0.5)
+            state.tokens = 0.0
+            state.cooldown_until = max(state.cooldown_until, now + pause)
+            # 중단 시간 동안은 토큰이 보충되지 않도록 기준 시각을 중단 종료 시점으로 이동
+            state.updated_at = state.cooldown_until
+        return pause
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    파일 기반 프로세스 간 공유 토큰 버킷
+
+    같은 호스트의 여러 워커 프로세스가 하나의 상태 파일(32바이트)을 잠금 후 갱신하므로
+    프로세스 수와 무관하게 호스트 전체 호출량이 한도 안에 머뭅니다.
+    """
+
+    def __init__(self, rate_per_minute: float, state_path: str, **kwargs):
+        """
+        Args:
+            rate_per_minute: 분당 허용 호출 수
+            state_path: 공유 상태 파일 경로
+            **kwargs: TokenBucket 옵션 (capacity, backoff_sec 등)
+        """
+        super().__init__(rate_per_minute, **kwargs)
+        self.state_path = Path(state_path)
+        self._fd: Optional[int] = None
+        self._fd_pid: Optional[int] = None
+
+    def _open(self) -> int:
+        """상태 파일 열기 (fork된 자식 프로세스는 새로 연다)"""
+        if self._fd is None or self._fd_pid != os.getpid():
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+            self._fd_pid = os.getpid()
+        return self._fd
+
+    @contextmanager
+    def _locked_state(self):
+        """스레드 잠금 + 파일 잠금 후 상태 로드, 종료 시 저장"""
+        with self._lock:
+            fd = self._open()
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                state = _BucketState.unpack(os.read(fd, _BucketState._STRUCT.size))
+                if state is None:
+                    state = self._initial_state(time.time())
+                yield state
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, state.pack())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+# ==================== 공용 리미터 ====================
+
+_dart_limiter: Optional[TokenBucket] = None
+_dart_limiter_lock = threading.Lock()
+
+
+def get_dart_rate_limiter() -> TokenBucket:
+    """프로세스 공용 DART API 토큰 버킷 반환 (config의 RATE_LIMIT_CONFIG 기준)"""
+    global _dart_limiter
+    if _dart_limiter is None:
+        with _dart_limiter_lock:
+            if _dart_limiter is None:
+                options = dict(
+                    capacity=RATE_LIMIT_CONFIG.get('burst'),
+                    backoff_sec=RATE_LIMIT_CONFIG.get('backoff_sec', 10),
+                    recovery_sec=RATE_LIMIT_CONFIG.get('recovery_sec', 60)
+                )
+                state_path = RATE_LIMIT_CONFIG.get('shared_state_path')
+                if state_path:
+                    _dart_limiter = SharedTokenBucket(
+                        RATE_LIMIT_CONFIG['requests_per_minute'], state_path, **options
+                    )
+                else:
+                    _dart_limiter = TokenBucket(RATE_LIMIT_CONFIG['requests_per_minute'], **options)
+    return _dart_limiter
+
+
+# ==================== dart_fss 요청 래핑 ====================
+
+_OVER_LIMIT_STATUS = re.compile(rb'"status"\s*:\s*"020"')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) 파싱"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_signal(resp, stream: bool = False) -> Tuple[bool, Optional[float]]:
+    """
+    응답이 DART 호출 한도 초과인지 판별
+
+    Args:
+        resp: requests.Response
+        stream: 스트리밍 응답 여부 (본문을 읽지 않음)
+
+    Returns:
+        Tuple[bool, Optional[float]]: (한도 초과 여부, Retry-After 초)
+    """
+    if resp.status_code in RATE_LIMIT_CONFIG.get('retry_status_codes', (429,)):
+        return True, _parse_retry_after(resp.headers.get('Retry-After'))
+
+    # OpenDART API는 HTTP 200 + JSON status "020"(요청 제한 초과)으로 응답
+    if not stream and 'json' in resp.headers.get('Content-Type', ''):
+        if _OVER_LIMIT_STATUS.search(resp.content[:200]):
+            return True, None
+    return False, None
+
+
+def install_dart_rate_limiter(limiter: Optional[TokenBucket] = None) -> TokenBucket:
+    """
+    dart_fss 공용 Request 객체에 토큰 버킷 적용 (여러 번 호출해도 1회만 적용)
+
+    dart_fss의 모든 API/보고서 페이지 요청은 dart_fss.utils.request.request 싱글톤을 거치므로
+    해당 객체의 request()를 감싸 호출 전 토큰을 획득하고, 한도 초과 응답 시 재시도합니다.
+    dart_fss 내장 고정 딜레이(요청당 0.2초)는 제거됩니다.
+
+    Args:
+        limiter: 사용할 토큰 버킷 (기본: get_dart_rate_limiter())
+
+    Returns:
+        TokenBucket: 적용된 토큰 버킷
+    """
+    from dart_fss.utils.request import request as dart_request
+
+    limiter = limiter or get_dart_rate_limiter()
+    if getattr(dart_request, '_rate_limiter', None) is not None:
+        dart_request._rate_limiter = limiter
+        return limiter
+
+    original_request = dart_request.request
+    max_retries = RATE_LIMIT_CONFIG.get('max_retries', 5)
+
+    def limited_request(url: str, method: str = 'GET', payload: dict = None,
+                        referer: str = None, stream: bool = False, timeout: int = 120):
+        active_limiter = dart_request._rate_limiter
+        for attempt in range(max_retries + 1):
+            active_limiter.acquire()
+            resp = original_request(url, method=method, payload=payload,
+                                    referer=referer, stream=stream, timeout=timeout)
+            limited, retry_after = rate_limit_signal(resp, stream=stream)
+            if not limited or attempt == max_retries:
+                return resp
+            pause = active_limiter.penalize(retry_after)
+            print(f"⚠️ DART 호출 한도 초과 응답 - {pause:.1f}초 대기 후 재시도 ({attempt + 1}/{max_retries})")
+        return resp
+
+    dart_request.set_delay(None)
+    dart_request.request = limited_request
+    dart_request._rate_limiter = limiter
+    return limiter
@@ -0,0 +1,141 @@
+"""
+토큰 청커 모듈 - 임베딩 모델 토크나이저 기준 청크 분할
+임베딩 모델은 EMBEDDING_CONFIG['max_length'] 토큰에서 입력을 자르므로, 문자 수 대신
+토크나이저(fast)의 offset mapping으로 청크 경계를 정해 모든 청크가 잘림 없이 임베딩되도록 함
+"""
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Optional, List, Tuple
+from config import CHUNK_CONFIG, EMBEDDING_CONFIG
+
+# 청크 경계 구분자 (우선순위 순, block_parser.chunk_text와 공용)
+CHUNK_SEPARATORS = ('\n\n', '\n', '. ', '다. ', '요. ')
+
+_tokenizer = None
+_tokenizer_loaded = False
+
+
+def embedding_prefix(section_path: Optional[str]) -> str:
+    """임베딩 입력 앞에 붙는 섹션 경로 (embedding_worker와 청크 토큰 예산 계산에 공통 사용)"""
+    return f"문서 경로: {section_path or '알 수 없음'}\n"
+
+
+def get_tokenizer():
+    """
+    임베딩 모델의 fast 토크나이저 (프로세스당 1회 로드)
+
+    Returns:
+        토크나이저 (transformers 미설치 / 로드 실패 / fast 토크나이저가 아니면 None)
+    """
+    global _tokenizer, _tokenizer_loaded
+    if not _tokenizer_loaded:
+        _tokenizer_loaded = True
+        try:
+            from transformers import AutoTokenizer
+            tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_CONFIG['hf_model'], use_fast=True)
+            if not tokenizer.is_fast:
+                raise ValueError("fast 토크나이저가 아님 (offset mapping 미지원)")
+            _tokenizer = tokenizer
+        except Exception as e:
+            print(f"⚠️ 토크나이저 로드 실패 - 문자 수 기준 청킹으로 대체: {e}")
+    return _tokenizer
+
+
+def token_mode() -> bool:
+    """토큰 기준 청킹 사용 여부 (CHUNK_CONFIG['mode'] == 'tokens' 이고 토크나이저 사용 가능)"""
+    return CHUNK_CONFIG.get('mode') == 'tokens' and get_tokenizer() is not None
+
+
+def count_tokens(texts: List[str]) -> List[int]:
+    """텍스트별 토큰 수 (특수 토큰 제외, 배치 토큰화)"""
+    if not texts:
+        return []
+    encoded = get_tokenizer()(texts, add_special_tokens=False, return_attention_mask=False)
+    return [len(ids) for ids in encoded['input_ids']]
+
+
+@lru_cache(maxsize=1024)
+def chunk_budget(section_path: Optional[str] = None) -> int:
+    """
+    청크당 최대 토큰 수
+
+    임베딩 최대 길이에서 특수 토큰과 섹션 경로 접두어 토큰을 뺀 값
+    (CHUNK_CONFIG['max_tokens']가 더 작으면 그 값)
+    """
+    tokenizer = get_tokenizer()
+    budget = EMBEDDING_CONFIG['max_length'] - tokenizer.num_special_tokens_to_add()
+    budget -= count_tokens([embedding_prefix(section_path)])[0]
+    if CHUNK_CONFIG.get('max_tokens'):
+        budget = min(budget, CHUNK_CONFIG['max_tokens'])
+    return max(budget, 1)
+
+
+def chunk_text_by_tokens(
+    text: str,
+    max_tokens: int,
+    overlap: int = None
+) -> List[Tuple[str, int]]:
+    """
+    텍스트를 토큰 수 기준으로 청크 분할
+
+    토큰 offset mapping으로 max_tokens개 토큰 윈도우의 문자 범위를 구하고,
+    윈도우 후반부의 마지막 경계(문단 > 줄바꿈 > 문장 끝)에서 자릅니다.
+    분할 후 모든 청크를 한 번에 다시 토큰화해 max_tokens를 넘는 청크는 다시 나누므로
+    임베딩 시 잘리는 토큰이 없습니다.
+
+    Args:
+        text: 분할할 텍스트
+        max_tokens: 청크 최대 토큰 수 (특수 토큰 제외)
+        overlap: 청크 간 오버랩 토큰 수 (기본: CHUNK_CONFIG['token_overlap'])
+
+    Returns:
+        List[Tuple[str, int]]: (청크, 토큰 수) 리스트
+    """
+    overlap = CHUNK_CONFIG.get('token_overlap', 0) if overlap is None else overlap
+    min_size = CHUNK_CONFIG['min_chunk_size']
+
+    encoded = get_tokenizer()(text, add_special_tokens=False, return_offsets_mapping=True)
+    offsets = encoded['offset_mapping']
+    total = len(offsets)
+
+    if total <= max_tokens:
+        return [(text, total)] if len(text) >= min_size else []
+
+    token_starts = [start for start, _ in offsets]
+    chunks: List[Tuple[str, int]] = []
+    first = 0
+
+    while first < total:
+        last = min(first + max_tokens, total)  # 청크에 포함되지 않는 첫 토큰
+
+        # 문장 경계에서 자르기 시도 (윈도우 절반 이후에서 끝나는 마지막 경계)
+        if last < total:
+            for sep in CHUNK_SEPARATORS:
+                pos = text.rfind(sep, token_starts[first + max_tokens // 2], token_starts[last])
+                if pos >= 0:
+                    last = max(bisect_left(token_starts, pos + len(sep), first + 1, last), first + 1)
+                    break
+
+        chunk = text[token_starts[first]:offsets[last - 1][1]].strip()
+        count = last - first
+
+        if len(chunk) >= min_size or not chunks:
+            chunks.append((chunk, count))
+        elif chunks[-1][1] + count <= max_tokens:
+            # 너무 작으면 이전 청크에 병합 (토큰 예산 안에서만)
+            chunks[-1] = (chunks[-1][0] + " " + chunk, chunks[-1][1] + count)
+        else:
+            chunks.append((chunk, count))
+
+        if last >= total:
+            break
+        first = last - overlap if last - overlap > first else last
+
+    # 청크 단독 토큰화 결과로 토큰 수 확정 (경계 토큰이 달라져 예산을 넘으면 다시 분할)
+    result = []
+    for (chunk, _), count in zip(chunks, count_tokens([chunk for chunk, _ in chunks])):
+        if count > max_tokens and max_tokens > 1:
+            result.extend(chunk_text_by_tokens(chunk, max(2 * max_tokens - count, 1), overlap))
+        elif chunk:
+            result.append((chunk, count))
+    return result
@@ -25,6 +25,7 @@ class EmbeddingGenerator:
             'hf_model',
             'sentence-transformers/paraphrase-multilingual-mpnet-base-v2'
         )
+        self.max_length = EMBEDDING_CONFIG.get('max_length', 512)
 
         # 디바이스 설정
         if device is None:
@@ -73,24 +74,38 @@ class EmbeddingGenerator:
         """
         여러 텍스트 배치 임베딩 생성
 
+        토큰 길이순으로 정렬해 배치를 구성하므로 배치 내 패딩이 최소화되고,
+        max_length를 넘어 잘리는 텍스트가 있으면 개수를 알립니다.
+
         Args:
             texts: 임베딩할 텍스트 리스트
             batch_size: 배치 크기
 
         Returns:
-            List[List[float]]: 임베딩 벡터 리스트
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서)
         """
-        all_embeddings = []
+        if not texts:
+            return []
+
+        # 토큰 길이 (특수 토큰 포함) - 길이순 배치 구성 / 잘림 확인
+        lengths = self.tokenizer(texts, return_attention_mask=False, return_length=True)['length']
+        truncated = sum(1 for length in lengths if length > self.max_length)
+        if truncated:
+            print(f"⚠️ {truncated}개 텍스트가 {self.max_length}토큰을 넘어 잘림 (CHUNK_MODE=tokens 권장)")
 
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i:i + batch_size]
+        order = sorted(range(len(texts)), key=lambda idx: lengths[idx])
+        all_embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        for i in range(0, len(order), batch_size):
+            batch_idx = order[i:i + batch_size]
+            batch_texts = [texts[idx] for idx in batch_idx]
 
             # 토큰화
             encoded_input = self.tokenizer(
                 batch_texts,
                 padding=True,
                 truncation=True,
-                max_length=512,
+                max_length=self.max_length,
                 return_tensors='pt'
             )
             encoded_input = {k: v.to(self.device) for k, v in encoded_input.items()}
@@ -105,9 +120,8 @@ class EmbeddingGenerator:
             # 정규화 (선택적이지만 유사도 검색에 유용)
             embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
 
-            # CPU로 이동 후 리스트 변환
-            embeddings = embeddings.cpu().tolist()
-            all_embeddings.extend(embeddings)
+            # CPU로 이동 후 입력 순서 위치에 저장
+            for idx, embedding in zip(batch_idx, embeddings.cpu().tolist()):
+                all_embeddings[idx] = embedding
 
         return all_embeddings
-
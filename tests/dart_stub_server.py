@@ -0,0 +1,225 @@
+"""
+DART 스텁 서버 - AsyncDartClient / 비동기 백엔드 오프라인 테스트용 로컬 HTTP 서버
+
+OpenDART(list.json, corpCode.xml)와 DART 전자공시(main.do, viewer.do) 응답 형식을 흉내냅니다.
+
+사용법:
+    python tests/dart_stub_server.py --port 8765
+"""
+import io
+import json
+import time
+import zipfile
+import threading
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import Optional, List, Dict
+
+
+def sample_filings(count: int = 7) -> List[Dict]:
+    """검색 결과 샘플 (사업보고서)"""
+    return [
+        {
+            "corp_code": f"{idx:08d}",
+            "corp_name": f"테스트기업{idx}",
+            "stock_code": f"{idx:06d}",
+            "corp_cls": "Y",
+            "report_nm": "사업보고서 (2023.12)",
+            "rcept_no": f"2024031200{idx:04d}",
+            "flr_nm": f"테스트기업{idx}",
+            "rcept_dt": "20240312",
+            "rm": ""
+        }
+        for idx in range(1, count + 1)
+    ]
+
+
+def sample_pages() -> List[Dict]:
+    """보고서 목차/페이지 샘플 (title, html)"""
+    body = "본문 문장입니다. " * 20
+    return [
+        {"title": "I. 회사의 개요", "html": f"<html><body><p>{body}개요</p></body></html>"},
+        {"title": "II. 사업의 내용",
+         "html": f"<html><body><p>{body}사업</p><table><tr><td>매출</td><td>100</td></tr></table></body></html>"},
+        {"title": "III. 재무에 관한 사항", "html": f"<html><body><p>{body}재무</p></body></html>"},
+    ]
+
+
+class DartStubServer:
+    """
+    스레드에서 도는 DART 스텁 서버
+
+    Attributes:
+        filings: list.json이 반환할 검색 결과 행
+        pages: main.do / viewer.do가 반환할 페이지 목록 ({"title", "html"})
+        corps: corpCode.xml이 반환할 기업 목록
+        latency: 응답 지연 (초, 동시 요청 측정용)
+        rate_limited_requests: 처음 N개 요청에 HTTP 429 응답
+        max_in_flight: 관측된 최대 동시 처리 요청 수
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, page_count: int = 3):
+        self.filings = sample_filings()
+        self.pages = sample_pages()
+        self.corps = [
+            {"corp_code": f["corp_code"], "corp_name": f["corp_name"], "stock_code": f["stock_code"],
+             "modify_date": "20240101"}
+            for f in self.filings
+        ] + [{"corp_code": "99999999", "corp_name": "비상장기업", "stock_code": " ", "modify_date": "20240101"}]
+        self.page_count = page_count
+        self.latency = latency
+        self.rate_limited_requests = 0
+        self.requests: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stub._handle(self)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def opendart_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/api"
+
+    @property
+    def dart_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> 'DartStubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'DartStubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ==================== 요청 처리 ====================
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        url = urlparse(handler.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.requests.append(url.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            limited = self.rate_limited_requests > 0
+            if limited:
+                self.rate_limited_requests -= 1
+
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            if limited:
+                self._send(handler, 429, b"Too Many Requests", "text/plain", {"Retry-After": "0.05"})
+            elif url.path == "/api/list.json":
+                self._send_json(handler, self._list_json(params))
+            elif url.path == "/api/corpCode.xml":
+                self._send(handler, 200, self._corp_code_zip(), "application/x-msdownload")
+            elif url.path == "/dsaf001/main.do":
+                self._send(handler, 200, self._main_do(params['rcpNo']).encode('utf-8'), "text/html")
+            elif url.path == "/report/viewer.do":
+                html = self.pages[int(params['eleId']) - 1]['html']
+                self._send(handler, 200, html.encode('utf-8'), "text/html;charset=UTF-8")
+            else:
+                self._send(handler, 404, b"not found", "text/plain")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _list_json(self, params: Dict) -> Dict:
+        rows = self.filings
+        if params.get('corp_code'):
+            rows = [r for r in rows if r['corp_code'] == params['corp_code']]
+        if not rows:
+            return {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+        page_no = int(params.get('page_no', 1))
+        page_count = int(params.get('page_count', self.page_count))
+        total_page = (len(rows) + page_count - 1) // page_count
+        return {
+            "status": "000", "message": "정상",
+            "page_no": page_no, "page_count": page_count,
+            "total_count": len(rows), "total_page": total_page,
+            "list": rows[(page_no - 1) * page_count:page_no * page_count]
+        }
+
+    def _corp_code_zip(self) -> bytes:
+        items = "".join(
+            f"<list><corp_code>{c['corp_code']}</corp_code><corp_name>{c['corp_name']}</corp_name>"
+            f"<stock_code>{c['stock_code']}</stock_code><modify_date>{c['modify_date']}</modify_date></list>"
+            for c in self.corps
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr("CORPCODE.xml", f"<?xml version='1.0' encoding='UTF-8'?><result>{items}</result>")
+        return buffer.getvalue()
+
+    def _main_do(self, rcept_no: str) -> str:
+        nodes = []
+        for idx, page in enumerate(self.pages, start=1):
+            nodes.append(
+                f"\tvar node{idx} = {{}};\n"
+                f"\tnode{idx}['text'] = \"{page['title']}\";\n"
+                f"\tnode{idx}['rcpNo'] = \"{rcept_no}\";\n"
+                f"\tnode{idx}['dcmNo'] = \"9400000\";\n"
+                f"\tnode{idx}['eleId'] = \"{idx}\";\n"
+                f"\tnode{idx}['offset'] = \"{idx * 1000}\";\n"
+                f"\tnode{idx}['length'] = \"1000\";\n"
+                f"\tnode{idx}['dtd'] = \"dart3.xsd\";\n"
+            )
+        return "<html><head><script>\n" + "".join(nodes) + "</script></head><body></body></html>"
+
+    @staticmethod
+    def _send_json(handler: BaseHTTPRequestHandler, data: Dict):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        DartStubServer._send(handler, 200, body, "application/json;charset=UTF-8")
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str, headers: Dict = None):
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DART 스텁 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = DartStubServer(port=args.port, latency=args.latency)
+    print(f"🧪 DART 스텁 서버 실행: {server.dart_url} (OpenDART: {server.opendart_url})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,158 @@
+"""
+비동기 DART 클라이언트 테스트 스크립트
+로컬 DART 스텁 서버로 AsyncDartClient와 비동기 백엔드를 네트워크 없이 검증
+
+사용법:
+    python tests/test_async_dart_client.py
+"""
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from src.core.async_dart_client import AsyncDartClient, BackgroundLoop, parse_report_pages
+from src.core.dart_agent import DartReportAgent
+from src.core.rate_limiter import TokenBucket
+from tests.dart_stub_server import DartStubServer
+
+
+def _make_client(server: DartStubServer, rate_per_minute: float = 60000, capacity: float = 100) -> AsyncDartClient:
+    return AsyncDartClient(
+        api_key="test-key",
+        opendart_url=server.opendart_url,
+        dart_url=server.dart_url,
+        limiter=TokenBucket(rate_per_minute, capacity=capacity, backoff_sec=0.05)
+    )
+
+
+def test_client_endpoints():
+    """공시 검색 / 기업 고유번호 / 보고서 목차 / 페이지 조회 테스트"""
+    print("\n" + "=" * 80)
+    print("🧪 AsyncDartClient 엔드포인트 테스트")
+    print("=" * 80)
+
+    async def scenario(server):
+        async with _make_client(server) as client:
+            rows = await client.search_all_filings("20240101", "20240331", pblntf_detail_ty="a001", page_count=3)
+            corps = await client.get_corp_codes()
+            empty = await client.search_filings("20240101", "20240331", corp_code="00000000")
+            pages = await client.get_report_pages(rows[0]['rcept_no'])
+            html = await client.get_page_html(pages[1])
+            return rows, corps, empty, pages, html
+
+    with DartStubServer() as server:
+        rows, corps, empty, pages, html = asyncio.run(scenario(server))
+
+    assert [r['rcept_no'] for r in rows] == [f['rcept_no'] for f in server.filings], "검색 결과 누락/순서 오류"
+    assert len(corps) == len(server.corps)
+    assert corps[-1]['stock_code'] is None, "비상장사 종목코드가 None으로 정리되지 않음"
+    assert empty['list'] == [] and empty['total_count'] == 0
+    assert [p['title'] for p in pages] == [p['title'] for p in server.pages]
+    assert pages[0]['ele_id'] == 1 and pages[0]['rcp_no'] == rows[0]['rcept_no']
+    assert html == server.pages[1]['html']
+
+    print("✅ AsyncDartClient 엔드포인트 테스트 통과")
+    return True
+
+
+def test_client_concurrency_and_rate_limit():
+    """동시 요청 / 한도 초과(429) 재시도 테스트"""
+    print("\n" + "=" * 80)
+    print("🧪 AsyncDartClient 동시성 / Rate Limit 테스트")
+    print("=" * 80)
+
+    async def fetch_many(server, count):
+        async with _make_client(server) as client:
+            pages = await client.get_report_pages("20240312000001")
+            return await asyncio.gather(*(client.get_page_html(pages[i % len(pages)]) for i in range(count)))
+
+    # 1. 한 스레드에서 수십 개 요청 동시 처리
+    with DartStubServer(latency=0.2) as server:
+        started = time.time()
+        htmls = asyncio.run(fetch_many(server, 40))
+        elapsed = time.time() - started
+        max_in_flight = server.max_in_flight
+
+    assert len(htmls) == 40
+    assert max_in_flight >= 20, f"동시 요청 수 부족 ({max_in_flight})"
+    assert elapsed < 0.2 * 40 / 4, f"요청이 직렬로 처리됨 ({elapsed:.2f}초)"
+
+    # 2. 429 응답 -> 대기 후 재시도로 성공
+    with DartStubServer() as server:
+        server.rate_limited_requests = 2
+        htmls = asyncio.run(fetch_many(server, 1))
+    assert htmls[0] == server.pages[0]['html']
+    assert server.requests.count("/dsaf001/main.do") == 3, "한도 초과 응답 후 재시도하지 않음"
+
+    print(f"✅ 동시성 / Rate Limit 테스트 통과 (최대 동시 요청 {max_in_flight}개, {elapsed:.2f}초)")
+    return True
+
+
+def test_async_agent_backend():
+    """DartReportAgent 비동기 백엔드 테스트 (검색 → 목차 → 페이지 파싱)"""
+    print("\n" + "=" * 80)
+    print("🧪 DartReportAgent 비동기 백엔드 테스트")
+    print("=" * 80)
+
+    with DartStubServer() as server:
+        agent = DartReportAgent.__new__(DartReportAgent)
+        agent.refresh_corps = False
+        agent.offline = False
+        agent._corp_list = None
+        agent._corp_directory = None
+        agent.page_cache = None
+        agent.dart_client = _make_client(server)
+        agent._async_loop = BackgroundLoop()
+        agent.parse_workers = 2
+        agent._parse_pool = None
+
+        try:
+            reports = agent.search_all_reports(bgn_de="20240101", end_de="20240331")
+            corps = agent._fetch_corp_list()
+            sections = agent.extract_target_sections_sequential(reports[0])
+        finally:
+            agent.close()
+
+    assert [r.rcept_no for r in reports] == [f['rcept_no'] for f in server.filings]
+    assert reports[0].corp_name == server.filings[0]['corp_name']
+    assert corps[0].corp_code == server.filings[0]['corp_code']
+    assert [s['chapter'] for s in sections] == ["회사의 개요", "사업의 내용", "재무에 관한 사항"]
+    assert any(b['chunk_type'] == 'table' for b in sections[1]['blocks'])
+
+    print("✅ 비동기 백엔드 테스트 통과")
+    return True
+
+
+def test_parse_report_pages():
+    """보고서 목차 파싱 테스트"""
+    html = (
+        "node1['text'] = \"I. 회사의 개요\";\nnode1['rcpNo'] = \"20240312000001\";\n"
+        "node1['dcmNo'] = \"9400000\";\nnode1['eleId'] = \"3\";\nnode1['offset'] = \"10\";\n"
+        "node1['length'] = \"20\";\nnode1['dtd'] = \"dart3.xsd\";\n"
+    )
+    assert parse_report_pages(html) == [{
+        'title': "I. 회사의 개요", 'rcp_no': "20240312000001", 'dcm_no': "9400000",
+        'ele_id': 3, 'offset': "10", 'length': "20", 'dtd': "dart3.xsd"
+    }]
+    return True
+
+
+if __name__ == "__main__":
+    results = [
+        ("목차 파싱", test_parse_report_pages()),
+        ("엔드포인트", test_client_endpoints()),
+        ("동시성 / Rate Limit", test_client_concurrency_and_rate_limit()),
+        ("비동기 백엔드", test_async_agent_backend()),
+    ]
+
+    print("\n" + "=" * 80)
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    sys.exit(0 if all(result for _, result in results) else 1)
@@ -7,16 +7,31 @@ DART API 연동, 보고서 검색, 섹션 추출 테스트
     python tests/test_dart_agent.py --stock 000660  # SK하이닉스 테스트
     python tests/test_dart_agent.py --functions  # 기능 테스트만
 """
+import os
+import re
 import sys
+import json
 import argparse
+import tempfile
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
-from src.core.dart_agent import DartReportAgent
+import src.core.dart_agent as dart_agent_module
+from src.core.dart_agent import DartReportAgent, ReportFetchError
+from config import REPORT_SEARCH_CONFIG, PAGE_FETCH_CONFIG, CHUNK_CONFIG
+from src.core.corp_directory import CorpDirectory
+from src.core.corp_snapshot import CorpSnapshot
+from src.core import block_parser, token_chunker
+from src.core.html_parser import make_soup, available_parsers
+from src.core.html_table import find_unit, parse_amount, unit_scales
+from src.core.page_cache import PageCache, PageCacheMiss
+from src.core.rate_limiter import TokenBucket, SharedTokenBucket, rate_limit_signal
 
 
 def test_initialization():
@@ -59,6 +74,751 @@ def test_corp_search(agent, stock_code="005930"):
         return None
 
 
+def test_corp_directory():
+    """기업 디렉터리 인덱스 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 기업 디렉터리 인덱스 테스트")
+    print("=" * 80)
+
+    corps = [
+        SimpleNamespace(corp_code="00126380", corp_name="삼성전자", stock_code="005930"),
+        SimpleNamespace(corp_code="00164779", corp_name="SK하이닉스", stock_code="000660"),
+        SimpleNamespace(corp_code="00126371", corp_name="삼성전기", stock_code="009150"),
+        SimpleNamespace(corp_code="00999999", corp_name="삼성비상장", stock_code=None),
+    ]
+    directory = CorpDirectory(corps)
+
+    assert len(directory) == 4
+    assert directory.get_by_corp_code("00164779").corp_name == "SK하이닉스"
+    assert directory.get_by_stock_code("005930").corp_code == "00126380"
+    assert directory.get_by_stock_code("없음") is None
+    assert directory.get_by_corp_code(None) is None
+    assert [c.corp_name for c in directory.find_by_name("삼성전자")] == ["삼성전자"]
+    assert [c.corp_name for c in directory.find_by_name_prefix("삼성")] == ["삼성비상장", "삼성전기", "삼성전자"]
+    assert len(directory.find_by_name_prefix("삼성", limit=2)) == 2
+
+    # 상장사 목록은 원본 순서 유지 + 사본 반환
+    listed = directory.get_listed_corps()
+    assert [c.stock_code for c in listed] == ["005930", "000660", "009150"]
+    listed.clear()
+    assert len(directory.listed) == 3
+
+    print("✅ 기업 디렉터리 인덱스 테스트 통과")
+    return True
+
+
+def test_corp_snapshot():
+    """기업 리스트 스냅샷 저장/로드/TTL 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 기업 리스트 스냅샷 테스트")
+    print("=" * 80)
+
+    corps = [
+        SimpleNamespace(corp_code="00126380", corp_name="삼성전자", stock_code="005930",
+                        modify_date="20240101", corp_cls="Y"),
+        SimpleNamespace(corp_code="00999999", corp_name="비상장회사", stock_code=None,
+                        modify_date="20240102", corp_cls=None),
+    ]
+    fetch_count = []
+
+    def fetcher():
+        fetch_count.append(1)
+        return corps
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "corp_list.snap"
+
+        # 1. 최초 로드: 다운로드 후 저장
+        records = CorpSnapshot(path=path, ttl_hours=1).load(fetcher)
+        assert len(fetch_count) == 1 and path.exists()
+
+        # 2. 재로드: 스냅샷에서 복원 (다운로드 없음)
+        restored = CorpSnapshot(path=path, ttl_hours=1).load(fetcher)
+        assert len(fetch_count) == 1
+        assert list(restored) == list(records)
+        assert restored[0].stock_code == "005930" and restored[1].stock_code is None
+        assert CorpDirectory(restored).get_by_stock_code("005930").corp_name == "삼성전자"
+
+        # 3. TTL 만료 / 강제 갱신 시 다시 다운로드
+        CorpSnapshot(path=path, ttl_hours=0).load(fetcher)
+        assert len(fetch_count) == 2
+        CorpSnapshot(path=path, ttl_hours=1).load(fetcher, force_refresh=True)
+        assert len(fetch_count) == 3
+
+        # 4. 손상된 파일은 재생성
+        path.write_bytes(b"broken")
+        CorpSnapshot(path=path, ttl_hours=1).load(fetcher)
+        assert len(fetch_count) == 4
+
+    print("✅ 기업 리스트 스냅샷 테스트 통과")
+    return True
+
+
+def _make_offline_agent() -> DartReportAgent:
+    """DART API 인증 없이 파싱/검색 로직만 사용하는 에이전트 생성"""
+    agent = DartReportAgent.__new__(DartReportAgent)
+    agent.refresh_corps = False
+    agent._corp_list = None
+    agent._corp_directory = None
+    agent.offline = False
+    agent.page_cache = None
+    agent.dart_client = None
+    agent._async_loop = None
+    agent.parse_workers = 1
+    agent._parse_pool = None
+    return agent
+
+
+def test_concurrent_search_pages():
+    """페이지 동시 조회 + 페이지별 재시도 + 결정적 순서 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 사업보고서 페이지 동시 검색 테스트")
+    print("=" * 80)
+
+    total_page = 6
+    calls = {}
+
+    def fake_search(**kwargs):
+        page_no = kwargs['page_no']
+        calls[page_no] = calls.get(page_no, 0) + 1
+        # 3페이지는 첫 시도에서 실패 → 단독 재시도로 복구되어야 함
+        if page_no == 3 and calls[page_no] == 1:
+            raise ConnectionError("temporary failure")
+        reports = [SimpleNamespace(rcept_no=f"{page_no:02d}{i:02d}", corp_code=f"C{page_no}{i}", rcept_dt="20240320")
+                   for i in range(3)]
+        return SimpleNamespace(report_list=reports, total_page=total_page, total_count=total_page * 3)
+
+    original_search = dart_agent_module.dart.filings.search
+    original_delay = REPORT_SEARCH_CONFIG.get('page_retry_delay_sec')
+    dart_agent_module.dart.filings.search = fake_search
+    REPORT_SEARCH_CONFIG['page_retry_delay_sec'] = 0
+    try:
+        agent = _make_offline_agent()
+        reports = agent.search_all_reports(bgn_de="20240301", end_de="20240331")
+    finally:
+        dart_agent_module.dart.filings.search = original_search
+        REPORT_SEARCH_CONFIG['page_retry_delay_sec'] = original_delay
+
+    rcept_nos = [r.rcept_no for r in reports]
+    assert len(rcept_nos) == total_page * 3, "누락된 페이지가 있습니다"
+    assert rcept_nos == sorted(rcept_nos), "페이지 순서가 보장되지 않았습니다"
+    assert calls[3] == 2, "실패한 페이지가 단독 재시도되지 않았습니다"
+
+    print("✅ 페이지 동시 검색 테스트 통과")
+    return True
+
+
+def test_search_window_split():
+    """장기간 검색 시 90일 구간 분할 + rcept_no 중복 제거 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 검색 기간 구간 분할 테스트")
+    print("=" * 80)
+
+    searched_windows = []
+
+    def fake_search(**kwargs):
+        searched_windows.append((kwargs['bgn_de'], kwargs['end_de']))
+        # 모든 구간이 같은 정정 공시(rcept_no=DUP)를 돌려주는 상황
+        reports = [
+            SimpleNamespace(rcept_no=f"R{kwargs['end_de']}", corp_code=kwargs['end_de'], rcept_dt=kwargs['end_de']),
+            SimpleNamespace(rcept_no="DUP", corp_code="DUP", rcept_dt=kwargs['end_de']),
+        ]
+        return SimpleNamespace(report_list=reports, total_page=1, total_count=2)
+
+    original_search = dart_agent_module.dart.filings.search
+    dart_agent_module.dart.filings.search = fake_search
+    try:
+        agent = _make_offline_agent()
+        reports = agent.search_all_reports(bgn_de="20240101", end_de="20241231")
+    finally:
+        dart_agent_module.dart.filings.search = original_search
+
+    windows = agent._split_search_windows("20240101", "20241231")
+    assert sorted(searched_windows) == sorted(windows), "모든 구간이 조회되지 않았습니다"
+    assert windows[0][1] == "20241231" and windows[-1][0] == "20240101", "기간 양 끝이 누락되었습니다"
+    assert len(windows) == 5
+
+    rcept_nos = [r.rcept_no for r in reports]
+    assert rcept_nos.count("DUP") == 1, "rcept_no 중복 제거 실패"
+    assert len(rcept_nos) == len(windows) + 1
+
+    print("✅ 검색 기간 구간 분할 테스트 통과")
+    return True
+
+
+def test_rate_limiter():
+    """토큰 버킷 / 프로세스 간 공유 / 한도 초과 응답 판별 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 Rate Limiter 테스트")
+    print("=" * 80)
+
+    # 버스트 포함 분당 한도: 보충 속도 = (한도 - 버킷 크기) / 60
+    bucket = TokenBucket(rate_per_minute=6000, capacity=5)
+    assert bucket.rate_per_sec == (6000 - 5) / 60
+    waits = [bucket.acquire() for _ in range(5)]
+    assert all(w == 0 for w in waits), "버스트 구간에서 대기 발생"
+    assert bucket.acquire() > 0, "버킷 소진 후 대기하지 않음"
+
+    # 한도 초과 응답 -> 호출 중단 + 속도 절반
+    pause = bucket.penalize(retry_after=0.05)
+    assert pause == 0.05
+    assert bucket._memory_state.rate_factor == 0.5
+    assert bucket.acquire() >= 0.04, "호출 중단 시간 동안 토큰이 발급됨"
+
+    # 두 인스턴스(= 두 프로세스)가 같은 상태 파일을 공유
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        state_path = Path(tmp_dir) / "rate.state"
+        worker_a = SharedTokenBucket(6000, str(state_path), capacity=3)
+        worker_b = SharedTokenBucket(6000, str(state_path), capacity=3)
+        assert worker_a.acquire() == 0 and worker_a.acquire() == 0
+        assert worker_b.acquire() == 0
+        assert worker_b.acquire() > 0, "공유 버킷 소진이 다른 워커에 반영되지 않음"
+
+    # 한도 초과 응답 판별
+    def fake_response(status_code, content=b"", headers=None):
+        return SimpleNamespace(status_code=status_code, content=content, headers=headers or {})
+
+    json_headers = {'Content-Type': 'application/json;charset=UTF-8'}
+    assert rate_limit_signal(fake_response(429, headers={'Retry-After': '7'})) == (True, 7.0)
+    assert rate_limit_signal(fake_response(200, b'{"status":"020","message":"limit"}', json_headers)) == (True, None)
+    assert rate_limit_signal(fake_response(200, b'{"status":"000","list":[]}', json_headers)) == (False, None)
+    assert rate_limit_signal(fake_response(200, b'<html></html>', {'Content-Type': 'text/html'})) == (False, None)
+
+    print("✅ Rate Limiter 테스트 통과")
+    return True
+
+
+def test_report_handle():
+    """검색 결과 / 접수번호 기반 보고서 핸들 테스트 (오프라인, 페이지 미로딩)"""
+    print("\n" + "=" * 80)
+    print("🧪 보고서 핸들 테스트")
+    print("=" * 80)
+
+    agent = _make_offline_agent()
+    hit = {
+        "corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930",
+        "report_nm": "사업보고서 (2023.12)", "rcept_no": "20240312000736", "rcept_dt": "20240312"
+    }
+
+    # 검색 결과 딕셔너리 -> Report (API 호출 없이 생성)
+    report = agent.get_report(hit)
+    assert report.rcept_no == hit['rcept_no']
+    assert report.report_nm == hit['report_nm']
+    assert report._pages is None, "페이지가 즉시 로드됨"
+
+    # 이미 Report면 그대로 재사용
+    assert agent.get_report(report) is report
+
+    # 접수번호만 있는 경우 + 메타정보 보충
+    bare = agent.get_report("20240312000736", corp_code="00126380", corp_name="삼성전자")
+    info = agent.get_report_info(bare)
+    assert info['rcept_no'] == "20240312000736"
+    assert info['rcept_dt'] == "20240312", "접수일을 접수번호에서 복원하지 못함"
+    assert info['corp_code'] == "00126380" and info['title'] is None
+
+    try:
+        agent.get_report({"corp_code": "00126380"})
+        raise AssertionError("접수번호 없는 보고서 정보가 허용됨")
+    except ValueError:
+        pass
+
+    print("✅ 보고서 핸들 테스트 통과")
+    return True
+
+
+def test_single_pass_extraction():
+    """대상 섹션 단일 패스 추출 테스트 (오프라인, 페이지당 HTML 1회 로드)"""
+    print("\n" + "=" * 80)
+    print("🧪 단일 패스 섹션 추출 테스트")
+    print("=" * 80)
+
+    class FakePage:
+        def __init__(self, title, body):
+            self.title = title
+            self._body = body
+            self.loads = 0
+
+        @property
+        def html(self):
+            self.loads += 1
+            return f"<html><body>{self._body}</body></html>"
+
+    pages = [
+        FakePage("I. 회사의 개요", "<p>회사 개요 본문입니다.</p>"),
+        FakePage("1. 회사의 개요 및 사업의 내용 요약", "<p>요약 본문입니다.</p>"),
+        FakePage("II. 사업의 내용", "<p>사업 본문입니다.</p><table><tr><td>매출</td><td>100</td></tr></table>"),
+        FakePage("III. 재무에 관한 사항", "<p>재무 본문입니다.</p>"),
+        FakePage("XII. 상세표", "<p>대상 아님</p>"),
+    ]
+    report = SimpleNamespace(pages=pages)
+
+    agent = _make_offline_agent()
+    sections = agent.extract_target_sections_sequential(
+        report, section_names=["회사의 개요", "사업의 내용", "재무에 관한 사항", "감사인"]
+    )
+
+    assert [s['chapter'] for s in sections] == ["회사의 개요", "사업의 내용", "재무에 관한 사항"]
+    assert sections[0]['page_count'] == 2 and sections[1]['page_count'] == 2
+    assert [p.loads for p in pages] == [1, 1, 1, 1, 0], "페이지 HTML이 중복 로드되었거나 불필요하게 로드됨"
+
+    sequences = [b['sequence_order'] for s in sections for b in s['blocks']]
+    assert sequences == list(range(len(sequences))), "전역 시퀀스 번호가 연속되지 않음"
+    assert any(b['chunk_type'] == 'table' for b in sections[1]['blocks'])
+
+    print("✅ 단일 패스 섹션 추출 테스트 통과")
+    return True
+
+
+def test_page_cache():
+    """페이지 HTML 캐시 / LRU 제거 / 오프라인 재처리 테스트 (오프라인)"""
+    print("\n" + "=" * 80)
+    print("🧪 페이지 캐시 테스트")
+    print("=" * 80)
+
+    class FakeSourcePage:
+        def __init__(self, title, ele_id):
+            self.title = title
+            self.ele_id = ele_id
+
+        def to_dict(self, summary=True):
+            return {"title": self.title, "ele_id": self.ele_id, "rcp_no": "20240312000736",
+                    "dcm_no": "9400000", "offset": "0", "length": "0", "dtd": "dart3.xsd"}
+
+    report = SimpleNamespace(
+        rcept_no="20240312000736",
+        info={"corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930",
+              "report_nm": "사업보고서 (2023.12)", "rcept_dt": "20240312", "lazy_loading": True},
+        pages=[FakeSourcePage("I. 회사의 개요", 1), FakeSourcePage("II. 사업의 내용", 2)]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = PageCache(root=tmp_dir, max_size_mb=1)
+
+        # 1. 목차 저장 + 페이지 HTML 압축 저장/복원
+        pages = cache.get_pages(report)
+        assert [p.title for p in pages] == ["I. 회사의 개요", "II. 사업의 내용"]
+        html = "<html><body><p>" + "회사 개요 본문입니다. " * 50 + "</p></body></html>"
+        cache.put(report.rcept_no, pages[0].key, html)
+        assert cache.get(report.rcept_no, pages[0].key) == html
+        assert cache.size_bytes() < len(html.encode('utf-8')), "압축되지 않음"
+
+        # 2. 오프라인: 목차/페이지 모두 캐시에서 복원, 미스는 PageCacheMiss
+        offline_pages = cache.get_pages(SimpleNamespace(rcept_no=report.rcept_no), offline=True)
+        assert offline_pages[0].html == html
+        try:
+            offline_pages[1].html
+            raise AssertionError("캐시 미스가 오프라인에서 허용됨")
+        except PageCacheMiss:
+            pass
+        try:
+            cache.get_pages(SimpleNamespace(rcept_no="20990101000000"), offline=True)
+            raise AssertionError("캐시에 없는 보고서가 오프라인에서 허용됨")
+        except PageCacheMiss:
+            pass
+
+        # 3. 오프라인 에이전트로 캐시된 보고서 재처리
+        agent = _make_offline_agent()
+        agent.offline = True
+        agent.page_cache = cache
+        corps_with_reports = agent.get_cached_reports()
+        assert len(corps_with_reports) == 1
+        corp, cached_report = corps_with_reports[0]
+        assert corp.corp_code == "00126380" and corp.stock_code == "005930"
+        sections = agent.extract_target_sections_sequential(cached_report, section_names=["개요", "내용"])
+        assert [s['chapter'] for s in sections] == ["개요", "내용"]
+        assert sections[0]['blocks'] and not sections[1]['blocks'], "캐시 미스 페이지가 처리됨"
+        # 기존 섹션 추출 경로도 페이지 캐시 경유 (오프라인에서 네트워크 없이 동작)
+        assert agent.extract_section(cached_report, "개요")['text'].startswith("회사 개요 본문입니다.")
+        assert agent.extract_section_advanced(cached_report, "개요")['page_count'] == 1
+        assert [s['title'] for s in agent.get_all_sections(cached_report)] == ["I. 회사의 개요", "II. 사업의 내용"]
+
+        # 적재용 strict 모드에서는 캐시 미스 페이지가 있으면 보고서 전체를 실패로 처리
+        try:
+            list(agent.iter_target_section_blocks(cached_report, ["개요", "내용"], strict=True))
+            raise AssertionError("캐시 미스 페이지가 있는 보고서를 strict 모드에서 허용함")
+        except ReportFetchError:
+            pass
+
+        # 4. 용량 상한 초과 시 오래된 보고서부터 제거
+        small_cache = PageCache(root=str(Path(tmp_dir) / "lru"), max_size_mb=0.05)
+        noise = os.urandom(20000).hex()  # 압축 후에도 약 20KB
+        for idx in range(4):
+            rcept_no = f"2024000000000{idx}"
+            small_cache.put_manifest(rcept_no, {"corp_code": str(idx)}, [])
+            small_cache.put(rcept_no, "p-1", noise + str(idx))
+            time.sleep(0.01)
+        remaining = [r['rcept_no'] for r in small_cache.list_reports()]
+        assert "20240000000003" in remaining and "20240000000000" not in remaining, remaining
+        assert small_cache.size_bytes() <= small_cache.max_bytes
+
+        # 5. 같은 페이지를 덮어써도 용량 집계가 늘어나지 않음
+        overwrite_cache = PageCache(root=str(Path(tmp_dir) / "overwrite"), max_size_mb=1)
+        for _ in range(5):
+            overwrite_cache.put("20240000000003", "p-1", noise)
+        assert overwrite_cache._total_bytes == overwrite_cache.size_bytes(), "덮어쓴 페이지가 중복 집계됨"
+
+        # 6. 현재 보고서만으로 상한을 넘으면 저장마다 디렉터리를 다시 스캔하지 않음
+        scans = []
+        original_size_bytes = small_cache.size_bytes
+        small_cache.size_bytes = lambda: scans.append(1) or original_size_bytes()
+        for idx in range(6):
+            small_cache.put("20240000000003", f"p-{idx + 2}", os.urandom(20000).hex())
+        # 다른 보고서 제거 1회 + 제거할 보고서가 없음을 확인 1회
+        assert len(scans) <= 2, f"상한 초과 저장마다 재스캔함 ({len(scans)}회)"
+        assert [r['rcept_no'] for r in small_cache.list_reports()] == ["20240000000003"]
+
+    print("✅ 페이지 캐시 테스트 통과")
+    return True
+
+
+def test_page_prefetch():
+    """보고서 페이지 HTML 병렬 수집 테스트 (오프라인, 지연 페이지)"""
+    print("\n" + "=" * 80)
+    print("🧪 페이지 병렬 수집 테스트")
+    print("=" * 80)
+
+    class SlowPage:
+        def __init__(self, idx, delay):
+            self.title = f"II. 사업의 내용 ({idx})"
+            self.idx = idx
+            self.delay = delay
+
+        @property
+        def html(self):
+            time.sleep(self.delay)
+            return f"<html><body><p>{'사업 본문 ' * 20}{self.idx}</p></body></html>"
+
+    # 앞 페이지가 가장 느리게 도착해도 결과 순서는 페이지 순서 유지
+    pages = [SlowPage(idx, 0.3 if idx == 0 else 0.1) for idx in range(8)]
+    agent = _make_offline_agent()
+
+    started = time.time()
+    sections = agent.extract_target_sections_sequential(SimpleNamespace(pages=pages), section_names=["내용"])
+    elapsed = time.time() - started
+
+    assert elapsed < 0.3 + 0.1 * 3, f"페이지가 순차적으로 수집됨 ({elapsed:.2f}초)"
+    contents = [b['content'] for b in sections[0]['blocks']]
+    assert [c.rsplit(' ', 1)[-1] for c in contents] == [str(idx) for idx in range(8)], "페이지 순서가 바뀜"
+
+    print(f"✅ 페이지 병렬 수집 테스트 통과 ({elapsed:.2f}초)")
+    return True
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_parser_backends():
+    """HTML 파서별 블록 파싱 결과 동일성 테스트 (골든 출력 비교)"""
+    print("\n" + "=" * 80)
+    print("🧪 HTML 파서 백엔드 테스트")
+    print("=" * 80)
+
+    html = (FIXTURE_DIR / "dart_page_sample.html").read_text(encoding='utf-8')
+    expected = json.loads((FIXTURE_DIR / "dart_page_sample.blocks.json").read_text(encoding='utf-8'))
+    agent = _make_offline_agent()
+
+    parsers = available_parsers()
+    assert "html.parser" in parsers
+    for parser in parsers:
+        soup = make_soup(html, parser)
+        blocks, next_sequence = agent._parse_sequential_blocks(soup.body, "II. 사업의 내용", 0)
+        # 수치 셀 레코드(튜플)는 JSON 배열과 비교
+        assert json.loads(json.dumps(blocks, ensure_ascii=False)) == expected, f"{parser} 파싱 결과가 골든 출력과 다름"
+        assert next_sequence == len(expected)
+
+    print(f"✅ HTML 파서 백엔드 테스트 통과 ({', '.join(parsers)})")
+    return True
+
+
+def test_page_table_separation():
+    """테이블/텍스트 분리 추출 테스트 (pd.read_html 레코드와 비교)"""
+    print("\n" + "=" * 80)
+    print("🧪 테이블/텍스트 분리 추출 테스트")
+    print("=" * 80)
+
+    import pandas as pd
+    from io import StringIO
+
+    html = (FIXTURE_DIR / "dart_page_sample.html").read_text(encoding='utf-8')
+    # thead 없는 th 헤더 / 중복 열 이름 / 천 단위 숫자 / 결측값 / 행 끝 rowspan
+    html = html.replace("</body>", (
+        "<table><tr><th>구분</th><th>구분</th><th>금액</th></tr>"
+        "<tr><td rowspan='2'>A</td><td>x</td><td>1,234</td></tr>"
+        "<tr><td>y</td><td></td></tr></table></body>"
+    ))
+
+    data = _make_offline_agent().extract_page_data_with_tables(SimpleNamespace(title="II. 사업의 내용", html=html))
+
+    expected = [
+        json.loads(df.where(pd.notnull(df), "").to_json(orient='records', force_ascii=False))
+        for df in pd.read_html(StringIO(html), flavor='lxml')
+    ]
+    assert [t['data'] for t in data['tables']] == expected, "테이블 레코드가 pd.read_html 결과와 다름"
+    assert [t['table_index'] for t in data['tables']] == [0, 1, 2]
+    assert data['tables'][0]['data'][0]["('제55기', '매출액')"] == 1698992
+    assert data['tables'][2]['data'][1] == {"구분": "A", "구분.1": "y", "금액": ""}
+
+    text = data['content_text']
+    assert text.count("[테이블 참조]") == 3
+    assert "1,698,992" not in text and "모바일 AP" not in text.split("복수 공급처")[1]
+    assert "(단위 : 억원, %)" in text
+
+    print("✅ 테이블/텍스트 분리 추출 테스트 통과")
+    return True
+
+
+def test_table_markdown():
+    """테이블 Markdown 변환 테스트 (pd.read_html 기반 변환 결과와 비교)"""
+    print("\n" + "=" * 80)
+    print("🧪 테이블 Markdown 변환 테스트")
+    print("=" * 80)
+
+    html = (FIXTURE_DIR / "dart_tables.html").read_text(encoding='utf-8')
+    expected = json.loads((FIXTURE_DIR / "dart_tables.markdown.json").read_text(encoding='utf-8'))
+    agent = _make_offline_agent()
+
+    for parser in available_parsers():
+        tables = make_soup(html, parser).find_all('table')
+        converted = [agent.convert_table_to_markdown(table) for table in tables]
+        assert [{"markdown": md, "metadata": meta} for md, meta in converted] == expected, \
+            f"{parser} 변환 결과가 골든 출력과 다름"
+
+    # 텍스트가 없는 테이블은 텍스트 추출로 대체
+    markdown, meta = agent.convert_table_to_markdown(make_soup("<table><tr><td></td></tr></table>").table)
+    assert markdown == "[표 데이터]\n" and "error" in meta
+
+    print(f"✅ 테이블 Markdown 변환 테스트 통과 ({len(expected)}개 테이블)")
+    return True
+
+
+def test_table_cells():
+    """테이블 수치 셀 추출 테스트 (음수 표기 / 단위 / 행·열 이름)"""
+    print("\n" + "=" * 80)
+    print("🧪 테이블 수치 셀 테스트")
+    print("=" * 80)
+
+    assert [parse_amount(text) for text in ("1,234", "(1,234)", "△12.5", "65.0%", "-", "", "제55기")] == \
+        [1234, -1234, -12.5, 65.0, None, None, None]
+    assert unit_scales("억원, %") == [("원", 10 ** 8), ("%", 1)]
+    assert unit_scales("천주") == [("주", 1000)]
+
+    html = """<html><body>
+    <h3>1. 요약재무정보</h3>
+    <table><tr><td>(단위 : 백만원)</td></tr></table>
+    <table>
+      <tr><td>구분</td><td>제55기</td><td>제54기</td></tr>
+      <tr><td>매출액</td><td>2,589,355</td><td>3,022,314</td></tr>
+      <tr><td>당기순이익</td><td>(154,873)</td><td>△55,654</td></tr>
+    </table>
+    <h3>2. 기타</h3>
+    <table><tr><th>항목</th><th>수량</th></tr><tr><td>직원</td><td>120</td></tr></table>
+    </body></html>"""
+    blocks = block_parser.parse_page_blocks(html, "III. 재무에 관한 사항")
+    cells = blocks[1]['table_cells']
+
+    assert blocks[0]['table_cells'] is None and blocks[1]['table_metadata']['unit'] == "백만원"
+    assert cells[0] == (0, 1, "매출액", "제55기", "2,589,355", 2589355, "원", 10 ** 6)
+    assert [(c[2], c[3], c[5]) for c in cells[2:]] == [("당기순이익", "제55기", -154873), ("당기순이익", "제54기", -55654)]
+    # 헤더가 바뀌면 앞 섹션의 단위를 적용하지 않음
+    assert blocks[2]['table_cells'] == [(0, 1, "직원", "수량", "120", 120, None, 1)]
+    assert "unit" not in blocks[2]['table_metadata']
+
+    # 본문의 "단위당 ...", "보고단위는 ..." 문장은 단위 표기가 아님
+    assert find_unit("단위당 판매가격은 전년 대비 상승하였습니다") is None
+    assert find_unit("(단위 : 천원 / 주)") == "천원, 주" and find_unit("(단위: 대, 기타 설명)") == "대"
+    html = """<html><body>
+    <h3>3. 판매 실적</h3>
+    <p>단위당 판매가격은 원재료 가격 상승으로 전년 대비 12% 상승하였으며, 보고단위는 다음과 같습니다.</p>
+    <table>
+      <tr><td>구분</td><td>판매량</td></tr>
+      <tr><td>제품A</td><td>1,200</td></tr>
+    </table>
+    </body></html>"""
+    blocks = block_parser.parse_page_blocks(html, "II. 사업의 내용")
+    table = [block for block in blocks if block['table_cells']][0]
+    assert "unit" not in table['table_metadata']
+    assert table['table_cells'] == [(0, 1, "제품A", "판매량", "1,200", 1200, None, 1)]
+
+    print("✅ 테이블 수치 셀 테스트 통과")
+    return True
+
+
+def test_parse_process_pool():
+    """페이지 파싱 프로세스 풀 테스트 (현재 프로세스 파싱 결과와 비교)"""
+    print("\n" + "=" * 80)
+    print("🧪 페이지 파싱 프로세스 풀 테스트")
+    print("=" * 80)
+
+    html = (FIXTURE_DIR / "dart_page_sample.html").read_text(encoding='utf-8')
+
+    class BrokenPage:
+        title = "II. 사업의 내용 (오류)"
+
+        @property
+        def html(self):
+            raise ConnectionError("다운로드 실패")
+
+    pages = [SimpleNamespace(title=f"II. 사업의 내용 ({idx})", html=html) for idx in range(6)] + [BrokenPage()]
+
+    inline_agent = _make_offline_agent()
+    expected = inline_agent.extract_target_sections_sequential(SimpleNamespace(pages=pages), ["내용"])
+
+    agent = _make_offline_agent()
+    agent.parse_workers = 2
+    try:
+        sections = agent.extract_target_sections_sequential(SimpleNamespace(pages=pages), ["내용"])
+        assert agent._parse_pool is not None, "프로세스 풀이 생성되지 않음"
+
+        # 워커 프로세스가 죽으면 현재 프로세스에서 다시 파싱
+        for process in list(agent._parse_pool._processes.values()):
+            process.kill()
+        recovered = agent.extract_target_sections_sequential(SimpleNamespace(pages=pages), ["내용"])
+    finally:
+        agent.close()
+
+    assert agent._parse_pool is None
+    assert sections == expected, "프로세스 풀 파싱 결과가 현재 프로세스 파싱 결과와 다름"
+    assert recovered == expected, "비정상 종료된 프로세스 풀의 페이지가 복구되지 않음"
+    assert sections[0]['page_count'] == 7 and len(sections[0]['blocks']) == 6 * 5
+
+    print("✅ 페이지 파싱 프로세스 풀 테스트 통과")
+    return True
+
+
+def test_streaming_blocks():
+    """블록 스트리밍 테스트 (반복 순회 파서 / 구간 단위 페이지 로드)"""
+    print("\n" + "=" * 80)
+    print("🧪 블록 스트리밍 테스트")
+    print("=" * 80)
+
+    # 1. 재귀 한도보다 깊게 중첩된 div도 순회
+    depth = sys.getrecursionlimit() * 2
+    deep_html = "<div>" * depth + "<h2>깊은 섹션</h2><p>" + "본문 " * 60 + "</p>" + "</div>" * depth
+    blocks = list(block_parser.iter_page_blocks(deep_html, "II. 사업의 내용"))
+    assert len(blocks) == 1 and blocks[0]['section_path'] == "II. 사업의 내용 > 깊은 섹션"
+
+    # 2. 페이지는 stream_window 단위로만 로드되고, 결과는 섹션 단위 추출과 동일
+    class CountingPage:
+        def __init__(self, idx):
+            self.title = f"II. 사업의 내용 ({idx})"
+            self.idx = idx
+            self.loads = 0
+
+        @property
+        def html(self):
+            self.loads += 1
+            return f"<html><body><p>{'사업 본문 ' * 20}{self.idx}</p></body></html>"
+
+    pages = [CountingPage(idx) for idx in range(5)]
+    agent = _make_offline_agent()
+    original_window = PAGE_FETCH_CONFIG.get('stream_window')
+    PAGE_FETCH_CONFIG['stream_window'] = 2
+    try:
+        stream = agent.iter_target_section_blocks(SimpleNamespace(pages=pages), ["내용"])
+        first = next(stream)
+        assert [p.loads for p in pages] == [1, 1, 0, 0, 0], "첫 구간 이후 페이지까지 미리 로드됨"
+        streamed = [first] + list(stream)
+        expected = agent.extract_target_sections_sequential(SimpleNamespace(pages=pages), ["내용"])
+    finally:
+        PAGE_FETCH_CONFIG['stream_window'] = original_window
+
+    assert [name for name, _ in streamed] == ["내용"] * 5
+    assert [b for _, page_blocks in streamed for b in page_blocks] == expected[0]['blocks']
+
+    print("✅ 블록 스트리밍 테스트 통과")
+    return True
+
+
+def test_chunk_boundaries():
+    """청크 경계 테스트 (문단 > 줄바꿈 > 문장 끝 우선, 오버랩 / 진행 보장)"""
+    sentence = "당기 매출은 전년 대비 증가하였습니다. "
+    paragraph = sentence * 20
+    text = "\n\n".join([paragraph] * 10)
+
+    chunks = block_parser.chunk_text(text, chunk_size=1000, overlap=100)
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.endswith("습니다.") for chunk in chunks), "문장 경계에서 잘리지 않음"
+    assert chunks[0] == (paragraph + "\n\n" + paragraph).strip(), "문단 경계가 우선되지 않음"
+    assert chunks[0][-50:] in chunks[1][:100], "청크 간 오버랩 누락"
+
+    # 구분자가 없으면 chunk_size 단위로 자름
+    flat = "가" * 5000
+    assert [len(chunk) for chunk in block_parser.chunk_text(flat, chunk_size=1000, overlap=100)] == [1000] * 5 + [500]
+
+    # 오버랩이 진행 거리보다 커도 종료
+    assert block_parser.chunk_text(flat, chunk_size=1000, overlap=1000)
+    return True
+
+
+def test_section_path_stack():
+    """섹션 경로 스택 테스트 (문자열 분할 방식과 동일 / 같은 경로는 하나의 문자열 공유)"""
+    headers = [("사업의 개요", 2), ("주요 제품", 3), ("생산설비", 3), ("매출", 2), ("수주상황", 3)]
+    path_parts = block_parser.split_section_path("II. 사업의 내용")
+    current = "II. 사업의 내용"
+    for header, level in headers:
+        current = block_parser.update_section_path(current, header, f"h{level}")
+        assert block_parser.push_section_path(path_parts, header, level) == current
+    assert current == "II. 사업의 내용 > 매출 > 수주상황"
+
+    html = "".join(f"<h2>매출</h2><p>{'매출 현황 설명 ' * 20}{idx}</p><table><tr><td>{idx}</td></tr></table>"
+                   for idx in range(3))
+    blocks = block_parser.parse_page_blocks(html, "II. 사업의 내용")
+    assert len(blocks) == 6
+    assert all(b['section_path'] is blocks[0]['section_path'] for b in blocks), "같은 경로 문자열이 공유되지 않음"
+    return True
+
+
+class WhitespaceTokenizer:
+    """fast 토크나이저 인터페이스를 따르는 공백 단위 테스트용 토크나이저"""
+    is_fast = True
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def __call__(self, texts, add_special_tokens=True, return_offsets_mapping=False, return_attention_mask=True):
+        def encode(text):
+            spans = [match.span() for match in re.finditer(r"\S+", text)]
+            return {"input_ids": list(range(len(spans))), "offset_mapping": spans}
+
+        if isinstance(texts, str):
+            return encode(texts)
+        encoded = [encode(text) for text in texts]
+        return {key: [e[key] for e in encoded] for key in ("input_ids", "offset_mapping")}
+
+
+def test_token_chunking():
+    """토크나이저 기준 청킹 테스트 (토큰 예산 준수 / 내용 손실 없음 / token_count 기록)"""
+    print("\n" + "=" * 80)
+    print("🧪 토큰 기준 청킹 테스트")
+    print("=" * 80)
+
+    original = (token_chunker._tokenizer, token_chunker._tokenizer_loaded, CHUNK_CONFIG.get('mode'))
+    token_chunker._tokenizer, token_chunker._tokenizer_loaded = WhitespaceTokenizer(), True
+    CHUNK_CONFIG['mode'] = 'tokens'
+    token_chunker.chunk_budget.cache_clear()
+    try:
+        text = "\n".join(f"{idx}번째 문장은 매출과 영업이익을 설명합니다." for idx in range(200))
+        chunks = token_chunker.chunk_text_by_tokens(text, 50, overlap=0)
+        assert all(count <= 50 for _, count in chunks), "토큰 예산 초과 청크 존재"
+        assert [count for _, count in chunks] == [len(chunk.split()) for chunk, _ in chunks]
+        assert " ".join(chunk for chunk, _ in chunks).split() == text.split(), "청킹 중 내용 손실"
+
+        # 블록 파서: 텍스트 블록은 섹션 경로 접두어를 포함해 max_length 안에 들어감
+        html = (FIXTURE_DIR / "dart_page_sample.html").read_text(encoding='utf-8')
+        blocks = block_parser.parse_page_blocks(html, "II. 사업의 내용")
+        assert all(b['token_count'] is not None for b in blocks)
+        for b in (b for b in blocks if b['chunk_type'] == 'text'):
+            assert b['token_count'] <= token_chunker.chunk_budget(b['section_path'])
+    finally:
+        token_chunker._tokenizer, token_chunker._tokenizer_loaded, CHUNK_CONFIG['mode'] = original
+        token_chunker.chunk_budget.cache_clear()
+
+    assert block_parser.parse_page_blocks(html, "II. 사업의 내용")[0]['token_count'] is None
+
+    print(f"✅ 토큰 기준 청킹 테스트 통과 ({len(chunks)}청크)")
+    return True
+
+
 def test_report_search(agent, corp):
     """보고서 검색 테스트"""
     print("\n" + "=" * 80)
@@ -199,6 +959,26 @@ def run_function_tests():
 
     results = []
 
+    # 0. 기업 디렉터리 (오프라인)
+    results.append(("기업 디렉터리", test_corp_directory()))
+    results.append(("기업 리스트 스냅샷", test_corp_snapshot()))
+    results.append(("페이지 동시 검색", test_concurrent_search_pages()))
+    results.append(("검색 기간 구간 분할", test_search_window_split()))
+    results.append(("Rate Limiter", test_rate_limiter()))
+    results.append(("보고서 핸들", test_report_handle()))
+    results.append(("단일 패스 섹션 추출", test_single_pass_extraction()))
+    results.append(("페이지 캐시", test_page_cache()))
+    results.append(("페이지 병렬 수집", test_page_prefetch()))
+    results.append(("HTML 파서 백엔드", test_parser_backends()))
+    results.append(("테이블/텍스트 분리 추출", test_page_table_separation()))
+    results.append(("테이블 Markdown 변환", test_table_markdown()))
+    results.append(("테이블 수치 셀", test_table_cells()))
+    results.append(("페이지 파싱 프로세스 풀", test_parse_process_pool()))
+    results.append(("블록 스트리밍", test_streaming_blocks()))
+    results.append(("청크 경계", test_chunk_boundaries()))
+    results.append(("섹션 경로 스택", test_section_path_stack()))
+    results.append(("토큰 기준 청킹", test_token_chunking()))
+
     # 1. 초기화
     agent = test_initialization()
     results.append(("초기화", agent is not None))
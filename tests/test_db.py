@@ -9,6 +9,8 @@ DB Manager 테스트 스크립트
     python tests/test_db.py --reset      # DB 초기화 포함
 """
 import sys
+import time
+import threading
 import argparse
 from pathlib import Path
 
@@ -17,7 +19,116 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
-from src.core.db_manager import DBManager
+import psycopg2
+from psycopg2 import extensions
+from src.core.db_manager import DBManager, HNSW_MAX_EF_SEARCH, vector_literal
+from src.core.db_pool import ConnectionPool
+
+
+class FakeConnection:
+    """커넥션 풀 테스트용 psycopg2 연결 대역 (트랜잭션 상태 / SELECT 1 / 종료만 흉내)"""
+
+    def __init__(self):
+        self.closed = 0
+        self.broken = False       # 클라이언트가 인지한 연결 끊김
+        self.terminated = False   # 서버 측 종료 (쿼리 전에는 알 수 없음)
+        self.pings = 0
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def get_transaction_status(self):
+        return extensions.TRANSACTION_STATUS_UNKNOWN if self.broken else self.status
+
+    def rollback(self):
+        if self.broken:
+            raise psycopg2.InterfaceError("connection already closed")
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql):
+                if conn.broken or conn.terminated:
+                    raise psycopg2.OperationalError("server closed the connection")
+                conn.pings += 1
+                conn.status = extensions.TRANSACTION_STATUS_INTRANS
+
+        return Cursor()
+
+    def close(self):
+        self.closed = 1
+
+
+def test_connection_pool():
+    """커넥션 풀 테스트 (연결 재사용 / 최대 연결 수 제한 / 대여 시 상태 확인)"""
+    print("\n" + "=" * 80)
+    print("🧪 커넥션 풀 테스트")
+    print("=" * 80)
+
+    connections = []
+
+    def connect():
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    # 1. 스레드 8개가 번갈아 대여해도 연결은 최대 2개
+    pool = ConnectionPool(connect, max_connections=2, checkout_timeout_sec=5, health_check_idle_sec=60)
+    in_use = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def lease():
+        for _ in range(20):
+            conn = pool.getconn()
+            with lock:
+                in_use.append(conn)
+                peak[0] = max(peak[0], len(in_use))
+            time.sleep(0.001)
+            with lock:
+                in_use.remove(conn)
+            pool.putconn(conn)
+
+    threads = [threading.Thread(target=lease) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert pool.created == 2 and peak[0] == 2, f"연결 수 제한 실패 (생성 {pool.created}, 동시 {peak[0]})"
+
+    # 2. 모두 대여 중이면 대기 시간 초과 후 PoolError
+    pool = ConnectionPool(connect, max_connections=1, checkout_timeout_sec=0.05)
+    conn = pool.getconn()
+    try:
+        pool.getconn()
+        assert False, "최대 연결 수를 넘어 대여됨"
+    except psycopg2.pool.PoolError:
+        pass
+
+    # 3. 트랜잭션이 열린 채 반납되면 롤백, 끊긴 연결은 버리고 새로 연결
+    conn.status = extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+    assert pool.getconn() is conn and conn.status == extensions.TRANSACTION_STATUS_IDLE
+    pool.putconn(conn)
+    conn.broken = True
+    replacement = pool.getconn()
+    assert replacement is not conn and conn.closed, "끊긴 연결이 대여됨"
+
+    # 4. 오래 유휴였던 연결은 SELECT 1로 확인 후 대여 (서버 측 종료 감지)
+    pool.putconn(replacement)
+    pool.health_check_idle_sec = 0
+    assert pool.getconn() is replacement and replacement.pings == 1
+    pool.putconn(replacement)
+    replacement.terminated = True
+    assert pool.getconn() is not replacement and replacement.closed, "서버에서 끊긴 유휴 연결이 대여됨"
+
+    print(f"✅ 커넥션 풀 테스트 통과 (연결 {len(connections)}개 생성)")
+    return True
 
 
 def test_connection():
@@ -148,6 +259,204 @@ def test_crud():
         return False
 
 
+def test_batch_insert():
+    """블록 일괄 저장 테스트 (한 트랜잭션, blocks 순서의 ID 반환)"""
+    print("\n" + "=" * 80)
+    print("🧪 블록 일괄 저장 테스트")
+    print("=" * 80)
+
+    blocks = [
+        {
+            "chunk_type": "table" if idx % 10 == 0 else "text",
+            "section_path": f"II. 사업의 내용 > {idx // 100}. 테스트 섹션",
+            "content": f"테스트 블록 {idx} " * 20,
+            "sequence_order": idx,
+            "table_metadata": {"rows": 1} if idx % 10 == 0 else None,
+            "table_cells": [(0, 1, "매출액", "제1기", "1,000", 1000, "원", 1)] if idx % 10 == 0 else None
+        }
+        for idx in range(1500)
+    ]
+
+    try:
+        with DBManager() as db:
+            db.init_db()
+            company_id = db.insert_company("테스트기업", "99999999", "999999")
+            report_id = db.insert_report(company_id, {
+                "title": "일괄 저장 테스트 보고서",
+                "rcept_no": "999999999998",
+                "rcept_dt": "20260106",
+                "report_type": "annual"
+            })
+
+            started = time.time()
+            ids = db.insert_materials_batch(report_id, blocks)
+            elapsed = time.time() - started
+            assert len(ids) == len(blocks), "일부 블록만 저장됨"
+
+            materials = db.get_materials_by_report(report_id)
+            assert [m['id'] for m in materials] == ids, "반환된 ID 순서가 블록 순서와 다름"
+            assert [m['section_path'] for m in materials] == [b['section_path'] for b in blocks]
+
+            db.cursor.execute('SELECT COUNT(*) FROM "Table_Cells" WHERE report_id = %s', (report_id,))
+            assert db.cursor.fetchone()[0] == 150, "테이블 수치 셀 누락"
+
+            db.cursor.execute('DELETE FROM "Analysis_Reports" WHERE id = %s', (report_id,))
+            print(f"✅ {len(ids):,}개 블록 일괄 저장 ({len(ids) / elapsed:,.0f}행/초)")
+            return True
+    except Exception as e:
+        print(f"❌ 블록 일괄 저장 테스트 실패: {e}")
+        return False
+
+
+def test_ingest_report():
+    """보고서 적재 테스트 (재실행 시 블록 교체 / 실패 시 전체 롤백)"""
+    print("\n" + "=" * 80)
+    print("🧪 보고서 적재 트랜잭션 테스트")
+    print("=" * 80)
+
+    info = {"title": "적재 테스트 보고서", "rcept_no": "999999999997", "rcept_dt": "20260106"}
+
+    def pages(count, fail_at=None):
+        for page in range(count):
+            if page == fail_at:
+                raise RuntimeError("페이지 파싱 실패")
+            yield [
+                {"chunk_type": "text", "section_path": "II. 사업의 내용", "content": f"{page}쪽 본문 " * 20,
+                 "sequence_order": page * 10 + idx}
+                for idx in range(10)
+            ]
+
+    try:
+        with DBManager() as db:
+            db.init_db()
+            report_id, count = db.ingest_report("테스트기업", "99999999", "999999", info, pages(3))
+            assert count == 30
+
+            # 재실행: 블록이 중복되지 않고 교체됨
+            rerun_id, count = db.ingest_report("테스트기업", "99999999", "999999", info, pages(5))
+            assert rerun_id == report_id and count == 50
+            assert len(db.get_materials_by_report(report_id)) == 50, "재실행 시 블록 중복"
+
+            # 도중 실패: 기존 블록과 상태 유지
+            try:
+                db.ingest_report("테스트기업", "99999999", "999999", info, pages(5, fail_at=2))
+                assert False, "실패한 적재가 예외 없이 끝남"
+            except RuntimeError:
+                pass
+            assert len(db.get_materials_by_report(report_id)) == 50, "실패한 적재의 일부 블록이 남음"
+            assert db.get_report_by_rcept_no(info["rcept_no"])["status"] == "Raw_Loaded"
+
+            db.cursor.execute('DELETE FROM "Analysis_Reports" WHERE id = %s', (report_id,))
+            print("✅ 보고서 적재 트랜잭션 테스트 통과")
+            return True
+    except Exception as e:
+        print(f"❌ 보고서 적재 트랜잭션 테스트 실패: {e}")
+        return False
+
+
+def test_vector_index():
+    """벡터 인덱스 생성 / 재생성 / 제거 테스트 (CONCURRENTLY)"""
+    print("\n" + "=" * 80)
+    print("🧪 벡터 인덱스 관리 테스트")
+    print("=" * 80)
+
+    name = "idx_test_vector_index"
+    try:
+        with DBManager() as db:
+            db.init_db()
+            index = db.create_vector_index(method="hnsw", m=8, ef_construction=32, name=name)
+            assert index['method'] == "hnsw" and index['valid'] and index['build_sec'] >= 0
+            assert db.create_vector_index(method="hnsw", name=name)['name'] == name, "기존 인덱스를 다시 생성함"
+
+            index = db.rebuild_vector_index(method="ivfflat", lists=1, name=name)
+            assert db.get_vector_index(name)['method'] == "ivfflat"
+            assert db.get_vector_index(f"{name}_rebuild") is None, "재생성 임시 인덱스가 남음"
+
+            # 호출자의 트랜잭션이 진행 중이면 대신 커밋하지 않고 거부
+            db.cursor.execute('SELECT 1')
+            try:
+                db.drop_vector_index(name)
+                raise AssertionError("진행 중인 트랜잭션을 커밋하고 인덱스를 제거함")
+            except RuntimeError:
+                db.conn.rollback()
+
+            assert db.drop_vector_index(name) and db.get_vector_index(name) is None
+            print("✅ 벡터 인덱스 관리 테스트 통과")
+            return True
+    except Exception as e:
+        print(f"❌ 벡터 인덱스 관리 테스트 실패: {e}")
+        return False
+
+
+def test_search_similar():
+    """유사도 검색 테스트 (top-k 순서 / 필터 / 벡터 인덱스 사용)"""
+    print("\n" + "=" * 80)
+    print("🧪 유사도 검색 테스트")
+    print("=" * 80)
+
+    from config import EMBEDDING_CONFIG
+    dimension = EMBEDDING_CONFIG['dimension']
+
+    def unit_vector(axis, noise=0.0):
+        vector = [noise] * dimension
+        vector[axis] = 1.0
+        return vector
+
+    info = {"title": "검색 테스트 보고서", "rcept_no": "999999999996", "rcept_dt": "20250315"}
+    blocks = [
+        {"chunk_type": "table" if idx % 2 else "text",
+         "section_path": "II. 사업의 내용 > 매출" if idx < 5 else "III. 재무에 관한 사항",
+         "content": f"검색 블록 {idx}", "sequence_order": idx}
+        for idx in range(10)
+    ]
+
+    try:
+        with DBManager() as db:
+            db.init_db()
+            report_id, _ = db.ingest_report("검색테스트기업", "99999998", "999998", info, [blocks])
+            for material in db.get_materials_by_report(report_id):
+                db.cursor.execute('UPDATE "Source_Materials" SET embedding = %s::vector WHERE id = %s',
+                                  (vector_literal(unit_vector(material['sequence_order'], 0.01)), material['id']))
+            db.conn.commit()
+            db.create_vector_index()
+
+            hits = db.search_similar(unit_vector(3), k=3, report_id=report_id)
+            assert hits[0].sequence_order == 3 and len(hits) == 3
+            assert hits == sorted(hits, key=lambda hit: hit.distance)
+
+            hits = db.search_similar(unit_vector(3), k=5, report_id=report_id, chunk_type="text",
+                                     section_prefix="II. 사업의 내용")
+            assert {hit.sequence_order for hit in hits} == {0, 2, 4}, "필터가 적용되지 않음"
+
+            assert db.search_similar(unit_vector(3), k=5, company="999998", rcept_dt_from="20250101",
+                                     rcept_dt_to="20251231")
+            assert not db.search_similar(unit_vector(3), k=5, company="999998", rcept_dt_from="20260101")
+
+            # pgvector hnsw.ef_search 상한(1000)을 넘는 k는 쿼리 전에 거부, ef_search는 상한으로 보정
+            try:
+                db.search_similar(unit_vector(3), k=HNSW_MAX_EF_SEARCH + 1)
+                raise AssertionError("상한을 넘는 k를 허용함")
+            except ValueError:
+                pass
+            assert db.search_similar(unit_vector(3), k=5, report_id=report_id, ef_search=5000)
+
+            # 검색은 호출자의 트랜잭션을 끝내지 않고, 검색용 SET LOCAL 설정은 되돌림
+            db.cursor.execute("SHOW hnsw.ef_search")
+            ef_search_before = db.cursor.fetchone()[0]
+            db.cursor.execute('UPDATE "Analysis_Reports" SET status = status WHERE id = %s', (report_id,))
+            assert db.search_similar(unit_vector(3), k=3, ef_search=500)
+            assert db.conn.info.transaction_status == extensions.TRANSACTION_STATUS_INTRANS, "호출자 트랜잭션이 종료됨"
+            db.cursor.execute("SHOW hnsw.ef_search")
+            assert db.cursor.fetchone()[0] == ef_search_before, "검색용 설정이 호출자 트랜잭션에 남음"
+
+            db.cursor.execute('DELETE FROM "Analysis_Reports" WHERE id = %s', (report_id,))
+            print(f"✅ 유사도 검색 테스트 통과")
+            return True
+    except Exception as e:
+        print(f"❌ 유사도 검색 테스트 실패: {e}")
+        return False
+
+
 def test_reset():
     """DB 초기화 테스트 (주의: 모든 데이터 삭제)"""
     print("\n" + "=" * 80)
@@ -177,6 +486,9 @@ def run_all_tests(include_reset=False, include_crud=False):
 
     results = []
 
+    # 0. 커넥션 풀 (DB 불필요)
+    results.append(("커넥션 풀", test_connection_pool()))
+
     # 1. 연결 테스트
     results.append(("DB 연결", test_connection()))
 
@@ -189,6 +501,10 @@ def run_all_tests(include_reset=False, include_crud=False):
     # 4. CRUD 테스트 (옵션)
     if include_crud:
         results.append(("CRUD 기능", test_crud()))
+        results.append(("블록 일괄 저장", test_batch_insert()))
+        results.append(("보고서 적재 트랜잭션", test_ingest_report()))
+        results.append(("벡터 인덱스 관리", test_vector_index()))
+        results.append(("유사도 검색", test_search_similar()))
 
     # 5. 초기화 테스트 (옵션)
     if include_reset:
@@ -17,7 +17,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
+from types import SimpleNamespace
+
+import src.core.pipeline as pipeline_module
 from src.core.pipeline import DataPipeline
+from src.core.dart_agent import ReportFetchError
 from src.core.db_manager import DBManager
 
 
@@ -37,6 +41,104 @@ def test_pipeline_initialization():
         return None
 
 
+def test_loaded_report_filter():
+    """적재 완료 보고서 사전 필터 테스트 (후보 접수번호 전체를 쿼리 1회로 확인, DB 불필요)"""
+    queries = []
+
+    class LoadedReportsDB:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get_loaded_rcept_nos(self, rcept_nos):
+            queries.append(list(rcept_nos))
+            return {"20240312000001", "20240312000003"}
+
+    candidates = [
+        (SimpleNamespace(corp_name=f"기업{idx}"), SimpleNamespace(rcept_no=f"2024031200000{idx}"))
+        for idx in range(1, 5)
+    ]
+    pipeline = DataPipeline.__new__(DataPipeline)
+    original = pipeline_module.DBManager
+    pipeline_module.DBManager = LoadedReportsDB
+    try:
+        remaining = pipeline._exclude_loaded_reports(candidates)
+    finally:
+        pipeline_module.DBManager = original
+
+    assert len(queries) == 1 and len(queries[0]) == 4, "후보 접수번호를 한 번에 조회하지 않음"
+    assert [report.rcept_no for _, report in remaining] == ["20240312000002", "20240312000004"]
+    return True
+
+
+def test_spooled_ingest():
+    """보고서 블록 스풀 적재 테스트 (수집 완료 후 연결 대여, 페이지 실패 시 적재 안 함, DB 불필요)"""
+    events = []
+    ingested = []
+    fail_at = None
+    pages = [
+        [{"chunk_type": "text", "content": f"{page}쪽 본문", "sequence_order": page * 2},
+         {"chunk_type": "table", "content": "| 구분 |", "sequence_order": page * 2 + 1,
+          "table_cells": [(0, 1, "매출액", "제55기", "1,234", 1234, "원", 10 ** 6)]}]
+        for page in range(3)
+    ]
+
+    class FakeAgent:
+        def get_report(self, report_info, **meta):
+            return SimpleNamespace(rcept_no="20240312000001", report_nm="사업보고서")
+
+        def get_report_info(self, report):
+            return {"title": report.report_nm, "rcept_no": report.rcept_no}
+
+        def iter_target_section_blocks(self, report, strict=False):
+            assert strict, "적재용 블록 스트림이 strict 모드가 아님"
+            for idx, blocks in enumerate(pages):
+                if idx == fail_at:
+                    raise ReportFetchError("페이지 수집/파싱 실패: II. 사업의 내용")
+                events.append("page")
+                yield "II. 사업의 내용", blocks
+
+    class SpoolDB:
+        def __enter__(self):
+            events.append("lease")
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def ingest_report(self, name, corp_code, stock_code, info, block_pages):
+            for blocks in block_pages:
+                ingested.append(blocks)
+            return 1, sum(len(blocks) for blocks in ingested)
+
+    pipeline = DataPipeline.__new__(DataPipeline)
+    pipeline.agent = FakeAgent()
+    corp = SimpleNamespace(corp_name="테스트기업", corp_code="00000001", stock_code="000001")
+    original = pipeline_module.DBManager
+    pipeline_module.DBManager = SpoolDB
+    try:
+        assert pipeline._process_single_corp_with_report(corp, "20240312000001") is True
+    finally:
+        pipeline_module.DBManager = original
+
+    assert events == ["page", "page", "page", "lease"], f"수집 중에 DB 연결을 대여함: {events}"
+    assert ingested == pages, "스풀에서 읽은 블록이 원본과 다름"
+
+    # 페이지 수집/파싱 실패 시 일부 블록만 적재하지 않고 실패로 처리 (재시도 대상)
+    events.clear()
+    ingested.clear()
+    fail_at = 1
+    pipeline_module.DBManager = SpoolDB
+    try:
+        assert pipeline._process_single_corp_with_report(corp, "20240312000001") is False
+    finally:
+        pipeline_module.DBManager = original
+    assert events == ["page"] and not ingested, "실패한 보고서를 적재함"
+    return True
+
+
 def test_single_company(stock_code="005930", reset_db=True):
     """단일 기업 테스트"""
     print("\n" + "=" * 80)
@@ -208,6 +310,10 @@ def run_all_tests(reset_db=True):
 
     results = []
 
+    # 0. 적재 완료 보고서 사전 필터 (DB 불필요)
+    results.append(("적재 완료 보고서 필터", test_loaded_report_filter()))
+    results.append(("보고서 블록 스풀 적재", test_spooled_ingest()))
+
     # 1. 초기화 테스트
     print("\n[1/3] 초기화 테스트")
     pipeline = test_pipeline_initialization()